@@ -2,6 +2,7 @@ import streamlit as st
 import pandas as pd
 import os
 import sys
+import uuid
 from dotenv import load_dotenv
 import hydra
 from hydra import compose, initialize
@@ -10,11 +11,19 @@ from omegaconf import DictConfig
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from src.data.manager import DataManager
-from src.analysis.technical import TechnicalAnalyzer
 from src.analysis.sentiment import SentimentAnalyzer
-from src.analysis.fundamental import FundamentalAnalyzer
 from src.agent.quant_agent import QuantAgent
+from src.pipeline.executor import AnalysisPipeline, collect_summaries, run_analyzers
+from src.agent.llm_cache import LLMCache
+from src.agent.llm_client import LLMClient
+from src.data.connection import ConnectionPool
+from src.data.reader import MarketReader
+from src.data.snapshot import SnapshotStore
+from src.data.hot_cache import HotCache
+from src.data.refresh import freshness, read_status, request_refresh
+from src.utils.ticker_resolver import resolver_from_config
+from src.utils import tracing
+from src.utils.downsample import downsample_series
 
 load_dotenv()
 
@@ -36,33 +45,160 @@ def get_config():
     cfg = compose(config_name="config", overrides=["database.path=data/trading_data.duckdb"])
     return cfg
 
-def parse_ticker(user_input):
-    """자연어 -> 티커 변환"""
-    user_input = user_input.lower().strip()
-    ticker_map = {
-        "AAPL": ["애플", "apple", "아이폰", "맥북"],
-        "TSLA": ["테슬라", "tesla", "일론", "머스크"],
-        "GOOGL": ["구글", "google", "알파벳", "유튜브"],
-        "META": ["메타", "meta", "페이스북", "인스타"]
-    }
-    for ticker, keywords in ticker_map.items():
-        for kw in keywords:
-            if kw in user_input:
-                return ticker
-    return user_input.upper()
+def get_db_path(cfg):
+    db_path = cfg.database.path
+    if not os.path.isabs(db_path):
+        db_path = os.path.join(os.getcwd(), db_path)
+    return db_path
+
+@st.cache_resource
+def get_llm_cache():
+    """세션 간에 공유되는 LLM 응답 캐시 (llm_cache.enabled=false면 None)"""
+    return LLMCache.from_config(get_config(), os.getcwd())
+
+@st.cache_resource
+def get_llm():
+    """프로세스 전체가 공유하는 ollama 클라이언트. keep_alive 동안 모델이 메모리에 상주합니다."""
+    return LLMClient.from_config(get_config(), get_llm_cache())
+
+@st.cache_resource
+def get_db_pool():
+    """읽기 전용 DuckDB 연결 풀 (세션별 cursor 발급, database.pool_idle_minutes 동안 안 쓴 세션은 정리)"""
+    cfg = get_config()
+    return ConnectionPool(get_db_path(cfg), read_only=True, idle_seconds=60 * cfg.database.pool_idle_minutes)
+
+@st.cache_resource
+def get_hot_cache():
+    """세션 간에 공유되는 종목별 가격/뉴스/재무 메모리 캐시 (hot_cache.enabled=false면 None)"""
+    cfg = get_config()
+    return HotCache.from_config(cfg, get_db_path(cfg))
+
+@st.cache_resource
+def init_tracing():
+    """Streamlit은 Hydra 실행 폴더가 없으므로 outputs/app/<날짜>/trace.jsonl에 기록"""
+    from datetime import date
+    return tracing.configure_from_config(get_config(), os.path.join(os.getcwd(), "outputs", "app", date.today().isoformat()))
+
+def get_session_cursor():
+    if "session_id" not in st.session_state:
+        st.session_state.session_id = uuid.uuid4().hex
+    return get_db_pool().cursor(st.session_state.session_id)
+
+def get_reader():
+    """세션 cursor 위의 MarketReader. 세션끼리 락 없이 동시에 조회합니다."""
+    return tracing.instrument(
+        MarketReader.from_config(get_config(), get_session_cursor()),
+        ["get_price_data", "get_news", "get_financials", "get_bundle"], "db"
+    )
+
+def render_system_status(cfg):
+    """하드코딩된 상태 대신 ollama/DuckDB 헬스체크와 지연 시간을 표시"""
+    llm_health = get_llm().health()
+    if llm_health["ok"]:
+        st.success(f"Engine: Ollama ({cfg.api.ollama.model}) · {llm_health['ping_ms']:.0f}ms")
+    else:
+        st.error(f"Engine: Ollama 연결 실패 ({cfg.api.ollama.host})")
+    if llm_health["avg_seconds"] is not None:
+        st.caption(
+            f"LLM 평균 응답 {llm_health['avg_seconds']:.1f}s ({llm_health['calls']}회), "
+            f"프롬프트 평균 {llm_health['avg_prompt_tokens']:.0f}토큰"
+        )
+
+    try:
+        db_health = get_db_pool().health()
+    except Exception as e:
+        db_health = {"ok": False, "error": str(e)}
+    if db_health["ok"]:
+        st.success(f"DB: DuckDB (Local) · {db_health['query_ms']:.1f}ms, 세션 {db_health['sessions']}")
+    else:
+        st.error("DB: DuckDB 연결 실패")
+
+    cache = get_llm_cache()
+    if cache is not None:
+        stats = cache.stats()
+        st.caption(f"LLM 캐시: 적중 {stats['hits']} / 미스 {stats['misses']}")
+
+    hot = get_hot_cache()
+    if hot is not None:
+        stats = hot.stats()
+        st.caption(f"데이터 캐시: {stats['entries']}개 ({stats['mb']:.1f}MB), 적중 {stats['hits']} / 미스 {stats['misses']}")
+
+def render_comparison(cfg, symbols, message_placeholder):
+    """여러 종목 비교 리포트 (LLM 호출 1회)"""
+    with st.status(f"🔍 {', '.join(symbols)} 비교 분석 중...", expanded=True) as status:
+        try:
+            db = get_reader()
+            llm = get_llm()
+            sentiment = SentimentAnalyzer.from_config(cfg, llm, get_session_cursor(), read_only=True)
+            snapshots = SnapshotStore(get_session_cursor(), read_only=True) if cfg.snapshot.enabled else None
+
+            status.write("🧠 종목별 요약 수집 중 (스냅샷 우선)...")
+            summaries, missing = collect_summaries(cfg, db, sentiment, snapshots, symbols)
+            if missing:
+                status.write(f"⚠️ 데이터 없음: {', '.join(missing)}")
+            if not summaries:
+                status.update(label="데이터 없음!", state="error")
+                st.error("❌ 비교할 종목의 데이터가 없습니다. 먼저 데이터 수집 스크립트를 실행해주세요.")
+                return
+
+            status.write("🤖 LLM 비교 리포트 생성 중...")
+            agent = QuantAgent.from_config(cfg, llm)
+            header = f"### 📊 {' vs '.join(summaries)} 비교 분석 리포트\n\n"
+            report = ""
+            for chunk in agent.stream_comparison(summaries, cfg.comparison.token_budget):
+                report += chunk
+                message_placeholder.markdown(header + report + "▌")
+            message_placeholder.markdown(header + report)
+            status.update(label="분석 완료!", state="complete", expanded=False)
+
+            with st.expander("🔎 종목별 요약 보기"):
+                for symbol, summary in summaries.items():
+                    st.markdown(f"**{symbol}**")
+                    st.json(summary)
+
+            st.session_state.messages.append({"role": "assistant", "content": report})
+
+        except Exception as e:
+            import traceback
+            st.error(f"에러 발생: {e}")
+            st.text(traceback.format_exc())
+            status.update(label="시스템 에러", state="error")
+
+def render_freshness(cfg):
+    """새로고침 데몬의 마지막 실행 결과와 종목별 데이터 최신 시점"""
+    db_path = get_db_path(cfg)
+    st.write("**Data Freshness**")
+    status = read_status(db_path)
+    if status:
+        icon = "✅" if status.get("swapped") else "⚠️"
+        st.caption(f"{icon} 마지막 새로고침 {status['last_run']} · 변경 {status['changed']}건 · 실패 {status['failed']}건")
+    else:
+        st.caption("새로고침 기록 없음 ('python scripts/refresh_daemon.py' 실행)")
+
+    try:
+        rows = freshness(get_session_cursor())
+    except Exception:
+        # DB 파일이 아직 없는 경우 등. 시스템 상태 패널에 DB 연결 실패가 이미 표시됩니다.
+        rows = []
+    if rows:
+        st.dataframe(pd.DataFrame(rows, columns=["종목", "데이터", "최신 시점", "수집 시각"]),
+                     hide_index=True, use_container_width=True)
+
+    if st.button("지금 새로고침 요청"):
+        request_refresh(db_path)
+        st.info("데몬에 새로고침을 요청했습니다. 실행 중인 데몬이 곧 수집을 시작합니다.")
 
 def main():
+    init_tracing()
     with st.sidebar:
         st.title("🤖 Quant Agent v2")
         st.markdown("---")
         st.write("**System Status**")
-        st.success("Engine: Ollama (Gemma2:2b)")
-        st.success("DB: DuckDB (Local)")
+        render_system_status(get_config())
         st.markdown("---")
-        st.info("지원 종목: AAPL, TSLA, GOOGL, META")
+        st.info("지원 종목: AAPL, TSLA, GOOGL, META (별칭 목록: config/tickers/aliases.csv)")
         
-        if st.button("데이터 새로고침 (Setup Data)"):
-            st.warning("터미널에서 'python scripts/setup_data.py'를 실행해주세요.")
+        render_freshness(get_config())
 
     st.title("📈 퀀트 기반 기업 분석 에이전트")
     st.caption("Technical + Sentiment + Fundamental Analysis powered by Local LLM")
@@ -82,22 +218,25 @@ def main():
         with st.chat_message("assistant"):
             message_placeholder = st.empty()
             
-            symbol = parse_ticker(prompt)
+            resolver = resolver_from_config(get_config(), os.path.dirname(os.path.abspath(__file__)))
+            symbol = resolver.resolve(prompt)
+            symbols = resolver.resolve_all(prompt)[:get_config().comparison.max_symbols]
+            if len(symbols) > 1:
+                render_comparison(get_config(), symbols, message_placeholder)
+                return
             
             with st.status(f"🔍 '{symbol}' 데이터 분석 중...", expanded=True) as status:
                 try:
                     cfg = get_config()
-                    
-                    db_path = cfg.database.path
-                    if not os.path.isabs(db_path):
-                        db_path = os.path.join(os.getcwd(), db_path)
-                    
-                    db = DataManager(db_path)
+                    db = get_reader()
                     
                     status.write("📥 데이터베이스 조회 중...")
-                    price_df = db.get_price_data(symbol)
-                    news_list = db.get_news(symbol)
-                    fin_data = db.get_financials(symbol)
+                    hot = get_hot_cache()
+                    if hot is not None:
+                        # 최근에 조회한 종목이면 DuckDB를 건너뜀 (수집으로 DB 파일이 바뀌면 자동 무효화)
+                        price_df, news_list, fin_data = hot.bundle(symbol, db.get_bundle)
+                    else:
+                        price_df, news_list, fin_data = db.get_bundle(symbol)
                     
                     if price_df.empty:
                         status.update(label="데이터 없음!", state="error")
@@ -105,25 +244,39 @@ def main():
                         st.stop()
 
                     status.write("📊 차트 및 지표 생성 중...")
-                    st.line_chart(price_df.set_index("date")["close"], color="#00FF00")
+                    # 전체 봉 대신 화면 해상도 수준으로 줄인 점만 브라우저로 보냄
+                    chart = downsample_series(price_df.set_index("date")["close"], cfg.chart.max_points)
+                    st.line_chart(chart, color="#00FF00")
                     
-                    status.write("🧠 3-Way 분석 파이프라인 가동...")
-                    tech_res = TechnicalAnalyzer().analyze(price_df)
-                    senti_res = SentimentAnalyzer(cfg.api.ollama.model).analyze(news_list)
-                    fund_res = FundamentalAnalyzer().analyze(fin_data)
+                    llm = get_llm()
+                    sentiment = SentimentAnalyzer.from_config(cfg, llm, get_session_cursor(), read_only=True)
+                    snapshot = None
+                    if cfg.snapshot.enabled:
+                        snapshot = SnapshotStore(get_session_cursor(), read_only=True).get(symbol)
+
+                    if snapshot is not None:
+                        status.write(f"⚡ 사전 계산된 분석 스냅샷 사용 ({snapshot['computed_at']:%Y-%m-%d %H:%M})")
+                        tech_res, fund_res = snapshot["tech"], snapshot["fund"]
+                        senti_res = snapshot["senti"] or sentiment.analyze(news_list, symbol)
+                    else:
+                        status.write("🧠 3-Way 분석 파이프라인 가동...")
+                        tech_res, senti_res, fund_res, stages = run_analyzers(
+                            cfg, sentiment, symbol, price_df, news_list, fin_data
+                        )
+                        status.write(f"⏱️ {AnalysisPipeline.format_timings(stages)}")
                     
                     status.write("🤖 LLM 리포트 생성 중...")
-                    agent = QuantAgent(cfg.api.ollama.model)
-                    
-                    tech_summary = tech_res.get('summary_text', str(tech_res))
+                    agent = QuantAgent.from_config(cfg, llm)
                     
-                    report = agent.generate_report(symbol, tech_summary, senti_res, fund_res)
+                    header = f"### 📊 {symbol} 투자 분석 리포트\n\n"
+                    report = ""
+                    for chunk in agent.stream_report(symbol, tech_res, senti_res, fund_res):
+                        report += chunk
+                        message_placeholder.markdown(header + report + "▌")
+                    message_placeholder.markdown(header + report)
                     
                     status.update(label="분석 완료!", state="complete", expanded=False)
                     
-                    st.markdown(f"### 📊 {symbol} 투자 분석 리포트")
-                    st.markdown(report)
-                    
                     with st.expander("🔎 원본 데이터 및 세부 지표 보기"):
                         tab1, tab2, tab3 = st.tabs(["기술적 지표", "뉴스 요약", "재무제표"])
                         
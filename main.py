@@ -1,78 +1,204 @@
-import hydra
-from omegaconf import DictConfig
-from src.data.manager import DataManager
-from src.analysis.technical import TechnicalAnalyzer
-from src.analysis.sentiment import SentimentAnalyzer
-from src.analysis.fundamental import FundamentalAnalyzer
-from src.agent.quant_agent import QuantAgent
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import hydra
+from hydra.core.hydra_config import HydraConfig
+from omegaconf import DictConfig
+from src.utils import tracing
+
+# pandas/duckdb/ollama/pandas_ta를 끌어오는 모듈은 실제로 쓰는 함수 안에서 import합니다.
+
 
-def parse_ticker_from_input(user_input: str) -> str:
+class QuerySession:
     """
-    사용자 입력(자연어)에서 티커를 추론하는 함수
+    질문 사이에 재사용하는 객체들 (별칭 인덱스, DuckDB 읽기 전용 풀, ollama 클라이언트와 캐시, 분석기).
+    worker 모드에서는 한 번만 만들어 두고 질문마다 시작 비용을 다시 내지 않습니다.
+    DB는 읽기 전용 풀의 cursor로 읽으므로 새로고침 데몬의 쓰기를 막지 않고,
+    데몬이 파일을 교체하면 다음 질문(refresh)부터 새 파일을 읽습니다.
     """
-    user_input = user_input.lower().strip()
-    
 
-    ticker_map = {
-        "AAPL": ["애플", "apple", "아이폰", "맥북","에플","appl"],
-        "TSLA": ["테슬라", "tesla", "일론", "머스크"],
-        "GOOGL": ["구글", "google", "알파벳", "유튜브"],
-        "META": ["메타", "meta", "페이스북", "인스타"]
-    }
-
-    for ticker, keywords in ticker_map.items():
-        for kw in keywords:
-            if kw in user_input:
-                return ticker
-    
+    def __init__(self, cfg, db_path, base_dir):
+        from src.data.connection import ConnectionPool, file_generation
+        from src.agent.quant_agent import QuantAgent
+        from src.agent.llm_cache import LLMCache
+        from src.agent.llm_client import LLMClient
+        from src.utils.ticker_resolver import resolver_from_config
 
-    return user_input.upper()
+        if file_generation(db_path) is None:
+            raise FileNotFoundError(f"DB 파일이 없습니다: {db_path} (scripts/setup_data.py로 먼저 데이터를 수집하세요)")
+        self.cfg = cfg
+        self.resolver = resolver_from_config(cfg, base_dir)
+        self.pool = ConnectionPool(db_path, read_only=True)
+        self.llm = LLMClient.from_config(cfg, LLMCache.from_config(cfg, base_dir))
+        self.agent = QuantAgent.from_config(cfg, self.llm)
+        self.refresh()
 
-@hydra.main(version_base=None, config_path="config", config_name="config")
-def main(cfg: DictConfig):
-    user_query = input("\n💬 분석하고 싶은 종목을 입력하세요 : ")
-    
+    def refresh(self):
+        """풀에서 cursor를 받아 reader/감성 분석기/스냅샷을 다시 묶습니다 (DB 파일이 교체됐으면 새 파일의 cursor)."""
+        from src.data.reader import MarketReader
+        from src.data.snapshot import SnapshotStore
+        from src.analysis.sentiment import SentimentAnalyzer
 
-    symbol = parse_ticker_from_input(user_query)
-    
+        cfg = self.cfg
+        cur = self.pool.cursor("worker")
+        self.db = tracing.instrument(
+            MarketReader.from_config(cfg, cur), ["get_price_data", "get_news", "get_financials", "get_bundle"], "db"
+        )
+        self.sentiment = SentimentAnalyzer.from_config(cfg, self.llm, cur, read_only=True)
+        self.snapshots = SnapshotStore(cur, read_only=True) if cfg.snapshot.enabled else None
 
+def compare_symbols(session, symbols):
+    """여러 종목이 언급되면 종목별 요약을 모아 비교 리포트를 LLM 한 번으로 생성합니다."""
+    from src.pipeline.executor import collect_summaries
 
-    db_path = cfg.database.path
-    if not os.path.isabs(db_path):
-        db_path = os.path.join(hydra.utils.get_original_cwd(), db_path)
-        
-    db = DataManager(db_path)
-    
-    price_df = db.get_price_data(symbol)
-    news_list = db.get_news(symbol)
-    fin_data = db.get_financials(symbol)
-    
-    if price_df.empty:
-        print(f"\n❌ '{symbol}'에 대한 데이터가 준비되지 않았습니다. 서비스에 불편을 드려 죄송합니다.")
-        print(f"   (지원 종목: AAPL, TSLA, GOOGL, META)")
+    cfg = session.cfg
+    print(f"🚀 {', '.join(symbols)} 비교 분석을 시작합니다...")
+    summaries, missing = collect_summaries(cfg, session.db, session.sentiment, session.snapshots, symbols)
+    if missing:
+        print(f"⚠️ 데이터가 없어 제외된 종목: {', '.join(missing)}")
+    if not summaries:
+        print("\n❌ 비교할 종목의 데이터가 준비되지 않았습니다.")
         return
 
-    print(f"🚀 {symbol} 데이터 분석을 시작합니다...")
+    print("\n" + "="*60)
+    print(f"📈 {' vs '.join(summaries)} 비교 분석 리포트")
+    print("="*60)
+    for chunk in session.agent.stream_comparison(summaries, cfg.comparison.token_budget):
+        print(chunk, end="", flush=True)
+    print()
+    print("="*60)
 
-    tech_res = TechnicalAnalyzer().analyze(price_df)
-    senti_res = SentimentAnalyzer(cfg.api.ollama.model).analyze(news_list)
-    fund_res = FundamentalAnalyzer().analyze(fin_data)
-    
-    agent = QuantAgent(cfg.api.ollama.model)
-    report = agent.generate_report(
-        symbol, 
-        tech_res.get('summary_text', str(tech_res)), 
-        senti_res, 
-        fund_res
-    )
+def analyze_query(session, user_query):
+    """입력 한 건을 분석해 리포트를 출력합니다. 종목이 여럿이면 비교 리포트를 만듭니다."""
+    from src.pipeline.executor import AnalysisPipeline, run_analyzers
+
+    session.refresh()
+    cfg, db, sentiment = session.cfg, session.db, session.sentiment
+    symbol = session.resolver.resolve(user_query)
+    symbols = session.resolver.resolve_all(user_query)[:cfg.comparison.max_symbols]
+
+    if len(symbols) > 1:
+        compare_symbols(session, symbols)
+        return
+
+    snapshot = session.snapshots.get(symbol) if session.snapshots is not None else None
+    if snapshot is not None:
+        print(f"⚡ {symbol} 사전 계산된 분석 스냅샷을 사용합니다 ({snapshot['computed_at']:%Y-%m-%d %H:%M})")
+        tech_res, fund_res = snapshot["tech"], snapshot["fund"]
+        senti_res = snapshot["senti"] or sentiment.analyze(db.get_news(symbol), symbol)
+    else:
+        price_df, news_list, fin_data = db.get_bundle(symbol)
+
+        if price_df.empty:
+            print(f"\n❌ '{symbol}'에 대한 데이터가 준비되지 않았습니다. 서비스에 불편을 드려 죄송합니다.")
+            print(f"   (지원 종목: AAPL, TSLA, GOOGL, META)")
+            return
+
+        print(f"🚀 {symbol} 데이터 분석을 시작합니다...")
+
+        tech_res, senti_res, fund_res, stages = run_analyzers(cfg, sentiment, symbol, price_df, news_list, fin_data)
+        print(f"⏱️ 분석 단계 소요 시간: {AnalysisPipeline.format_timings(stages)}")
     
     print("\n" + "="*60)
     print(f"📈 {symbol} 투자 분석 리포트")
     print("="*60)
-    print(report)
+    for chunk in session.agent.stream_report(
+        symbol, 
+        tech_res, 
+        senti_res, 
+        fund_res
+    ):
+        print(chunk, end="", flush=True)
+    print()
     print("="*60)
 
+def run_repl(session):
+    """stdin으로 질문을 계속 받습니다 (빈 줄은 무시, exit/quit 또는 EOF로 종료)."""
+    print("🟢 worker 준비 완료. 질문을 입력하세요 (종료: exit)")
+    while True:
+        try:
+            user_query = input("\n💬 분석하고 싶은 종목을 입력하세요 : ").strip()
+        except EOFError:
+            break
+        if user_query.lower() in ("exit", "quit"):
+            break
+        if user_query:
+            analyze_query(session, user_query)
+
+
+def serve(session, host, port):
+    """
+    로컬 TCP 소켓으로 질문을 받습니다. 한 연결에 질문 한 줄을 보내면 리포트를 스트리밍으로 돌려주고 닫습니다.
+    DB cursor와 모델을 공유하므로 요청은 한 번에 하나씩 처리합니다. (클라이언트: scripts/ask.py)
+    """
+    import io
+    import socketserver
+    from contextlib import redirect_stdout
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            user_query = self.rfile.readline().decode("utf-8").strip()
+            if not user_query:
+                return
+            out = io.TextIOWrapper(self.wfile, encoding="utf-8", write_through=True)
+            try:
+                with redirect_stdout(out):
+                    try:
+                        analyze_query(session, user_query)
+                    except Exception as e:
+                        print(f"\n❌ 에러 발생: {e}")
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+            finally:
+                out.detach()
+
+    socketserver.TCPServer.allow_reuse_address = True
+    with socketserver.TCPServer((host, port), Handler) as server:
+        print(f"🟢 worker 대기 중: {host}:{port} (종료: Ctrl+C)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+@hydra.main(version_base=None, config_path="config", config_name="config")
+def main(cfg: DictConfig):
+    base_dir = hydra.utils.get_original_cwd()
+    db_path = cfg.database.path
+    if not os.path.isabs(db_path):
+        db_path = os.path.join(base_dir, db_path)
+
+    output_dir = HydraConfig.get().runtime.output_dir
+    tracing.configure_from_config(cfg, output_dir)
+
+    if cfg.batch.enabled:
+        from src.pipeline.batch import run_batch
+        with tracing.profile(output_dir, cfg.tracing.profile):
+            run_batch(cfg, db_path, output_dir, base_dir)
+        return
+
+    mode = cfg.worker.mode
+    if mode:
+        session = QuerySession(cfg, db_path, base_dir)
+        if cfg.worker.warmup:
+            session.llm.warmup()
+        with tracing.profile(output_dir, cfg.tracing.profile):
+            if mode == "repl":
+                run_repl(session)
+            elif mode == "socket":
+                serve(session, cfg.worker.host, cfg.worker.port)
+            else:
+                raise ValueError(f"알 수 없는 worker.mode: {mode} (repl | socket)")
+        return
+
+    # 사용자가 입력하는 동안 무거운 모듈 import와 DB/ollama 연결을 미리 준비
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending = pool.submit(QuerySession, cfg, db_path, base_dir)
+        user_query = input("\n💬 분석하고 싶은 종목을 입력하세요 : ")
+        session = pending.result()
+    with tracing.profile(output_dir, cfg.tracing.profile):
+        analyze_query(session, user_query)
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
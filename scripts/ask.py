@@ -0,0 +1,37 @@
+import argparse
+import socket
+import sys
+
+
+def main():
+    """
+    실행 중인 worker(python main.py worker.mode=socket)에 질문을 보내고 리포트를 그대로 출력합니다.
+    표준 라이브러리만 쓰므로 Hydra/pandas/ollama import 비용 없이 바로 실행됩니다.
+    """
+    parser = argparse.ArgumentParser(description="Quant Agent worker에 질문 보내기")
+    parser.add_argument("query", nargs="+", help="예: 테슬라 분석해줘")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    try:
+        conn = socket.create_connection((args.host, args.port))
+    except OSError as e:
+        print(f"❌ worker에 연결할 수 없습니다 ({args.host}:{args.port}): {e}")
+        print("   먼저 'python main.py worker.mode=socket'을 실행하세요.")
+        sys.exit(1)
+
+    with conn:
+        conn.sendall((" ".join(args.query) + "\n").encode("utf-8"))
+        conn.shutdown(socket.SHUT_WR)
+        out = sys.stdout.buffer
+        while True:
+            data = conn.recv(4096)
+            if not data:
+                break
+            out.write(data)
+            out.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+import sys
+import os
+import time
+import hydra
+from hydra.core.hydra_config import HydraConfig
+from omegaconf import DictConfig
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data.connection import get_connection
+from src.data.reader import MarketReader
+from src.analysis.backtest import load_close_matrix, summarize, sweep
+
+
+@hydra.main(version_base=None, config_path="../config", config_name="config")
+def main(cfg: DictConfig):
+    db_path = cfg.database.path
+    if not os.path.isabs(db_path):
+        db_path = os.path.join(hydra.utils.get_original_cwd(), db_path)
+
+    bt = cfg.backtest
+    close = load_close_matrix(MarketReader(get_connection(db_path, read_only=True), cfg.reader.price_table), list(cfg.symbols))
+    if close.empty:
+        print("❌ 저장된 주가 데이터가 없습니다. scripts/setup_data.py를 먼저 실행하세요.")
+        return
+    print(f"📊 {close.shape[1]}개 종목 × {close.shape[0]}개 봉 백테스트 시작...")
+
+    start = time.perf_counter()
+    results = sweep(
+        close,
+        rules=list(bt.rules),
+        sma_lengths=list(bt.sma_lengths),
+        rsi_lengths=list(bt.rsi_lengths),
+        rsi_lows=list(bt.rsi_lows),
+        rsi_highs=list(bt.rsi_highs),
+        cost_bps=bt.cost_bps,
+        workers=bt.workers,
+    )
+    elapsed = time.perf_counter() - start
+    summary = summarize(results)
+
+    output_dir = HydraConfig.get().runtime.output_dir
+    results.to_csv(os.path.join(output_dir, "backtest_results.csv"), index=False)
+    summary.to_csv(os.path.join(output_dir, "backtest_summary.csv"), index=False)
+
+    print(f"✅ {len(summary)}개 파라미터 조합 완료 ({elapsed:.1f}s)\n")
+    print(summary.head(bt.top_n).to_string(index=False, float_format=lambda v: f"{v:.4f}"))
+    print(f"\n📂 결과 저장: {output_dir}")
+
+if __name__ == "__main__":
+    main()
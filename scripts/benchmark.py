@@ -0,0 +1,183 @@
+import sys
+import os
+import json
+import time
+import platform
+import statistics
+import subprocess
+import tempfile
+from datetime import date, timedelta
+
+import hydra
+import pandas as pd
+from hydra.core.hydra_config import HydraConfig
+from omegaconf import DictConfig, open_dict
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data.connection import get_connection
+from src.data.fundamentals import FundamentalsEngine
+from src.data.reader import MarketReader
+from src.data.ingest import run_ingestion
+from src.data.writer import TableWriter
+from src.analysis.technical import TechnicalAnalyzer
+from src.analysis.fundamental import FundamentalAnalyzer
+from src.analysis.sentiment import SentimentAnalyzer
+from src.agent.llm_client import LLMClient
+from src.agent.quant_agent import QuantAgent
+from src.pipeline.executor import run_analyzers
+from src.utils.stub_ollama import StubOllamaServer
+from src.utils.synthetic import SyntheticFMPFetcher, SyntheticPolygonFetcher, synthetic_symbols
+
+
+def _timeit(fn, repeat: int) -> list:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def _git_revision(cwd):
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=cwd, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _prepare_config(cfg, symbols, stub_url):
+    """합성 종목/기간, 스텁 ollama 주소로 바꾸고 API 호출 제한과 LLM 캐시는 끕니다."""
+    bench = cfg.benchmark
+    end = date.today()
+    with open_dict(cfg):
+        cfg.symbols = symbols
+        cfg.date_range.start = (end - timedelta(days=365 * bench.years)).isoformat()
+        cfg.date_range.end = end.isoformat()
+        cfg.ingestion.mode = "full"
+        cfg.ingestion.backoff_base = 0.0
+        cfg.api.polygon.news.limit_per_minute = 10 ** 9
+        cfg.api.fmp.limit_per_minute = 10 ** 9
+        cfg.api.ollama.host = stub_url
+        cfg.llm_cache.enabled = False
+
+
+def run_benchmarks(cfg, db_path) -> dict:
+    bench = cfg.benchmark
+    repeat = bench.repeat
+    symbols = list(cfg.symbols)
+    results = {}
+
+    def record(name, times):
+        results[name] = {"median_s": statistics.median(times), "min_s": min(times), "runs": len(times)}
+        print(f"  ⏱️ {name}: {results[name]['median_s']:.3f}s (min {results[name]['min_s']:.3f}s, {len(times)}회)")
+
+    poly = SyntheticPolygonFetcher(bench.seed, bench.news_per_symbol)
+    fmp = SyntheticFMPFetcher(bench.seed, bench.quarters)
+    conn = get_connection(db_path)
+    writer = TableWriter(conn, cfg.reader.price_table, cfg.reader.news_table)
+    record("ingestion", _timeit(lambda: run_ingestion(cfg, db_path, poly, fmp, writer), 1))
+
+    db = MarketReader.from_config(cfg, conn)
+
+    def read_all():
+        for symbol in symbols:
+            db.get_price_data(symbol)
+            db.get_news(symbol)
+            db.get_financials(symbol)
+    record("db_reads", _timeit(read_all, repeat))
+    record("db_bundle", _timeit(lambda: [db.get_bundle(s) for s in symbols], repeat))
+
+    prices = {s: db.get_price_data(s) for s in symbols}
+    financials = {s: db.get_financials(s) for s in symbols}
+    news = {s: db.get_news(s) for s in symbols}
+
+    technical = TechnicalAnalyzer()
+    record("technical.analyze", _timeit(lambda: [technical.analyze(prices[s]) for s in symbols], repeat))
+    panel = pd.concat([df[["date", "close"]].assign(symbol=s) for s, df in prices.items()], ignore_index=True)
+    record("technical.analyze_panel", _timeit(lambda: technical.analyze_panel(panel), repeat))
+
+    fundamental = FundamentalAnalyzer()
+    record("fundamental.analyze", _timeit(lambda: [fundamental.analyze(financials[s]) for s in symbols], repeat))
+    record("fundamental.screen", _timeit(lambda: FundamentalsEngine(conn).screen(symbols), repeat))
+
+    llm = LLMClient.from_config(cfg)
+    sentiment = SentimentAnalyzer.from_config(cfg, llm, conn)
+    agent = QuantAgent.from_config(cfg, llm)
+    report_symbols = symbols[:bench.report_symbols]
+
+    def end_to_end():
+        for s in report_symbols:
+            tech, senti, fund, _ = run_analyzers(cfg, sentiment, s, prices[s], news[s], financials[s])
+            agent.generate_report(s, tech, senti, fund)
+    record("report.end_to_end", _timeit(end_to_end, repeat))
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """기준 결과 대비 중앙값이 (1 + tolerance)배를 넘게 느려진 항목 목록"""
+    regressions = []
+    print(f"\n📊 기준 결과 대비 (허용 +{tolerance:.0%})")
+    for name, cur in results.items():
+        base = baseline.get("results", {}).get(name)
+        if not base:
+            print(f"  ➖ {name}: 기준 없음")
+            continue
+        ratio = cur["median_s"] / base["median_s"] if base["median_s"] else float("inf")
+        slow = ratio > 1 + tolerance
+        print(f"  {'❌' if slow else '✅'} {name}: {base['median_s']:.3f}s → {cur['median_s']:.3f}s ({ratio:.2f}x)")
+        if slow:
+            regressions.append(name)
+    return regressions
+
+
+@hydra.main(version_base=None, config_path="../config", config_name="config")
+def main(cfg: DictConfig):
+    bench = cfg.benchmark
+    base_dir = hydra.utils.get_original_cwd()
+    symbols = synthetic_symbols(bench.symbols)
+
+    print(f"🧪 벤치마크: {bench.symbols}개 종목 × {bench.years}년, 뉴스 {bench.news_per_symbol}건/종목, "
+          f"LLM 스텁 지연 {bench.llm.latency_ms}ms + 토큰당 {bench.llm.token_delay_ms}ms")
+
+    with StubOllamaServer(bench.llm.latency_ms, bench.llm.token_delay_ms, bench.llm.response_tokens,
+                          models=[cfg.api.ollama.model]) as stub, \
+            tempfile.TemporaryDirectory() as tmp:
+        _prepare_config(cfg, symbols, stub.url)
+        results = run_benchmarks(cfg, os.path.join(tmp, "bench.duckdb"))
+        llm_requests = stub.requests
+
+    output = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "git": _git_revision(base_dir),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "scale": {
+                "symbols": bench.symbols, "years": bench.years,
+                "news_per_symbol": bench.news_per_symbol, "quarters": bench.quarters,
+            },
+            "llm": dict(bench.llm),
+            "llm_requests": llm_requests,
+        },
+        "results": results,
+    }
+    path = os.path.join(HydraConfig.get().runtime.output_dir, "benchmark.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(output, f, ensure_ascii=False, indent=2)
+    print(f"\n📂 결과 저장: {path}")
+
+    if bench.baseline:
+        baseline_path = bench.baseline if os.path.isabs(bench.baseline) else os.path.join(base_dir, bench.baseline)
+        with open(baseline_path, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("meta", {}).get("scale") != output["meta"]["scale"]:
+            print("⚠️ 기준 결과와 데이터 규모가 달라 비교가 정확하지 않을 수 있습니다.")
+        regressions = compare(results, baseline, bench.tolerance)
+        if regressions:
+            print(f"\n❌ 성능 회귀: {', '.join(regressions)}")
+            sys.exit(1)
+        print("\n✅ 성능 회귀 없음")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+import sys
+import os
+import hydra
+from omegaconf import DictConfig
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data.connection import get_connection
+from src.data.chunked import stream_indicators
+from src.analysis.incremental import IncrementalTechnicals
+
+try:
+    import resource  # Unix 전용 (Windows에는 없음)
+except ImportError:
+    resource = None
+
+
+@hydra.main(version_base=None, config_path="../config", config_name="config")
+def main(cfg: DictConfig):
+    db_path = cfg.database.path
+    if not os.path.isabs(db_path):
+        db_path = os.path.join(hydra.utils.get_original_cwd(), db_path)
+
+    chunked = cfg.chunked
+    conn = get_connection(db_path)
+    print(f"📊 '{chunked.price_table}' 테이블을 {chunked.batch_rows}행 단위로 읽어 지표를 계산합니다...")
+
+    results = stream_indicators(
+        conn, IncrementalTechnicals(conn), chunked.price_table,
+        batch_rows=chunked.batch_rows, rebuild=chunked.rebuild
+    )
+    for symbol, res in sorted(results.items()):
+        print(f"  {symbol}: {res.get('summary_text', res.get('summary'))}")
+
+    if resource is None:
+        print(f"✅ {len(results)}개 종목 갱신 완료")
+        return
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"✅ {len(results)}개 종목 갱신 완료 (최대 메모리 {peak_mb:.0f}MB)")
+
+if __name__ == "__main__":
+    main()
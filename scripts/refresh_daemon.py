@@ -0,0 +1,26 @@
+import sys
+import os
+import hydra
+from omegaconf import DictConfig
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data.refresh import run_daemon
+
+
+@hydra.main(version_base=None, config_path="../config", config_name="config")
+def main(cfg: DictConfig):
+    db_path = cfg.database.path
+    if not os.path.isabs(db_path):
+        db_path = os.path.join(hydra.utils.get_original_cwd(), db_path)
+
+    r = cfg.refresh
+    print(f"🔄 새로고침 데몬 시작: 장중 {r.market_minutes}분 / 장외 {r.off_hours_minutes}분 간격 ({r.timezone})")
+    print(f"📂 데이터베이스 경로: {db_path}")
+    try:
+        run_daemon(cfg, db_path, once=r.once)
+    except KeyboardInterrupt:
+        print("\n👋 새로고침 데몬을 종료합니다.")
+
+if __name__ == "__main__":
+    main()
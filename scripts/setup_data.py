@@ -1,32 +1,29 @@
 import hydra
+from hydra.core.hydra_config import HydraConfig
 from omegaconf import DictConfig
-from src.data.manager import DataManager
-from src.data.fetcher import PolygonFetcher
-from src.data.fmp_fetcher import FMPFetcher
+from src.data.ingest import run_ingestion
+from src.utils import tracing
 
 
 @hydra.main(version_base=None, config_path="../config", config_name="config")
 def main(cfg: DictConfig):
-    db = DataManager(cfg.database.path)
-    poly = PolygonFetcher(cfg)
-    fmp = FMPFetcher(cfg)
-    
-    for symbol in cfg.symbols:
-        print(f"Processing {symbol}...")
-        
-        # 1. Price
-        df = poly.fetch_prices(symbol, cfg.date_range.start, cfg.date_range.end)
-        db.save_prices(df, symbol)
-        
-        # 2. News
-        news = poly.fetch_news(symbol)
-        db.save_news(news, symbol)
-        
-        # 3. Financials
-        fin_data = fmp.fetch_all(symbol)
-        db.save_financials(symbol, fin_data)
-        
-    print("✅ 데이터 수집 및 저장 완료!")
+    print(f"Processing {len(cfg.symbols)} symbols (mode={cfg.ingestion.mode}, workers={cfg.ingestion.max_workers})...")
+
+    output_dir = HydraConfig.get().runtime.output_dir
+    tracing.configure_from_config(cfg, output_dir)
+    with tracing.profile(output_dir, cfg.tracing.profile):
+        report = run_ingestion(cfg, cfg.database.path)
+
+    for symbol, dataset, count, mark in sorted(report["changes"]):
+        if count:
+            print(f"  🆕 {symbol} {dataset}: +{count}건 (~ {mark})")
+        else:
+            print(f"  ✔️ {symbol} {dataset}: 변경 없음")
+    for symbol, dataset, error in report["failed"]:
+        print(f"  ❌ {symbol} {dataset}: {error}")
+    if "snapshots" in report:
+        print(f"  📸 분석 스냅샷 갱신: {report['snapshots']}개 종목")
+    print(f"✅ 데이터 수집 및 저장 완료! {report['ok']} ({report['elapsed']:.1f}s)")
 
 if __name__ == "__main__":
-    main()  
\ No newline at end of file
+    main()
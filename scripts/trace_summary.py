@@ -0,0 +1,114 @@
+import argparse
+import glob
+import json
+import math
+import os
+from collections import defaultdict
+
+
+def percentile(values, q):
+    """nearest-rank 백분위수"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def load_spans(paths):
+    spans = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    spans.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # 실행 도중 중단된 마지막 줄
+                    continue
+    return spans
+
+
+def summarize(spans):
+    """span 이름별 호출 수, 지연 백분위수, 에러 수, (LLM) 캐시 적중률과 토큰 처리 속도"""
+    groups = defaultdict(list)
+    for s in spans:
+        groups[s["name"]].append(s)
+
+    rows = []
+    for name, items in sorted(groups.items()):
+        elapsed = [s["elapsed_ms"] for s in items]
+        row = {
+            "name": name,
+            "count": len(items),
+            "p50_ms": percentile(elapsed, 50),
+            "p90_ms": percentile(elapsed, 90),
+            "p99_ms": percentile(elapsed, 99),
+            "max_ms": max(elapsed),
+            "errors": sum(1 for s in items if s.get("error")),
+        }
+        if any("cache_hit" in s for s in items):
+            row["cache_hit_rate"] = sum(1 for s in items if s.get("cache_hit")) / len(items)
+        tps = [s["tokens_per_sec"] for s in items if s.get("tokens_per_sec")]
+        if tps:
+            row["p50_tokens_per_sec"] = percentile(tps, 50)
+        prompt_tokens = [s["prompt_tokens"] for s in items if s.get("prompt_tokens")]
+        if prompt_tokens:
+            row["p50_prompt_tokens"] = percentile(prompt_tokens, 50)
+        prefill = [s["prefill_ms"] for s in items if s.get("prefill_ms")]
+        if prefill:
+            row["p50_prefill_ms"] = percentile(prefill, 50)
+        rows.append(row)
+    return rows
+
+
+def _fmt(value):
+    if value is None:
+        return "-"
+    if isinstance(value, float):
+        return f"{value:.1f}" if value >= 1 or value == 0 else f"{value:.2f}"
+    return str(value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="outputs/ 아래 trace.jsonl을 모아 구간별 지연 백분위수를 출력합니다.")
+    parser.add_argument("paths", nargs="*", help="trace.jsonl 파일 또는 디렉터리 (기본: outputs/)")
+    parser.add_argument("--name", help="이 접두사로 시작하는 span만 (예: llm., db.)")
+    parser.add_argument("--json", action="store_true", help="표 대신 JSON으로 출력")
+    args = parser.parse_args()
+
+    files = []
+    for path in args.paths or ["outputs"]:
+        if os.path.isdir(path):
+            files += glob.glob(os.path.join(path, "**", "trace.jsonl"), recursive=True)
+        elif os.path.exists(path):
+            files.append(path)
+    if not files:
+        print("⚠️ trace.jsonl 파일을 찾지 못했습니다.")
+        return
+
+    spans = load_spans(files)
+    if args.name:
+        spans = [s for s in spans if s["name"].startswith(args.name)]
+    rows = summarize(spans)
+
+    if args.json:
+        print(json.dumps(rows, ensure_ascii=False, indent=2))
+        return
+
+    runs = len({s.get("run") for s in spans})
+    print(f"📂 {len(files)}개 파일, {runs}개 실행, {len(spans)}개 span\n")
+    columns = ["name", "count", "p50_ms", "p90_ms", "p99_ms", "max_ms", "errors",
+               "cache_hit_rate", "p50_prompt_tokens", "p50_prefill_ms", "p50_tokens_per_sec"]
+    columns = [c for c in columns if any(c in r for r in rows)]
+    table = [[_fmt(r.get(c)) for c in columns] for r in rows]
+    widths = [max(len(c), *(len(t[i]) for t in table)) for i, c in enumerate(columns)]
+    print("  ".join(c.ljust(w) for c, w in zip(columns, widths)))
+    for t in table:
+        print("  ".join(v.ljust(w) for v, w in zip(t, widths)))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,56 +1,236 @@
 import sys
 import os
-import pandas as pd
+import json
+import glob
+import shutil
 import duckdb
 import hydra
 from omegaconf import DictConfig
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+MANIFEST = "_manifest.json"
+
+
+def _date_column(conn, table_name):
+    """파티션/증분 기준이 될 DATE·TIMESTAMP 컬럼 ('date' 우선)"""
+    cols = conn.execute(f'DESCRIBE "{table_name}"').fetchall()
+    candidates = [name for name, col_type, *_ in cols if col_type.startswith(("DATE", "TIMESTAMP"))]
+    if "date" in candidates:
+        return "date", [c[0] for c in cols]
+    return (candidates[0] if candidates else None), [c[0] for c in cols]
+
+
+def _load_manifest(output_dir):
+    path = os.path.join(output_dir, MANIFEST)
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _save_manifest(output_dir, manifest):
+    with open(os.path.join(output_dir, MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+
+def _table_ddl(conn, table_name):
+    """테이블 CREATE 문(기본 키 등 제약 포함)과 인덱스 CREATE 문"""
+    ddl = conn.execute(
+        "SELECT sql FROM duckdb_tables() WHERE schema_name = 'main' AND table_name = ?", [table_name]
+    ).fetchone()[0]
+    indexes = [row[0] for row in conn.execute(
+        "SELECT sql FROM duckdb_indexes() WHERE schema_name = 'main' AND table_name = ? AND sql IS NOT NULL",
+        [table_name]
+    ).fetchall()]
+    return ddl, indexes
+
+
+def _symbol_stats(conn, table_name, date_col, marks):
+    """종목별 (max 날짜, 전체 행 수, 이전 mark 이후 행 수)"""
+    rows = conn.execute(f"""
+        SELECT t.symbol, max(t."{date_col}"), count(*), count(*) FILTER (WHERE t."{date_col}" > m.mark)
+        FROM "{table_name}" t
+        LEFT JOIN (SELECT unnest(?::VARCHAR[]) AS symbol, unnest(?::TIMESTAMP[]) AS mark) m USING (symbol)
+        GROUP BY t.symbol
+    """, [list(marks), list(marks.values())]).fetchall()
+    return {symbol: (high_water, total, new) for symbol, high_water, total, new in rows}
+
+
+def _plan_append(conn, table_name, date_col, previous):
+    """
+    종목별 mark를 비교해 새 봉만 덧붙일 종목(append)과 파티션을 다시 쓸 종목(rewrite)을 고릅니다.
+    처음 보는 종목, mark보다 오래된 백필이 들어온 종목(행 수가 안 맞음)은 다시 씁니다.
+    """
+    marks = {symbol: p["high_water"] for symbol, p in previous.items() if p.get("high_water")}
+    stats = _symbol_stats(conn, table_name, date_col, marks)
+    append, rewrite = {}, []
+    for symbol, (_, total, new) in stats.items():
+        prev = previous.get(symbol)
+        if prev is None or symbol not in marks or prev["rows"] + new != total:
+            rewrite.append(symbol)
+        elif new:
+            append[symbol] = marks[symbol]
+    removed = [symbol for symbol in previous if symbol not in stats]
+    return stats, append, rewrite, removed
+
+
+def export_tables(conn, output_dir, compression, incremental, append_tables=("prices",)):
+    """
+    각 테이블을 DuckDB COPY로 직접 Parquet에 씁니다 (pandas 경유 없음).
+    symbol 컬럼과 날짜 컬럼(year/month)이 있으면 hive 파티션으로 나눕니다.
+    append_tables(행을 덧붙이기만 하는 테이블)는 incremental이면 종목별 mark 이후 행만 새 파일로 추가하고,
+    그 밖의 테이블(sync_state처럼 값이 바뀌는 상태 테이블, 키 없는 테이블)은 매번 전체 스냅샷으로 덮어씁니다.
+    가져오기에서 기본 키·인덱스를 그대로 만들 수 있도록 테이블 DDL을 manifest에 기록합니다.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = _load_manifest(output_dir)
+    tables = [row[0] for row in conn.execute("SHOW TABLES").fetchall()]
+    if not tables:
+        print("⚠️ 저장된 테이블이 없습니다.")
+        return
+
+    for table_name in tables:
+        print(f"Processing table: {table_name}...")
+        date_col, columns = _date_column(conn, table_name)
+        table_dir = os.path.join(output_dir, table_name)
+        previous = manifest.get(table_name, {})
+        ddl, indexes = _table_ddl(conn, table_name)
+        entry = {"ddl": ddl, "indexes": indexes, "date_column": date_col,
+                 "derived_columns": ["year", "month"] if date_col else []}
+
+        partitions = []
+        if "symbol" in columns:
+            partitions.append("symbol")
+        select = f'SELECT * FROM "{table_name}"'
+        if date_col:
+            partitions += ["year", "month"]
+            select = f'SELECT *, year("{date_col}") AS year, month("{date_col}") AS month FROM "{table_name}"'
+
+        appendable = table_name in append_tables and date_col and "symbol" in columns
+        options = ["FORMAT PARQUET", f"COMPRESSION {compression}"]
+        if partitions:
+            options.append(f"PARTITION_BY ({', '.join(partitions)})")
+
+        if appendable and incremental and "symbols" in previous:
+            stats, append, rewrite, removed = _plan_append(conn, table_name, date_col, previous["symbols"])
+            for symbol in rewrite + removed:
+                shutil.rmtree(os.path.join(table_dir, f"symbol={symbol}"), ignore_errors=True)
+            where, params = [], []
+            if rewrite:
+                where.append("symbol IN (SELECT unnest(?::VARCHAR[]))")
+                params.append(rewrite)
+            for symbol, mark in append.items():
+                where.append(f"(symbol = ? AND \"{date_col}\" > ?::TIMESTAMP)")
+                params += [symbol, mark]
+            if not where:
+                print("  ✔️ 새로 내보낼 행이 없습니다.")
+                mode = None
+            else:
+                select += f" WHERE {' OR '.join(where)}"
+                # 기존 파티션 파일은 건드리지 않고 새 파일만 추가
+                options += ["OVERWRITE_OR_IGNORE", "FILENAME_PATTERN 'part_{uuid}'"]
+                mode = f"증분: 추가 {len(append)}종목, 다시 쓰기 {len(rewrite)}종목"
+        else:
+            params = []
+            if appendable:
+                stats = _symbol_stats(conn, table_name, date_col, {})
+            mode = "전체"
+            if partitions:
+                options.append("OVERWRITE")
+            else:
+                os.makedirs(table_dir, exist_ok=True)
+
+        if mode:
+            count = conn.execute(f"SELECT count(*) FROM ({select})", params).fetchone()[0]
+            target = table_dir if partitions else os.path.join(table_dir, "data.parquet")
+            if partitions and count == 0 and mode == "전체":
+                shutil.rmtree(table_dir, ignore_errors=True)
+            elif count or not partitions:
+                conn.execute(f"COPY ({select}) TO '{target}' ({', '.join(options)})", params)
+            print(f"  ✅ {count} rows → {target} ({mode})")
+
+        if appendable:
+            entry["symbols"] = {
+                symbol: {"high_water": str(high_water) if high_water is not None else None, "rows": total}
+                for symbol, (high_water, total, _) in stats.items()
+            }
+        manifest[table_name] = entry
+
+    _save_manifest(output_dir, manifest)
+
+
+def import_tables(conn, input_dir, replace):
+    """
+    Parquet 스냅샷으로 빈 DB를 채웁니다 (Polygon/FMP 호출 없음).
+    없는 테이블은 manifest의 원래 DDL(기본 키 포함)로 만든 뒤 INSERT ... BY NAME으로 채우므로,
+    이후 수집의 ON CONFLICT / INSERT OR REPLACE가 그대로 동작합니다.
+    """
+    manifest = _load_manifest(input_dir)
+    table_dirs = sorted(d for d in glob.glob(os.path.join(input_dir, "*")) if os.path.isdir(d))
+    if not table_dirs:
+        print("⚠️ 가져올 Parquet 스냅샷이 없습니다.")
+        return
+
+    existing = {row[0] for row in conn.execute("SHOW TABLES").fetchall()}
+    for table_dir in table_dirs:
+        table_name = os.path.basename(table_dir)
+        entry = manifest.get(table_name, {})
+        if not glob.glob(os.path.join(table_dir, "**", "*.parquet"), recursive=True):
+            continue
+        derived = entry.get("derived_columns", [])
+        exclude = f" EXCLUDE ({', '.join(derived)})" if derived else ""
+        source = (
+            f"SELECT *{exclude} FROM read_parquet('{table_dir}/**/*.parquet', "
+            f"hive_partitioning = true, hive_types_autocast = false, union_by_name = true)"
+        )
+
+        if table_name in existing:
+            rows = conn.execute(f'SELECT count(*) FROM "{table_name}"').fetchone()[0]
+            if rows and not replace:
+                print(f"  ⚠️ {table_name}: 이미 {rows} rows가 있어 건너뜁니다. (export.replace=true로 덮어쓰기)")
+                continue
+            conn.execute(f'DELETE FROM "{table_name}"')
+        elif entry.get("ddl"):
+            conn.execute(entry["ddl"])
+            for index in entry.get("indexes", []):
+                conn.execute(index)
+        else:
+            # DDL이 없는 예전 스냅샷: 컬럼 타입만 Parquet에서 가져옴
+            conn.execute(f'CREATE TABLE "{table_name}" AS {source} LIMIT 0')
+        conn.execute(f'INSERT INTO "{table_name}" BY NAME {source}')
+
+        rows = conn.execute(f'SELECT count(*) FROM "{table_name}"').fetchone()[0]
+        print(f"  ✅ {table_name}: {rows} rows 적재")
+
+
 @hydra.main(version_base=None, config_path="../config", config_name="config")
 def main(cfg: DictConfig):
     db_path = cfg.database.path
     if not os.path.isabs(db_path):
         db_path = os.path.join(hydra.utils.get_original_cwd(), db_path)
-    
-    output_dir = os.path.join(os.path.dirname(db_path), "exports")
-    os.makedirs(output_dir, exist_ok=True)
-    
+
+    export_dir = cfg.export.dir or os.path.join(os.path.dirname(db_path), "exports", "parquet")
+    if not os.path.isabs(export_dir):
+        export_dir = os.path.join(hydra.utils.get_original_cwd(), export_dir)
+    os.makedirs(export_dir, exist_ok=True)
+
     print(f"📂 데이터베이스 경로: {db_path}")
-    print(f"📂 CSV 저장 경로: {output_dir}\n")
+    print(f"📂 Parquet 경로: {export_dir}\n")
+
+    if cfg.export.mode == "import":
+        conn = duckdb.connect(db_path)
+        import_tables(conn, export_dir, cfg.export.replace)
+        print("\n🎉 스냅샷 적재가 완료되었습니다!")
+        return
 
     if not os.path.exists(db_path):
         print("❌ 데이터베이스 파일이 없습니다. scripts/setup_data.py를 먼저 실행하세요.")
         return
 
-    conn = duckdb.connect(db_path)
-    
-    tables_df = conn.execute("SHOW TABLES").df()
-    if tables_df.empty:
-        print("⚠️ 저장된 테이블이 없습니다.")
-        return
-    
-    tables = tables_df['name'].tolist()
-    
-    for table_name in tables:
-        print(f"Processing table: {table_name}...")
-        
-        df = conn.execute(f"SELECT * FROM {table_name}").df()
-        
-        if df.empty:
-            print(f"  ⚠️ {table_name} 테이블이 비어있습니다.")
-            continue
-            
-        csv_path = os.path.join(output_dir, f"{table_name}.csv")
-        
-        df.to_csv(csv_path, index=False, encoding='utf-8-sig')
-        
-        print(f"  ✅ 저장 완료: {csv_path}")
-        print(f"  👀 데이터 미리보기 ({len(df)} rows):")
-        print(df.head(3))
-        print("-" * 30)
-
-    print("\n🎉 모든 변환 작업이 완료되었습니다! 'data/exports' 폴더를 확인해보세요.")
+    conn = duckdb.connect(db_path, read_only=True)
+    export_tables(conn, export_dir, cfg.export.compression, cfg.export.incremental, list(cfg.export.append_tables))
+    print(f"\n🎉 모든 변환 작업이 완료되었습니다! '{export_dir}' 폴더를 확인해보세요.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
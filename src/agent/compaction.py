@@ -0,0 +1,79 @@
+import math
+import re
+
+from src.utils.tokens import estimate_tokens, truncate_to_tokens
+
+_WORD_RE = re.compile(r"[0-9a-z가-힣]+")
+
+
+def _words(title: str) -> frozenset:
+    return frozenset(_WORD_RE.findall(str(title or "").lower()))
+
+
+def dedupe_headlines(news_list: list, threshold: float = 0.8) -> list:
+    """
+    단어 집합 Jaccard 유사도가 threshold 이상인 헤드라인은 같은 기사로 보고 먼저 나온 것만 남깁니다.
+    (여러 매체가 같은 보도를 거의 같은 제목으로 싣는 경우)
+    """
+    kept, seen = [], []
+    for news in news_list:
+        words = _words(news.get("title"))
+        if not words:
+            continue
+        duplicate = False
+        for other in seen:
+            # 길이 차이만으로 threshold를 넘을 수 없는 쌍은 건너뜀
+            if min(len(words), len(other)) < threshold * max(len(words), len(other)):
+                continue
+            if len(words & other) / len(words | other) >= threshold:
+                duplicate = True
+                break
+        if not duplicate:
+            kept.append(news)
+            seen.append(words)
+    return kept
+
+
+def _relevance(news: dict, symbol: str) -> int:
+    """2: 제목에 티커가 있거나 주 종목, 1: 관련 종목 목록에 포함, 0: 그 외"""
+    if not symbol:
+        return 0
+    tickers = news.get("tickers") or []
+    if symbol.lower() in _words(news.get("title")) or (tickers and tickers[0] == symbol):
+        return 2
+    return 1 if symbol in tickers else 0
+
+
+def select_headlines(news_list: list, symbol: str = None, budget: int = 400,
+                     max_items: int = 30, threshold: float = 0.8) -> list:
+    """
+    중복 제거 후 (관련도, 최신순)으로 골라 토큰 예산 안에 드는 헤드라인만 남깁니다.
+    결과는 최신순으로 정렬된 제목 문자열 목록입니다.
+    """
+    ordered = sorted(news_list, key=lambda n: str(n.get("published_utc") or ""), reverse=True)
+    unique = dedupe_headlines(ordered, threshold)
+    ranked = sorted(unique, key=lambda n: _relevance(n, symbol), reverse=True)
+
+    picked, used = set(), 0
+    for news in ranked[:max_items]:
+        cost = estimate_tokens(news["title"]) + 1
+        if used + cost > budget:
+            continue
+        picked.add(id(news))
+        used += cost
+    return [n["title"] for n in unique if id(n) in picked]
+
+
+def compact_tech(tech) -> str:
+    """TechnicalAnalyzer 결과 dict를 한 줄 구조화 문자열로 (str(dict) 그대로 붙이지 않도록)"""
+    if not isinstance(tech, dict):
+        return str(tech)
+    rsi = tech.get("rsi")
+    if rsi is None or (isinstance(rsi, float) and math.isnan(rsi)):
+        return tech.get("summary_text") or tech.get("summary", "N/A")
+    return f"종가 {float(tech['close']):.2f} | 20일선 {tech['trend']} 추세 | RSI {float(rsi):.1f} ({tech['status']})"
+
+
+def compact_text(text, budget: int) -> str:
+    """자유 텍스트 섹션(감성/재무 요약)을 토큰 예산으로 자릅니다."""
+    return truncate_to_tokens(text, budget)
@@ -0,0 +1,139 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+
+import duckdb
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class LLMCache:
+    """
+    (모델, 프롬프트, 옵션) 해시를 키로 LLM 응답을 저장하는 영구 캐시.
+    사이드카 DuckDB 파일에 저장하고, 같은 프로세스 안에서는 메모리 사본으로 바로 응답합니다.
+    TTL이 지난 항목은 무시되고, max_entries를 넘으면 오래된 항목부터 지웁니다.
+    정리(DELETE)는 put마다 하지 않고 evict_every번(기본 max_entries의 10%)마다 한 번 하므로,
+    파일에는 잠시 max_entries + evict_every개까지 남을 수 있습니다.
+    """
+
+    def __init__(self, path=None, ttl_seconds=86400, max_entries=5000, memory_entries=256, evict_every=None):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        self.evict_every = evict_every or max(max_entries // 10, 1)
+        self._puts = 0
+        self.hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self.conn = None
+
+        if path:
+            try:
+                os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                self.conn = duckdb.connect(path)
+                self.conn.execute("""
+                    CREATE TABLE IF NOT EXISTS llm_cache (
+                        key VARCHAR PRIMARY KEY,
+                        model VARCHAR,
+                        response VARCHAR,
+                        created_at DOUBLE
+                    )
+                """)
+                self._evict(time.time())
+            except duckdb.Error as e:
+                # 다른 프로세스가 파일을 잡고 있으면 메모리 캐시로만 동작
+                logger.warning(f"LLM 캐시 파일을 열 수 없어 메모리 캐시만 사용합니다: {e}")
+                self.conn = None
+
+    @classmethod
+    def from_config(cls, cfg, base_dir: str):
+        """cfg.llm_cache 설정으로 캐시를 만듭니다. 비활성화 상태면 None을 반환합니다."""
+        cache_cfg = cfg.get("llm_cache")
+        if not cache_cfg or not cache_cfg.enabled:
+            return None
+
+        path = cache_cfg.path
+        if path and not os.path.isabs(path):
+            path = os.path.join(base_dir, path)
+        return cls(
+            path=path,
+            ttl_seconds=cache_cfg.ttl_hours * 3600,
+            max_entries=cache_cfg.max_entries
+        )
+
+    @staticmethod
+    def make_key(model: str, messages: list, options=None, fmt=None) -> str:
+        request = {"model": model, "messages": messages, "options": options or {}}
+        if fmt:
+            request["format"] = fmt
+        payload = json.dumps(request, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str):
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None and self.conn is not None:
+                row = self.conn.execute(
+                    "SELECT response, created_at FROM llm_cache WHERE key = ?", [key]
+                ).fetchone()
+                if row:
+                    entry = (row[0], row[1])
+
+            if entry is None or now - entry[1] > self.ttl_seconds:
+                self.misses += 1
+                self._memory.pop(key, None)
+                return None
+
+            self.hits += 1
+            self._remember(key, entry)
+            return entry[0]
+
+    def put(self, key: str, model: str, response: str):
+        now = time.time()
+        with self._lock:
+            self._remember(key, (response, now))
+            if self.conn is None:
+                return
+            self.conn.execute(
+                "INSERT OR REPLACE INTO llm_cache VALUES (?, ?, ?, ?)",
+                [key, model, response, now]
+            )
+            self._puts += 1
+            if self._puts >= self.evict_every:
+                self._evict(now)
+
+    def _remember(self, key, entry):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _evict(self, now):
+        self._puts = 0
+        self.conn.execute("DELETE FROM llm_cache WHERE created_at < ?", [now - self.ttl_seconds])
+        self.conn.execute("""
+            DELETE FROM llm_cache WHERE key IN (
+                SELECT key FROM llm_cache ORDER BY created_at DESC OFFSET ?
+            )
+        """, [self.max_entries])
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            if self.conn is not None:
+                self.conn.execute("DELETE FROM llm_cache")
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
@@ -0,0 +1,157 @@
+import time
+import threading
+
+from src.agent.llm_cache import LLMCache
+from src.utils.logger import get_logger
+from src.utils.tokens import estimate_tokens
+from src.utils.tracing import span
+
+logger = get_logger(__name__)
+
+
+class LLMClient:
+    """
+    ollama 채팅 호출 창구. 캐시가 주어지면 같은 (모델, 프롬프트, 옵션)에 대해
+    모델을 다시 호출하지 않고 저장된 응답을 돌려줍니다.
+    client(ollama.Client)를 넘기면 그 연결을 재사용하고, keep_alive 동안 모델을 메모리에 유지시킵니다.
+    """
+
+    def __init__(self, model: str, cache: LLMCache = None, client=None, keep_alive=None):
+        self.model = model
+        self.cache = cache
+        if client is None:
+            import ollama
+            client = ollama
+        self.client = client
+        self.keep_alive = keep_alive
+        self.calls = 0
+        self.total_seconds = 0.0
+        self.last_seconds = None
+        self.prompt_tokens = 0
+        self.last_prompt_tokens = None
+        self.last_prefill_ms = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, cfg, cache: LLMCache = None):
+        """cfg.api.ollama(host, keep_alive) 설정으로 재사용 가능한 클라이언트를 만듭니다."""
+        import ollama
+
+        ollama_cfg = cfg.api.ollama
+        client = ollama.Client(host=ollama_cfg.host)
+        return cls(ollama_cfg.model, cache, client, ollama_cfg.get("keep_alive"))
+
+    def _record(self, elapsed, prompt, resp=None) -> dict:
+        """
+        호출 시간과 프롬프트 크기를 기록합니다. ollama 응답(스트리밍이면 마지막 조각)의
+        prompt_eval_count / prompt_eval_duration(ns)이 있으면 실제 토큰 수와 prefill 시간을 씁니다.
+        span에 덧붙일 지표 dict를 반환합니다.
+        """
+        resp = resp or {}
+        tokens = resp.get('prompt_eval_count') or estimate_tokens(prompt)
+        prefill_ns = resp.get('prompt_eval_duration')
+        prefill_ms = prefill_ns / 1e6 if prefill_ns else None
+        eval_count = resp.get('eval_count')
+        eval_ns = resp.get('eval_duration')
+        with self._lock:
+            self.calls += 1
+            self.total_seconds += elapsed
+            self.last_seconds = elapsed
+            self.prompt_tokens += tokens
+            self.last_prompt_tokens = tokens
+            self.last_prefill_ms = prefill_ms
+        logger.info(
+            f"LLM 호출: 프롬프트 {tokens}토큰"
+            + (f", prefill {prefill_ms:.0f}ms" if prefill_ms is not None else "")
+            + f", 생성 {eval_count or '?'}토큰, 총 {elapsed:.2f}s"
+        )
+        return {
+            "prompt_tokens": tokens,
+            "prefill_ms": prefill_ms,
+            "eval_tokens": eval_count,
+            "tokens_per_sec": eval_count / (eval_ns / 1e9) if eval_count and eval_ns else None,
+        }
+
+    def chat(self, prompt: str, options: dict = None, use_cache: bool = True, fmt: str = None) -> str:
+        """fmt='json'이면 ollama의 구조화(JSON) 출력 모드를 사용합니다."""
+        messages = [{'role': 'user', 'content': prompt}]
+        with span("llm.chat", model=self.model, fmt=fmt, cache_hit=False) as sp:
+            key = None
+            if self.cache is not None and use_cache:
+                key = LLMCache.make_key(self.model, messages, options, fmt)
+                cached = self.cache.get(key)
+                if cached is not None:
+                    sp["cache_hit"] = True
+                    return cached
+
+            start = time.perf_counter()
+            resp = self.client.chat(
+                model=self.model, messages=messages, options=options,
+                format=fmt or '', keep_alive=self.keep_alive
+            )
+            sp.update(self._record(time.perf_counter() - start, prompt, resp))
+            content = resp['message']['content']
+
+            if key is not None:
+                self.cache.put(key, self.model, content)
+            return content
+
+    def stream(self, prompt: str, options: dict = None, use_cache: bool = True):
+        """
+        stream=True로 호출해 생성되는 토큰 조각을 도착하는 대로 yield합니다.
+        캐시 적중 시에는 저장된 응답을 한 번에 yield하고, 완주한 응답만 캐시에 저장합니다.
+        """
+        messages = [{'role': 'user', 'content': prompt}]
+        with span("llm.stream", model=self.model, cache_hit=False) as sp:
+            key = None
+            if self.cache is not None and use_cache:
+                key = LLMCache.make_key(self.model, messages, options)
+                cached = self.cache.get(key)
+                if cached is not None:
+                    sp["cache_hit"] = True
+                    yield cached
+                    return
+
+            start = time.perf_counter()
+            parts = []
+            chunk = None
+            for chunk in self.client.chat(
+                model=self.model, messages=messages, options=options,
+                stream=True, keep_alive=self.keep_alive
+            ):
+                if not parts:
+                    sp["first_token_ms"] = (time.perf_counter() - start) * 1000
+                piece = chunk['message']['content']
+                parts.append(piece)
+                yield piece
+            sp.update(self._record(time.perf_counter() - start, prompt, chunk))
+
+            if key is not None:
+                self.cache.put(key, self.model, "".join(parts))
+
+    def warmup(self) -> bool:
+        """빈 메시지로 chat을 호출해 모델을 미리 메모리에 올립니다 (keep_alive 동안 유지)."""
+        try:
+            with span("llm.warmup", model=self.model):
+                self.client.chat(model=self.model, messages=[], keep_alive=self.keep_alive)
+            return True
+        except Exception as e:
+            logger.warning(f"모델 예열 실패: {e}")
+            return False
+
+    def health(self) -> dict:
+        """ollama 서버 응답 여부와 핑 지연, 지금까지의 평균 호출 시간"""
+        start = time.perf_counter()
+        try:
+            self.client.list()
+            ok = True
+        except Exception:
+            ok = False
+        return {
+            "ok": ok,
+            "ping_ms": (time.perf_counter() - start) * 1000,
+            "calls": self.calls,
+            "avg_seconds": self.total_seconds / self.calls if self.calls else None,
+            "avg_prompt_tokens": self.prompt_tokens / self.calls if self.calls else None,
+            "last_prefill_ms": self.last_prefill_ms,
+        }
@@ -1,14 +1,27 @@
-import ollama
 from datetime import datetime
+from src.agent.llm_client import LLMClient
+from src.agent.compaction import compact_tech, compact_text
+from src.utils.tokens import estimate_tokens, truncate_to_tokens
+
+# 비교 리포트에서 종목 하나가 받아야 하는 최소 토큰 (기술/감성/재무 내용, 라벨 제외)
+COMPARISON_MIN_TOKENS = 40
 
 class QuantAgent:
-    def __init__(self, model_name):
+    def __init__(self, model_name, llm: LLMClient = None, section_budget: int = 300):
         self.model = model_name
+        self.llm = llm or LLMClient(model_name)
+        self.section_budget = section_budget
 
-    def generate_report(self, symbol, tech, senti, fund):
-        today_date = datetime.now().strftime("%Y-%m-%d")
-        
-        prompt = f"""
+    @classmethod
+    def from_config(cls, cfg, llm: LLMClient = None):
+        prompt_cfg = cfg.get("prompt") or {}
+        return cls(cfg.api.ollama.model, llm, prompt_cfg.get("section_budget", 300))
+
+    def _build_prompt(self, symbol, tech, senti, fund, today_date):
+        tech = compact_text(compact_tech(tech), self.section_budget)
+        senti = compact_text(senti, self.section_budget)
+        fund = compact_text(fund, self.section_budget)
+        return f"""
         [System Info]
         - Report Date: {today_date} (You must use this date)
         - Role: Senior Quant Analyst
@@ -31,11 +44,94 @@ class QuantAgent:
         - '재무제표' 섹션에서 구체적인 숫자가 없다면 '데이터 확인 불가'라고 솔직하게 쓰세요.
         - 결론은 명확한 투자 포지션(매수/매도/관망)으로 끝내세요.
         """
+
+    @staticmethod
+    def _comparison_frame(symbols, today_date):
+        """비교 프롬프트의 지시문(앞/뒤). 종목 블록은 그 사이에 들어갑니다."""
+        head = f"""
+        [System Info]
+        - Report Date: {today_date} (You must use this date)
+        - Role: Senior Quant Analyst
+        - Target: {', '.join(symbols)} Comparative Report
+        - Language: Korean (한국어)
+
+        [Input Data]
+        """
+        tail = f"""
+        [Instructions]
+        위 종목들을 비교하는 투자 리포트를 작성하세요.
+        - 서두에 '작성일: {today_date}'를 명시하세요.
+        - 기술적 흐름, 시장 심리, 재무 건전성을 종목 간에 비교하세요.
+        - 숫자가 없는 항목은 '데이터 확인 불가'라고 솔직하게 쓰세요.
+        - 감성 항목이 헤드라인 목록이면 헤드라인을 읽고 시장 심리를 직접 판단하세요.
+        - 매력도 순으로 순위를 매기고, 종목별 투자 포지션(매수/매도/관망)으로 끝내세요.
+        """
+        return head, tail
+
+    def _build_comparison_prompt(self, summaries: dict, today_date, token_budget=1500):
+        """
+        종목별 요약(tech/senti/fund)을 한 프롬프트에 담습니다. 지시문은 한 번만 쓰고,
+        입력 데이터는 종목 수로 나눈 토큰 예산 안에서 종목마다 잘라 넣습니다.
+        종목당 몫이 COMPARISON_MIN_TOKENS보다 작아지면 뒤쪽 종목부터 빼서 전체가 token_budget을 넘지 않게 합니다.
+        (프롬프트, 제외된 종목 목록)을 반환합니다.
+        """
+        symbols = list(summaries)
+        while True:
+            head, tail = self._comparison_frame(symbols, today_date)
+            labels = sum(estimate_tokens(f"[{symbol}]\n- 기술: \n- 감성: \n- 재무: ") for symbol in symbols)
+            per_symbol = (token_budget - estimate_tokens(head + tail) - labels) // len(symbols)
+            if per_symbol >= COMPARISON_MIN_TOKENS or len(symbols) == 1:
+                break
+            symbols = symbols[:-1]
+        dropped = list(summaries)[len(symbols):]
+
+        # 기술 지표는 짧게(최대 20토큰), 남은 예산은 감성/재무에 절반씩
+        tech_budget = max(min(20, per_symbol // 3), 1)
+        part = max((per_symbol - tech_budget) // 2, 1)
+
+        blocks = []
+        for symbol in symbols:
+            s = summaries[symbol]
+            blocks.append(
+                f"[{symbol}]\n"
+                f"- 기술: {truncate_to_tokens(compact_tech(s['tech']), tech_budget)}\n"
+                f"- 감성: {truncate_to_tokens(s['senti'], part)}\n"
+                f"- 재무: {truncate_to_tokens(s['fund'], part)}"
+            )
+        return head + "\n\n".join(blocks) + "\n" + tail, dropped
+
+    def stream_comparison(self, summaries: dict, token_budget=1500):
+        """
+        여러 종목을 LLM 호출 한 번으로 비교·순위화한 리포트를 스트리밍합니다.
+        토큰 예산 때문에 빠진 종목이 있으면 먼저 알립니다.
+        """
+        today_date = datetime.now().strftime("%Y-%m-%d")
+        prompt, dropped = self._build_comparison_prompt(summaries, today_date, token_budget)
+        if dropped:
+            yield f"⚠️ 토큰 예산({token_budget})을 넘어 비교에서 제외한 종목: {', '.join(dropped)}\n\n"
+
+        try:
+            yield from self.llm.stream(prompt)
+        except Exception as e:
+            yield f"\n❌ 리포트 생성 실패: {e}"
+
+    def generate_report(self, symbol, tech, senti, fund):
+        today_date = datetime.now().strftime("%Y-%m-%d")
+        prompt = self._build_prompt(symbol, tech, senti, fund, today_date)
         
         print(f"🤖 에이전트가 {today_date} 기준으로 리포트를 작성 중입니다...")
         
         try:
-            resp = ollama.chat(model=self.model, messages=[{'role': 'user', 'content': prompt}])
-            return resp['message']['content']
+            return self.llm.chat(prompt)
+        except Exception as e:
+            return f"❌ 리포트 생성 실패: {e}"
+
+    def stream_report(self, symbol, tech, senti, fund):
+        """generate_report의 스트리밍 버전. 리포트 토큰을 생성되는 대로 yield합니다."""
+        today_date = datetime.now().strftime("%Y-%m-%d")
+        prompt = self._build_prompt(symbol, tech, senti, fund, today_date)
+
+        try:
+            yield from self.llm.stream(prompt)
         except Exception as e:
-            return f"❌ 리포트 생성 실패: {e}"
\ No newline at end of file
+            yield f"\n❌ 리포트 생성 실패: {e}"
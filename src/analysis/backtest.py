@@ -0,0 +1,172 @@
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from src.analysis.technical import RSI_LENGTH, SMA_LENGTH
+
+RULES = ("trend", "rsi", "both")
+_SMA_RULES = ("trend", "both")
+_RSI_RULES = ("rsi", "both")
+
+
+def load_close_matrix(db, symbols: list) -> pd.DataFrame:
+    """MarketReader로 종목별 종가만 읽어 날짜 × 종목 wide 행렬로 모읍니다."""
+    frames = []
+    for symbol in symbols:
+        df = db.get_price_data(symbol, columns=["close"])
+        if df is None or df.empty:
+            continue
+        frames.append(df[["date", "close"]].assign(symbol=symbol))
+    if not frames:
+        return pd.DataFrame()
+    panel = pd.concat(frames, ignore_index=True)
+    panel["date"] = pd.to_datetime(panel["date"])
+    return panel.pivot_table(index="date", columns="symbol", values="close", aggfunc="last").sort_index().astype("float64")
+
+
+def sma_matrix(close: pd.DataFrame, length: int) -> pd.DataFrame:
+    return close.rolling(length, min_periods=length).mean()
+
+
+def rsi_matrix(close: pd.DataFrame, length: int) -> pd.DataFrame:
+    """TechnicalAnalyzer와 같은 정의(Wilder RMA = ewm(alpha=1/length))를 전 종목 열에 한 번에 계산"""
+    diff = close.diff()
+    alpha = 1.0 / length
+    positive_avg = diff.clip(lower=0).ewm(alpha=alpha, min_periods=length).mean()
+    negative_avg = diff.clip(upper=0).ewm(alpha=alpha, min_periods=length).mean()
+    return 100 * positive_avg / (positive_avg + negative_avg.abs())
+
+
+def positions(close, sma, rsi, rule="trend", rsi_low=30, rsi_high=70) -> pd.DataFrame:
+    """
+    규칙별 보유 여부(1/0) 행렬. 규칙이 쓰지 않는 지표(trend의 rsi, rsi의 sma)는 None이어도 됩니다.
+    trend: 종가 > SMA이면 보유 (TechnicalAnalyzer의 '상승' 추세)
+    rsi: 과매도(rsi < rsi_low)에서 진입, 과매수(rsi > rsi_high)에서 청산, 그 사이는 직전 상태 유지
+    both: 두 규칙이 모두 보유일 때만 보유
+    """
+    if rule not in RULES:
+        raise ValueError(f"알 수 없는 규칙: {rule} (지원: {', '.join(RULES)})")
+
+    pos = None
+    if rule in _SMA_RULES:
+        pos = (close > sma).astype("float64").where(sma.notna())
+    if rule in _RSI_RULES:
+        state = pd.DataFrame(np.nan, index=close.index, columns=close.columns)
+        state = state.mask(rsi < rsi_low, 1.0).mask(rsi > rsi_high, 0.0).ffill()
+        pos = state if pos is None else pos * state
+    return pos.fillna(0.0)
+
+
+def evaluate(close: pd.DataFrame, pos: pd.DataFrame, cost_bps: float = 0.0) -> pd.DataFrame:
+    """
+    신호가 나온 다음 봉부터 보유한다고 보고(look-ahead 방지) 종목별 성과를 계산합니다.
+    반환 컬럼: total_return, buy_hold_return, hit_rate, max_drawdown, exposure, trades
+    """
+    returns = close.pct_change(fill_method=None)
+    held = pos.shift(1).fillna(0.0)
+    turnover = held.diff().abs().fillna(held.abs())
+    strategy = (held * returns).fillna(0.0) - turnover * cost_bps / 1e4
+
+    equity = (1 + strategy).cumprod()
+    drawdown = equity / equity.cummax() - 1
+
+    in_market = (held > 0) & returns.notna()
+    wins = ((strategy > 0) & in_market).sum()
+    days = in_market.sum()
+
+    first = close.bfill().iloc[0]
+    last = close.ffill().iloc[-1]
+
+    return pd.DataFrame({
+        "total_return": equity.iloc[-1] - 1,
+        "buy_hold_return": last / first - 1,
+        "hit_rate": wins / days.replace(0, np.nan),
+        "max_drawdown": drawdown.min(),
+        "exposure": days / returns.notna().sum().replace(0, np.nan),
+        "trades": (held.diff() > 0).sum(),
+    })
+
+
+def _run_group(close, sma_length, rsi_length, combos, cost_bps):
+    """지표 길이가 같은 파라미터 조합들을 한 프로세스에서 처리 (SMA/RSI는 한 번만, 쓰는 쪽만 계산)"""
+    sma = sma_matrix(close, sma_length) if sma_length is not None else None
+    rsi = rsi_matrix(close, rsi_length) if rsi_length is not None else None
+    frames = []
+    for rule, rsi_low, rsi_high in combos:
+        stats = evaluate(close, positions(close, sma, rsi, rule, rsi_low, rsi_high), cost_bps)
+        stats = stats.rename_axis("symbol").reset_index()
+        stats.insert(1, "rule", rule)
+        stats.insert(2, "sma_length", sma_length)
+        stats.insert(3, "rsi_length", rsi_length)
+        stats.insert(4, "rsi_low", rsi_low)
+        stats.insert(5, "rsi_high", rsi_high)
+        frames.append(stats)
+    return pd.concat(frames, ignore_index=True)
+
+
+def parameter_grid(rules=RULES, sma_lengths=(SMA_LENGTH,), rsi_lengths=(RSI_LENGTH,),
+                   rsi_lows=(30,), rsi_highs=(70,)) -> dict:
+    """
+    규칙마다 실제로 쓰는 축만 곱한 격자를 {(sma_length, rsi_length): [(rule, rsi_low, rsi_high), ...]}로 묶습니다.
+    trend는 SMA 길이만, rsi는 RSI 축만, both는 둘 다 쓰며, 쓰지 않는 축은 None입니다.
+    """
+    bands = [(lo, hi) for lo, hi in itertools.product(rsi_lows, rsi_highs) if lo < hi]
+    groups = {}
+    for rule in rules:
+        if rule not in RULES:
+            raise ValueError(f"알 수 없는 규칙: {rule} (지원: {', '.join(RULES)})")
+        smas = sma_lengths if rule in _SMA_RULES else (None,)
+        rsis = rsi_lengths if rule in _RSI_RULES else (None,)
+        rule_bands = bands if rule in _RSI_RULES else [(None, None)]
+        if not rule_bands:
+            continue
+        for key in itertools.product(smas, rsis):
+            groups.setdefault(key, []).extend((rule, lo, hi) for lo, hi in rule_bands)
+    return groups
+
+
+def sweep(close: pd.DataFrame, rules=RULES, sma_lengths=(SMA_LENGTH,), rsi_lengths=(RSI_LENGTH,),
+          rsi_lows=(30,), rsi_highs=(70,), cost_bps: float = 0.0, workers: int = None) -> pd.DataFrame:
+    """
+    규칙별 파라미터 격자(parameter_grid) 전체를 전 종목에 대해 백테스트합니다.
+    (sma_length, rsi_length) 묶음 단위로 프로세스 풀에 나눠 병렬 실행하며, 결과는 조합 × 종목 행입니다.
+    """
+    groups = list(parameter_grid(rules, sma_lengths, rsi_lengths, rsi_lows, rsi_highs).items())
+    if close.empty or not groups:
+        return pd.DataFrame()
+
+    workers = min(workers or os.cpu_count() or 1, len(groups))
+    if workers <= 1:
+        frames = [_run_group(close, s, r, combos, cost_bps) for (s, r), combos in groups]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_run_group, close, s, r, combos, cost_bps) for (s, r), combos in groups]
+            frames = [f.result() for f in futures]
+    results = pd.concat(frames, ignore_index=True)
+    # 규칙이 쓰지 않는 축은 None → 정수 컬럼을 유지하도록 nullable Int64로
+    params = ["sma_length", "rsi_length", "rsi_low", "rsi_high"]
+    results[params] = results[params].astype("Int64")
+    return results
+
+
+def summarize(results: pd.DataFrame) -> pd.DataFrame:
+    """조합별 전 종목 평균 수익률/적중률과 최악 낙폭 (평균 수익률 내림차순, 규칙이 쓰지 않는 축은 빈 값)"""
+    if results.empty:
+        return results
+    keys = ["rule", "sma_length", "rsi_length", "rsi_low", "rsi_high"]
+    return (
+        results.groupby(keys, as_index=False, dropna=False)
+        .agg(
+            avg_return=("total_return", "mean"),
+            avg_buy_hold=("buy_hold_return", "mean"),
+            avg_hit_rate=("hit_rate", "mean"),
+            worst_drawdown=("max_drawdown", "min"),
+            avg_exposure=("exposure", "mean"),
+            trades=("trades", "sum"),
+        )
+        .sort_values("avg_return", ascending=False, kind="mergesort")
+        .reset_index(drop=True)
+    )
@@ -1,20 +1,47 @@
+import math
+
+
+def _fmt(val, div=1, fmt="{:.2f}"):
+    if val is None or (isinstance(val, float) and math.isnan(val)):
+        return "N/A"
+    return fmt.format(val / div)
+
+
 class FundamentalAnalyzer:
     def analyze(self, data: dict) -> str:
         def get_val(cat, key, div=1, fmt="{:.2f}"):
             try:
                 val = data.get(cat, [])[0].get(key, 0)
                 return fmt.format(val / div)
-            except:
+            except (AttributeError, IndexError, KeyError, TypeError, ValueError):
                 return "N/A"
 
         rev = get_val('income_statement', 'revenue', 1e9, "{:.2f}B")
         net = get_val('income_statement', 'netIncome', 1e9, "{:.2f}B")
         per = get_val('ratios', 'priceEarningsRatio')
-        roe = get_val('ratios', 'returnOnEquity', 0.01, "{:.1f}%") 
+        roe = get_val('ratios', 'returnOnEquity', 0.01, "{:.1f}%")
         debt = get_val('ratios', 'debtRatio')
 
         return (
             f"최근 분기 매출 {rev}, 순이익 {net}. "
             f"PER {per}배, ROE {roe}, 부채비율 {debt}. "
             f"펀더멘털 관점에서 건전성을 유지하고 있는지 확인이 필요합니다."
-        )
\ No newline at end of file
+        )
+
+    def analyze_row(self, row: dict) -> str:
+        """FundamentalsEngine.screen() 결과 한 행(종목)을 요약 문장으로 변환"""
+        rev = _fmt(row.get('revenue'), 1e9, "{:.2f}B")
+        net = _fmt(row.get('net_income'), 1e9, "{:.2f}B")
+        per = _fmt(row.get('per'))
+        roe = _fmt(row.get('roe'), 0.01, "{:.1f}%")
+        debt = _fmt(row.get('debt_ratio'))
+        rev_growth = _fmt(row.get('revenue_growth'), 0.01, "{:+.1f}%")
+        net_growth = _fmt(row.get('net_income_growth'), 0.01, "{:+.1f}%")
+        rev_trend = _fmt(row.get('revenue_trend'), 0.01, "{:+.1f}%")
+
+        return (
+            f"최근 분기 매출 {rev}, 순이익 {net}. "
+            f"PER {per}배, ROE {roe}, 부채비율 {debt}. "
+            f"전분기 대비 매출 {rev_growth}, 순이익 {net_growth}, "
+            f"최근 {row.get('quarters', 0)}개 분기 매출 추세 분기당 {rev_trend}."
+        )
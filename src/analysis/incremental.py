@@ -0,0 +1,261 @@
+import json
+import math
+from collections import deque
+from datetime import datetime
+
+import pandas as pd
+
+from src.analysis.technical import (
+    RSI_LENGTH, SMA_LENGTH, MIN_BARS, _trend, _rsi_status, _summary_text
+)
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class _WilderAverage:
+    """
+    pandas ewm(alpha=1/length, adjust=True).mean()의 점화식을 그대로 옮긴 O(1) 갱신기.
+    pandas_ta.rma와 같은 연산 순서를 따르므로 배치 계산과 비트 단위로 같은 값을 냅니다.
+    """
+
+    def __init__(self, length, weighted=None, old_wt=1.0, nobs=0):
+        self.length = length
+        com = (1.0 - 1.0 / length) / (1.0 / length)
+        self.old_wt_factor = 1.0 - 1.0 / (1.0 + com)
+        self.weighted = weighted
+        self.old_wt = old_wt
+        self.nobs = nobs
+
+    def push(self, cur):
+        self.nobs += 1
+        if self.weighted is None:
+            self.weighted = cur
+            return
+        self.old_wt *= self.old_wt_factor
+        if self.weighted != cur:
+            self.weighted = (self.old_wt * self.weighted + cur) / (self.old_wt + 1.0)
+        self.old_wt += 1.0
+
+    @property
+    def value(self):
+        return self.weighted if self.nobs >= self.length else math.nan
+
+
+class _RollingMean:
+    """
+    pandas rolling(length).mean()의 add/remove(Kahan 보정) 누적합 방식을 그대로 옮긴 O(1) 갱신기.
+    """
+
+    def __init__(self, length, window=(), sum_x=0.0, comp_add=0.0, comp_remove=0.0,
+                 neg_ct=0, same_ct=0, prev_value=None):
+        self.length = length
+        self.window = deque(window)
+        self.sum_x = sum_x
+        self.comp_add = comp_add
+        self.comp_remove = comp_remove
+        self.neg_ct = neg_ct
+        self.same_ct = same_ct
+        self.prev_value = prev_value
+
+    def push(self, val):
+        if self.prev_value is None:
+            self.prev_value = val
+
+        if len(self.window) == self.length:
+            old = self.window.popleft()
+            y = -old - self.comp_remove
+            t = self.sum_x + y
+            self.comp_remove = t - self.sum_x - y
+            self.sum_x = t
+            if math.copysign(1.0, old) < 0:
+                self.neg_ct -= 1
+
+        y = val - self.comp_add
+        t = self.sum_x + y
+        self.comp_add = t - self.sum_x - y
+        self.sum_x = t
+        if math.copysign(1.0, val) < 0:
+            self.neg_ct += 1
+        if val == self.prev_value:
+            self.same_ct += 1
+        else:
+            self.same_ct = 1
+        self.prev_value = val
+        self.window.append(val)
+
+    @property
+    def value(self):
+        nobs = len(self.window)
+        if nobs < self.length:
+            return math.nan
+        result = self.sum_x / nobs
+        if self.same_ct >= nobs:
+            result = self.prev_value
+        elif self.neg_ct == 0 and result < 0:
+            result = 0.0
+        elif self.neg_ct == nobs and result > 0:
+            result = 0.0
+        return result
+
+
+class IndicatorState:
+    """한 종목의 RSI(14)/SMA(20) 증분 계산 상태"""
+
+    def __init__(self, last_date=None, last_close=None, bars=0, positive=None, negative=None, sma=None):
+        self.last_date = last_date
+        self.last_close = last_close
+        self.bars = bars
+        self.positive = positive or _WilderAverage(RSI_LENGTH)
+        self.negative = negative or _WilderAverage(RSI_LENGTH)
+        self.sma = sma or _RollingMean(SMA_LENGTH)
+
+    def push(self, date, close):
+        close = float(close)
+        if self.last_close is not None:
+            diff = close - self.last_close
+            self.positive.push(0.0 if diff < 0 else diff)
+            self.negative.push(0.0 if diff > 0 else diff)
+        self.sma.push(close)
+        self.last_close = close
+        self.last_date = pd.Timestamp(date)
+        self.bars += 1
+
+    @property
+    def rsi(self):
+        positive, negative = self.positive.value, abs(self.negative.value)
+        if positive + negative == 0:
+            return math.nan
+        return 100 * positive / (positive + negative)
+
+    def result(self) -> dict:
+        """TechnicalAnalyzer.analyze()와 같은 형태의 결과"""
+        if self.bars < MIN_BARS:
+            return {"summary": "데이터 부족으로 분석 불가"}
+
+        close, rsi, sma_20 = self.last_close, self.rsi, self.sma.value
+        trend = _trend(close, sma_20)
+        rsi_status = _rsi_status(rsi)
+        return {
+            "close": close,
+            "rsi": rsi,
+            "trend": trend,
+            "status": rsi_status,
+            "summary_text": _summary_text(close, rsi, trend, rsi_status)
+        }
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "last_date": self.last_date.isoformat() if self.last_date is not None else None,
+            "last_close": self.last_close,
+            "bars": self.bars,
+            "positive": [self.positive.weighted, self.positive.old_wt, self.positive.nobs],
+            "negative": [self.negative.weighted, self.negative.old_wt, self.negative.nobs],
+            "sma": [list(self.sma.window), self.sma.sum_x, self.sma.comp_add, self.sma.comp_remove,
+                    self.sma.neg_ct, self.sma.same_ct, self.sma.prev_value],
+        })
+
+    @classmethod
+    def from_json(cls, raw: str):
+        d = json.loads(raw)
+        return cls(
+            last_date=pd.Timestamp(d["last_date"]) if d["last_date"] else None,
+            last_close=d["last_close"],
+            bars=d["bars"],
+            positive=_WilderAverage(RSI_LENGTH, *d["positive"]),
+            negative=_WilderAverage(RSI_LENGTH, *d["negative"]),
+            sma=_RollingMean(SMA_LENGTH, *d["sma"]),
+        )
+
+
+class IncrementalTechnicals:
+    """
+    종목별 지표 상태를 가격 테이블과 같은 DuckDB 파일(indicator_state 테이블)에 보관하고,
+    새로 들어온 봉만 반영해 지표를 갱신하는 증분 엔진입니다.
+    마지막 봉 직전 상태(checkpoint)도 함께 저장해 두어, 제공자가 마지막 봉을 수정하면 그 봉부터 다시 계산합니다.
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS indicator_state (
+                symbol VARCHAR PRIMARY KEY,
+                last_date TIMESTAMP,
+                state VARCHAR,
+                updated_at TIMESTAMP,
+                checkpoint VARCHAR
+            )
+        """)
+        # checkpoint 컬럼이 없던 예전 DB
+        self.conn.execute("ALTER TABLE indicator_state ADD COLUMN IF NOT EXISTS checkpoint VARCHAR")
+
+    def load(self, symbol: str):
+        row = self.conn.execute(
+            "SELECT state FROM indicator_state WHERE symbol = ?", [symbol]
+        ).fetchone()
+        return IndicatorState.from_json(row[0]) if row else None
+
+    def save(self, symbol: str, state: IndicatorState, checkpoint: str = None):
+        """checkpoint는 마지막 봉을 반영하기 직전 상태의 to_json()입니다."""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO indicator_state (symbol, last_date, state, updated_at, checkpoint) VALUES (?, ?, ?, ?, ?)",
+            [symbol, state.last_date, state.to_json(), datetime.now(), checkpoint]
+        )
+
+    def resume(self, symbol: str, close_at) -> IndicatorState:
+        """
+        새 봉을 반영할 시작 상태. close_at(date)는 새로 받은 데이터에서 그 날짜 봉의 종가(없으면 None)입니다.
+        마지막으로 반영한 봉의 종가가 바뀌었으면(제공자 수정) 직전 checkpoint로 되돌려 그 봉부터 다시 반영하게 합니다.
+        반환된 상태의 last_date 이후 봉만 push하면 됩니다.
+        """
+        row = self.conn.execute(
+            "SELECT state, checkpoint FROM indicator_state WHERE symbol = ?", [symbol]
+        ).fetchone()
+        if row is None:
+            return IndicatorState()
+        state = IndicatorState.from_json(row[0])
+        close = close_at(state.last_date)
+        if close is None or float(close) == state.last_close:
+            return state
+        if row[1] is None:
+            logger.warning(f"{symbol} {state.last_date:%Y-%m-%d} 봉이 수정됐지만 checkpoint가 없어 반영하지 못했습니다 (rebuild 필요)")
+            return state
+        logger.info(f"{symbol} {state.last_date:%Y-%m-%d} 봉 수정 감지 ({state.last_close} → {float(close)}), 직전 상태부터 다시 계산합니다")
+        return IndicatorState.from_json(row[1])
+
+    def update(self, symbol: str, bars: pd.DataFrame) -> dict:
+        """
+        date/close 컬럼을 가진 봉 데이터에서 마지막 반영일 이후의 봉만 상태에 반영합니다.
+        마지막 반영일의 봉이 함께 들어왔고 종가가 다르면 그 봉부터 다시 반영합니다.
+        상태가 없으면 전달된 전체 이력으로 초기화합니다.
+        """
+        if bars.empty:
+            return (self.load(symbol) or IndicatorState()).result()
+
+        bars = bars.sort_values("date", kind="mergesort")
+        dates = pd.to_datetime(bars["date"])
+
+        def close_at(date):
+            same = bars["close"][dates == date]
+            return same.iloc[-1] if len(same) else None
+
+        state = self.resume(symbol, close_at)
+        if state.last_date is not None:
+            bars, dates = bars[dates > state.last_date], dates[dates > state.last_date]
+        if len(bars):
+            for date, close in zip(dates.iloc[:-1], bars["close"].iloc[:-1]):
+                state.push(date, close)
+            checkpoint = state.to_json()
+            state.push(dates.iloc[-1], bars["close"].iloc[-1])
+            self.save(symbol, state, checkpoint)
+        return state.result()
+
+    def rebuild(self, symbol: str, bars: pd.DataFrame) -> dict:
+        """과거 봉이 수정된 경우 상태를 버리고 전체 이력으로 다시 계산합니다."""
+        self.conn.execute("DELETE FROM indicator_state WHERE symbol = ?", [symbol])
+        return self.update(symbol, bars)
+
+    def get(self, symbol: str) -> dict:
+        """저장된 상태만으로 지표 결과를 반환합니다 (가격 이력 조회 없음)."""
+        state = self.load(symbol)
+        return state.result() if state else {"summary": "데이터 부족으로 분석 불가"}
@@ -1,14 +1,50 @@
-import ollama
+import json
+import hashlib
+from src.agent.llm_client import LLMClient
+from src.agent.compaction import dedupe_headlines, select_headlines
+from src.data.news_scores import NewsScoreStore
 
 class SentimentAnalyzer:
-    def __init__(self, model="gemma2:2b"):
+    def __init__(self, model="gemma2:2b", llm: LLMClient = None, store=None, mode="summary", batch_size=10,
+                 headline_budget=400, max_headlines=30, dedupe_threshold=0.8):
         self.model = model
+        self.llm = llm or LLMClient(model)
+        self.store = store
+        self.mode = mode
+        self.batch_size = batch_size
+        self.headline_budget = headline_budget
+        self.max_headlines = max_headlines
+        self.dedupe_threshold = dedupe_threshold
 
-    def analyze(self, news_list: list) -> str:
+    @classmethod
+    def from_config(cls, cfg, llm: LLMClient = None, conn=None, read_only: bool = False):
+        """
+        cfg.sentiment.mode가 'batched'면 기사별 점수 저장소(conn 필요)를 붙여 생성합니다.
+        'summary'(기본)는 헤드라인 전체를 한 번에 요약하는 기존 방식입니다.
+        """
+        senti_cfg = cfg.get("sentiment") or {}
+        mode = senti_cfg.get("mode", "summary")
+        store = NewsScoreStore(conn, read_only) if mode == "batched" and conn is not None else None
+        prompt_cfg = cfg.get("prompt") or {}
+        return cls(
+            cfg.api.ollama.model, llm, store, mode, senti_cfg.get("batch_size", 10),
+            prompt_cfg.get("headline_budget", 400),
+            prompt_cfg.get("max_headlines", 30),
+            prompt_cfg.get("dedupe_threshold", 0.8),
+        )
+
+    def analyze(self, news_list: list, symbol: str = None) -> str:
         if not news_list:
             return "최근 뉴스 없음"
             
-        headlines = "\n".join([f"- {n['title']}" for n in news_list])
+        if self.mode == "batched" and self.store is not None:
+            # 같은 보도가 여러 매체에 실리면 한 건으로만 채점/집계
+            return self.analyze_batched(dedupe_headlines(news_list, self.dedupe_threshold), symbol)
+
+        titles = select_headlines(
+            news_list, symbol, self.headline_budget, self.max_headlines, self.dedupe_threshold
+        )
+        headlines = "\n".join([f"- {t}" for t in titles])
         prompt = f"""
         다음 뉴스 헤드라인들을 읽고 해당 기업에 대한 시장 감성을 요약해줘:
         {headlines}
@@ -16,7 +52,95 @@ class SentimentAnalyzer:
         결과는 한 줄로 요약하고, 긍정/부정/중립 중 하나를 선택해. (한국어로)
         """
         try:
-            resp = ollama.chat(model=self.model, messages=[{'role': 'user', 'content': prompt}])
-            return resp['message']['content']
+            return self.llm.chat(prompt)
         except:
-            return "감성 분석 실패 (LLM 에러)"
\ No newline at end of file
+            return "감성 분석 실패 (LLM 에러)"
+
+    @staticmethod
+    def article_id(news: dict) -> str:
+        """Polygon 기사 id, 없으면 제목+발행시각 해시"""
+        if news.get('id'):
+            return str(news['id'])
+        raw = f"{news.get('title', '')}|{news.get('published_utc', '')}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def score_new_articles(self, news_list: list, symbol: str = None) -> int:
+        """
+        아직 점수가 없는 기사만 batch_size개씩 묶어 JSON 출력으로 채점하고 저장합니다.
+        새로 채점한 기사 수를 반환합니다.
+        """
+        if self.store.read_only:
+            return 0
+        by_id = {self.article_id(n): n for n in news_list}
+        known = self.store.get_scores(symbol, list(by_id))
+        pending = [(aid, n) for aid, n in by_id.items() if aid not in known]
+
+        scored = 0
+        for start in range(0, len(pending), self.batch_size):
+            batch = pending[start:start + self.batch_size]
+            scores = self._score_batch(batch, symbol)
+            self.store.save_scores(symbol, self.model, scores)
+            scored += len(scores)
+        return scored
+
+    def _score_batch(self, batch: list, symbol: str = None) -> dict:
+        headlines = "\n".join([f"{i}. {n['title']}" for i, (_, n) in enumerate(batch, 1)])
+        target = f"{symbol} 종목" if symbol else "해당 기업"
+        prompt = f"""
+        다음 뉴스 헤드라인 각각이 {target} 주가에 주는 감성을 -1.0(매우 부정) ~ 1.0(매우 긍정) 점수로 매겨줘.
+        다른 기업이 주인공인 기사라도 {target} 입장에서의 영향으로 판단해.
+        {headlines}
+
+        반드시 다음 JSON 형식으로만 답해: {{"scores": [{{"i": 1, "score": 0.0}}]}}
+        """
+        try:
+            parsed = json.loads(self.llm.chat(prompt, fmt="json"))
+        except Exception:
+            # 채점 실패한 기사는 저장하지 않으므로 다음 새로고침 때 다시 시도됩니다.
+            return {}
+
+        scores = {}
+        for item in parsed.get("scores", []):
+            try:
+                idx = int(item["i"]) - 1
+                score = max(-1.0, min(1.0, float(item["score"])))
+            except (KeyError, TypeError, ValueError):
+                continue
+            if 0 <= idx < len(batch):
+                scores[batch[idx][0]] = score
+        return scores
+
+    def analyze_batched(self, news_list: list, symbol: str = None) -> str:
+        """새 기사만 채점한 뒤, 저장된 기사별 점수를 평균내 종목 감성을 요약합니다."""
+        try:
+            new_count = self.score_new_articles(news_list, symbol)
+        except Exception:
+            new_count = 0
+
+        avg, count = self.store.aggregate(symbol, [self.article_id(n) for n in news_list])
+        if not count:
+            return "감성 분석 실패 (채점된 기사 없음)"
+
+        return f"기사 {count}건 평균 감성 점수 {avg:+.2f} → {self._label(avg)} (신규 채점 {new_count}건)"
+
+    @staticmethod
+    def _label(avg: float) -> str:
+        return "긍정" if avg > 0.15 else "부정" if avg < -0.15 else "중립"
+
+    def stored_summary(self, news_list: list, symbol: str = None) -> str:
+        """
+        LLM을 부르지 않는 감성 요약 (비교 리포트용).
+        저장된 기사별 점수가 있으면 그 평균을, 없으면 헤드라인을 그대로 넘겨 비교 프롬프트에서 함께 판단하게 합니다.
+        """
+        if not news_list:
+            return "최근 뉴스 없음"
+        if self.store is not None:
+            deduped = dedupe_headlines(news_list, self.dedupe_threshold)
+            avg, count = self.store.aggregate(symbol, [self.article_id(n) for n in deduped])
+            if count:
+                return f"기사 {count}건 평균 감성 점수 {avg:+.2f} → {self._label(avg)}"
+
+        titles = select_headlines(
+            news_list, symbol, self.headline_budget, self.max_headlines, self.dedupe_threshold
+        )
+        return "헤드라인: " + " / ".join(titles)
@@ -1,23 +1,97 @@
+import numpy as np
 import pandas as pd
-import pandas_ta as ta
+
+RSI_LENGTH = 14
+SMA_LENGTH = 20
+MIN_BARS = 30
+
+
+def _trend(close, sma_20):
+    return "상승" if close > sma_20 else "하락"
+
+
+def _rsi_status(rsi):
+    return "과매수" if rsi > 70 else "과매도" if rsi < 30 else "중립"
+
+
+def _summary_text(close, rsi, trend, rsi_status):
+    return f"현재가 {close}는 20일 이평선 {trend} 추세이며, RSI({rsi:.1f}) 기준 {rsi_status} 구간입니다."
+
 
 class TechnicalAnalyzer:
     def analyze(self, df: pd.DataFrame) -> dict:
-        if df.empty or len(df) < 30:
+        if df.empty or len(df) < MIN_BARS:
             return {"summary": "데이터 부족으로 분석 불가"}
-        
-        df.set_index('date', inplace=True)
-        rsi = df.ta.rsi(length=14).iloc[-1]
-        sma_20 = df.ta.sma(length=20).iloc[-1]
+
+        # pandas_ta는 지표 목록 전체를 읽어 들여 import가 무거우므로, 처음 쓸 때 df.ta 접근자를 등록
+        import pandas_ta  # noqa: F401
+
+        df = df.set_index('date')
+        rsi = df.ta.rsi(length=RSI_LENGTH).iloc[-1]
+        sma_20 = df.ta.sma(length=SMA_LENGTH).iloc[-1]
         close = df['close'].iloc[-1]
-        
-        trend = "상승" if close > sma_20 else "하락"
-        rsi_status = "과매수" if rsi > 70 else "과매도" if rsi < 30 else "중립"
-        
+
+        trend = _trend(close, sma_20)
+        rsi_status = _rsi_status(rsi)
+
         return {
             "close": close,
             "rsi": rsi,
             "trend": trend,
             "status": rsi_status,
-            "summary_text": f"현재가 {close}는 20일 이평선 {trend} 추세이며, RSI({rsi:.1f}) 기준 {rsi_status} 구간입니다."
-        }
\ No newline at end of file
+            "summary_text": _summary_text(close, rsi, trend, rsi_status)
+        }
+
+    def analyze_panel(self, panel: pd.DataFrame) -> pd.DataFrame:
+        """
+        long 포맷 가격 패널(symbol, date, close 컬럼; DuckDB 조회 결과 그대로)을 받아
+        전 종목의 RSI(14), SMA(20)을 그룹 단위 벡터 연산 한 번으로 계산합니다.
+        종목별 마지막 봉 기준 결과를 symbol 인덱스의 DataFrame으로 반환합니다.
+        """
+        columns = ["close", "sma_20", "rsi", "trend", "status", "bars", "summary_text"]
+        if panel.empty:
+            return pd.DataFrame(columns=columns, index=pd.Index([], name="symbol"))
+
+        panel = (
+            panel[["symbol", "date", "close"]]
+            .sort_values(["symbol", "date"], kind="mergesort")
+            .reset_index(drop=True)
+        )
+        close = panel["close"].astype("float64")
+        by_symbol = close.groupby(panel["symbol"], sort=False)
+
+        sma_20 = by_symbol.rolling(SMA_LENGTH, min_periods=SMA_LENGTH).mean().droplevel(0)
+        rsi = _grouped_rsi(close, panel["symbol"], RSI_LENGTH)
+
+        last = pd.DataFrame({
+            "symbol": panel["symbol"],
+            "close": close,
+            "sma_20": sma_20,
+            "rsi": rsi,
+            "bars": by_symbol.transform("size"),
+        }).groupby("symbol", sort=True).tail(1).set_index("symbol")
+
+        enough = (last["bars"] >= MIN_BARS).to_numpy()
+        last["trend"] = np.where(last["close"] > last["sma_20"], "상승", "하락")
+        last["status"] = np.select(
+            [last["rsi"] > 70, last["rsi"] < 30], ["과매수", "과매도"], default="중립"
+        )
+        last["summary_text"] = [
+            _summary_text(c, r, t, s) if ok else "데이터 부족으로 분석 불가"
+            for c, r, t, s, ok in zip(last["close"], last["rsi"], last["trend"], last["status"], enough)
+        ]
+        last.loc[~enough, ["sma_20", "rsi"]] = np.nan
+        last.loc[~enough, ["trend", "status"]] = None
+        return last[columns]
+
+
+def _grouped_rsi(close: pd.Series, symbols: pd.Series, length: int) -> pd.Series:
+    """pandas_ta.rsi와 동일한 정의(Wilder RMA = ewm(alpha=1/length))를 종목 그룹별로 계산"""
+    diff = close.groupby(symbols, sort=False).diff()
+    positive = diff.clip(lower=0)
+    negative = diff.clip(upper=0)
+
+    alpha = 1.0 / length
+    positive_avg = positive.groupby(symbols, sort=False).ewm(alpha=alpha, min_periods=length).mean().droplevel(0)
+    negative_avg = negative.groupby(symbols, sort=False).ewm(alpha=alpha, min_periods=length).mean().droplevel(0)
+    return 100 * positive_avg / (positive_avg + negative_avg.abs())
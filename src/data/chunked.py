@@ -0,0 +1,85 @@
+import time
+
+import pandas as pd
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def iter_record_batches(conn, query: str, params=None, batch_rows: int = 100_000):
+    """
+    쿼리 결과를 Arrow RecordBatch로 batch_rows행씩 스트리밍합니다.
+    DuckDB가 결과를 한꺼번에 DataFrame으로 만들지 않으므로 메모리는 배치 크기에 비례합니다.
+    reader는 전용 cursor에서 열어서, 읽는 도중 conn에 다른 쿼리(상태 저장 등)를 실행해도 끊기지 않습니다.
+    """
+    cur = conn.cursor()
+    try:
+        reader = cur.execute(query, params or []).to_arrow_reader(batch_rows)
+        for batch in reader:
+            yield batch
+    finally:
+        cur.close()
+
+
+def stream_indicators(conn, technicals, table: str = "prices", symbols=None,
+                      batch_rows: int = 100_000, rebuild: bool = False) -> dict:
+    """
+    가격 테이블(symbol, date, close 컬럼)을 (symbol, date) 순서로 배치 단위로 읽어 종목별 지표 상태에 밀어 넣습니다.
+    한 번에 메모리에 있는 것은 현재 배치와 현재 종목의 지표 창(window)뿐이라, 분봉/다년 이력도 일정한 메모리로 처리됩니다.
+    indicator_state의 last_date 당일부터 읽어, 그 봉이 수정됐으면 직전 checkpoint부터 다시 계산합니다.
+    rebuild면 상태를 지우고 처음부터 계산합니다.
+    종목별 결과(TechnicalAnalyzer.analyze와 같은 형태)를 반환합니다.
+    """
+    where, params = [], []
+    if symbols:
+        where.append("p.symbol IN (SELECT unnest(?))")
+        params.append(list(symbols))
+    if rebuild:
+        if symbols:
+            conn.execute("DELETE FROM indicator_state WHERE symbol IN (SELECT unnest(?))", [list(symbols)])
+        else:
+            conn.execute("DELETE FROM indicator_state")
+    where.append("(s.last_date IS NULL OR CAST(p.date AS TIMESTAMP) >= s.last_date)")
+
+    query = f"""
+        SELECT p.symbol, p.date, p.close
+        FROM "{table}" p
+        LEFT JOIN indicator_state s USING (symbol)
+        WHERE {' AND '.join(where)}
+        ORDER BY p.symbol, p.date
+    """
+
+    results = {}
+    current, state, pending, rows = None, None, None, 0
+
+    def finish(symbol, state, pending):
+        # 마지막 봉은 checkpoint(직전 상태)를 떠 둔 뒤에 반영
+        if pending is None:
+            return
+        checkpoint = state.to_json()
+        state.push(*pending)
+        technicals.save(symbol, state, checkpoint)
+        results[symbol] = state.result()
+
+    start = time.perf_counter()
+    for batch in iter_record_batches(conn, query, params, batch_rows):
+        symbol_col = batch.column("symbol").to_pylist()
+        date_col = pd.to_datetime(batch.column("date").to_pandas())
+        close_col = batch.column("close").to_numpy(zero_copy_only=False)
+        for symbol, date, close in zip(symbol_col, date_col, close_col):
+            if symbol != current:
+                finish(current, state, pending)
+                current, pending = symbol, None
+                state = technicals.resume(symbol, lambda d, date=date, close=close: close if d == date else None)
+            if state.last_date is not None and date <= state.last_date:
+                continue
+            if pending is not None:
+                state.push(*pending)
+            pending = (date, close)
+        rows += batch.num_rows
+
+    finish(current, state, pending)
+
+    logger.info(f"지표 스트리밍 계산: {len(results)}개 종목, {rows}행 ({time.perf_counter() - start:.1f}s)")
+    return results
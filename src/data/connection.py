@@ -0,0 +1,169 @@
+import os
+import time
+import threading
+import duckdb
+
+_lock = threading.Lock()
+_connections = {}
+
+
+def get_connection(db_path: str, read_only: bool = False):
+    """
+    같은 DB 파일에 대해 프로세스당 하나의 DuckDB 연결을 공유합니다.
+    여러 스레드에서 쓸 때는 반환된 연결의 cursor()를 스레드마다 따로 사용하세요.
+    """
+    with _lock:
+        conn = _connections.get((db_path, read_only))
+        if conn is None:
+            conn = duckdb.connect(db_path, read_only=read_only)
+            _connections[(db_path, read_only)] = conn
+        return conn
+
+
+def close_connection(db_path: str, read_only: bool = None):
+    """공유 연결을 닫고 캐시에서 뺍니다 (read_only가 None이면 두 모드 모두)."""
+    modes = (False, True) if read_only is None else (read_only,)
+    with _lock:
+        conns = [_connections.pop((db_path, mode), None) for mode in modes]
+    for conn in conns:
+        if conn is not None:
+            conn.close()
+
+
+def file_generation(db_path: str):
+    """DB 파일의 inode. 새로고침 데몬이 파일을 교체(os.replace)하면 값이 바뀝니다."""
+    try:
+        return os.stat(db_path).st_ino
+    except OSError:
+        return None
+
+
+class ConnectionPool:
+    """
+    하나의 DuckDB 연결 위에서 세션(사용자)마다 독립된 cursor를 나눠주는 풀.
+    DuckDB cursor는 같은 DB 인스턴스를 공유하는 별도 연결이라 세션 간 동시 조회가 안전합니다.
+    idle_seconds 동안 쓰이지 않은 세션의 cursor는 다음 cursor() 호출 때 닫습니다 (끝난 세션 정리).
+
+    풀은 get_connection 캐시와 별개로, 메모리 인스턴스에 DB 파일을 ATTACH한 자기 연결을 씁니다.
+    그래서 새로고침 데몬이 파일을 교체하면 예전 파일의 핸들이 남아 있어도 새 파일을 바로 열 수 있습니다.
+    교체 시 세션 cursor는 닫지 않고 stale로 표시해 두었다가, 그 세션이 stale_grace초 뒤 다시 cursor()를 부를 때
+    (또는 세션이 정리될 때) 닫습니다. 예전 연결은 마지막 cursor가 닫힌 뒤에 닫습니다.
+    """
+
+    def __init__(self, db_path: str, read_only: bool = True, idle_seconds: float = None, stale_grace: float = 60.0):
+        self.db_path = db_path
+        self.read_only = read_only
+        self.idle_seconds = idle_seconds
+        self.stale_grace = stale_grace
+        self.generation = file_generation(db_path)
+        self.conn = self._open()
+        self._cursors = {}
+        self._stale = {}
+        self._last_used = {}
+        self._open_cursors = {id(self.conn): 0}
+        self._lock = threading.Lock()
+
+    def _open(self):
+        conn = duckdb.connect()
+        path = os.path.abspath(self.db_path).replace("'", "''")
+        conn.execute(f"ATTACH '{path}' AS market{' (READ_ONLY)' if self.read_only else ''}")
+        conn.execute("USE market")
+        return conn
+
+    def _new_cursor(self):
+        cur = self.conn.cursor()
+        cur.execute("USE market")
+        self._open_cursors[id(self.conn)] += 1
+        return cur, self.conn
+
+    def _close_cursor(self, cur, conn):
+        cur.close()
+        self._open_cursors[id(conn)] -= 1
+        if conn is not self.conn and not self._open_cursors[id(conn)]:
+            del self._open_cursors[id(conn)]
+            conn.close()
+
+    def _reopen_if_replaced(self, now: float):
+        """DB 파일이 통째로 교체됐으면 새 파일로 연결을 열고, 기존 세션 cursor는 stale로 돌립니다."""
+        generation = file_generation(self.db_path)
+        if generation == self.generation:
+            return
+        old = self.conn
+        self.conn = self._open()
+        self._open_cursors[id(self.conn)] = 0
+        self.generation = generation
+        for session_id, (cur, conn) in self._cursors.items():
+            self._stale.setdefault(session_id, []).append((cur, conn, now))
+        self._cursors.clear()
+        if not self._open_cursors[id(old)]:
+            del self._open_cursors[id(old)]
+            old.close()
+
+    def _drop_session(self, session_id: str):
+        self._last_used.pop(session_id, None)
+        entry = self._cursors.pop(session_id, None)
+        if entry is not None:
+            self._close_cursor(*entry)
+        for cur, conn, _ in self._stale.pop(session_id, []):
+            self._close_cursor(cur, conn)
+
+    def _evict_idle(self, now: float):
+        if not self.idle_seconds:
+            return
+        for session_id, last_used in list(self._last_used.items()):
+            if now - last_used > self.idle_seconds:
+                self._drop_session(session_id)
+
+    def _close_stale(self, session_id: str, now: float):
+        """교체 후 stale_grace초가 지난 이 세션의 예전 cursor를 닫습니다 (그 사이 진행 중이던 조회는 끝났다고 봄)."""
+        stale = self._stale.get(session_id)
+        if not stale:
+            return
+        keep = []
+        for cur, conn, retired_at in stale:
+            if now - retired_at >= self.stale_grace:
+                self._close_cursor(cur, conn)
+            else:
+                keep.append((cur, conn, retired_at))
+        if keep:
+            self._stale[session_id] = keep
+        else:
+            del self._stale[session_id]
+
+    def cursor(self, session_id: str):
+        with self._lock:
+            now = time.monotonic()
+            self._reopen_if_replaced(now)
+            self._evict_idle(now)
+            self._close_stale(session_id, now)
+            entry = self._cursors.get(session_id)
+            if entry is None:
+                entry = self._new_cursor()
+                self._cursors[session_id] = entry
+            self._last_used[session_id] = now
+            return entry[0]
+
+    def release(self, session_id: str):
+        with self._lock:
+            self._drop_session(session_id)
+
+    def health(self) -> dict:
+        start = time.perf_counter()
+        try:
+            with self._lock:
+                self._reopen_if_replaced(time.monotonic())
+                cur, conn = self._new_cursor()
+            try:
+                cur.execute("SELECT 1").fetchone()
+            finally:
+                with self._lock:
+                    self._close_cursor(cur, conn)
+            ok = True
+        except duckdb.Error:
+            ok = False
+        return {
+            "ok": ok,
+            "query_ms": (time.perf_counter() - start) * 1000,
+            "sessions": len(self._cursors),
+            "stale": sum(len(v) for v in self._stale.values()),
+        }
@@ -0,0 +1,114 @@
+import threading
+from datetime import date
+
+import pandas as pd
+
+STATEMENTS = ("income_statement", "balance_sheet", "cash_flow", "ratios")
+
+
+def normalize_financials(symbol: str, fin_data: dict) -> list:
+    """
+    FMP 원본(카테고리별 재무제표 dict 목록)을 (symbol, statement, period_end, period, metric, value)
+    행으로 펼칩니다. 숫자 항목만 남기고 문자열/불리언 필드는 버립니다.
+    """
+    rows = []
+    for statement, items in (fin_data or {}).items():
+        if not isinstance(items, list):
+            continue
+        for item in items:
+            if not isinstance(item, dict) or not item.get("date"):
+                continue
+            period_end = date.fromisoformat(str(item["date"])[:10])
+            period = item.get("period")
+            for metric, value in item.items():
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    continue
+                rows.append((symbol, statement, period_end, period, metric, float(value)))
+    return rows
+
+
+class FundamentalsStore:
+    """정규화된 재무 지표를 (종목, 재무제표, 기간, 지표) 한 행씩 저장하는 컬럼형 테이블"""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self._lock = threading.Lock()
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS fundamentals (
+                symbol VARCHAR,
+                statement VARCHAR,
+                period_end DATE,
+                period VARCHAR,
+                metric VARCHAR,
+                value DOUBLE,
+                PRIMARY KEY (symbol, statement, period_end, metric)
+            )
+        """)
+
+    def save(self, symbol: str, fin_data: dict) -> int:
+        rows = normalize_financials(symbol, fin_data)
+        if rows:
+            with self._lock:
+                self.conn.executemany("INSERT OR REPLACE INTO fundamentals VALUES (?, ?, ?, ?, ?, ?)", rows)
+        return len(rows)
+
+
+class FundamentalsEngine:
+    """
+    fundamentals 테이블 위에서 PER, ROE, 부채비율, 성장률, 다분기 추세를
+    전 종목에 대해 SQL 한 번으로 계산합니다.
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def screen(self, symbols: list = None, quarters: int = 4) -> pd.DataFrame:
+        """
+        종목별 최신 분기 지표와 직전 분기 대비 성장률, 최근 quarters개 분기 추세(분기당 변화율)를 반환합니다.
+        symbols가 None이면 저장된 전 종목을 계산합니다.
+        """
+        where = "WHERE symbol IN (SELECT unnest(?))" if symbols else ""
+        params = [list(symbols)] if symbols else []
+        return self.conn.execute(f"""
+            WITH wide AS (
+                SELECT
+                    symbol,
+                    period_end,
+                    max(value) FILTER (WHERE statement = 'income_statement' AND metric = 'revenue') AS revenue,
+                    max(value) FILTER (WHERE statement = 'income_statement' AND metric = 'netIncome') AS net_income,
+                    max(value) FILTER (WHERE statement = 'ratios' AND metric = 'priceEarningsRatio') AS per,
+                    max(value) FILTER (WHERE statement = 'ratios' AND metric = 'returnOnEquity') AS roe,
+                    max(value) FILTER (WHERE statement = 'ratios' AND metric = 'debtRatio') AS debt_ratio
+                FROM fundamentals
+                {where}
+                GROUP BY symbol, period_end
+            ),
+            ranked AS (
+                SELECT
+                    *,
+                    row_number() OVER (PARTITION BY symbol ORDER BY period_end DESC) AS rn,
+                    revenue / nullif(lag(revenue) OVER w, 0) - 1 AS revenue_growth,
+                    net_income / nullif(lag(net_income) OVER w, 0) - 1 AS net_income_growth
+                FROM wide
+                WINDOW w AS (PARTITION BY symbol ORDER BY period_end)
+            ),
+            trend AS (
+                SELECT
+                    symbol,
+                    count(*) AS quarters,
+                    regr_slope(revenue, -rn) / nullif(avg(revenue), 0) AS revenue_trend,
+                    regr_slope(net_income, -rn) / nullif(avg(abs(net_income)), 0) AS net_income_trend,
+                    regr_slope(roe, -rn) AS roe_trend
+                FROM ranked
+                WHERE rn <= ?
+                GROUP BY symbol
+            )
+            SELECT
+                r.symbol, r.period_end, r.revenue, r.net_income, r.per, r.roe, r.debt_ratio,
+                r.revenue_growth, r.net_income_growth,
+                t.quarters, t.revenue_trend, t.net_income_trend, t.roe_trend
+            FROM ranked r
+            JOIN trend t USING (symbol)
+            WHERE r.rn = 1
+            ORDER BY r.symbol
+        """, params + [quarters]).df()
@@ -0,0 +1,178 @@
+import json
+import os
+import sys
+import threading
+import zlib
+from collections import OrderedDict
+
+import pandas as pd
+
+
+def db_stamp(db_path: str) -> tuple:
+    """
+    DB 파일(+ WAL)의 (inode, 크기, 수정 시각) 스탬프. 수집 스크립트가 쓰거나
+    새로고침 데몬이 파일을 통째로 교체하면 값이 바뀝니다.
+    """
+    stamp = []
+    for path in (db_path, db_path + ".wal"):
+        try:
+            st = os.stat(path)
+            stamp.append((st.st_ino, st.st_size, st.st_mtime_ns))
+        except OSError:
+            stamp.append(None)
+    return tuple(stamp)
+
+
+def _frame_to_columns(df: pd.DataFrame) -> dict:
+    """DataFrame을 열별 NumPy 배열로 (날짜 열은 datetime64, 나머지 숫자 열은 원래 dtype 유지)"""
+    columns = {}
+    for name in df.columns:
+        values = df[name]
+        if values.dtype == object and name == "date":
+            values = pd.to_datetime(values)
+        columns[name] = values.to_numpy()
+    return columns
+
+
+def _columns_nbytes(columns: dict) -> int:
+    total = 0
+    for arr in columns.values():
+        total += arr.nbytes
+        if arr.dtype == object:
+            total += sum(sys.getsizeof(v) for v in arr)
+    return total
+
+
+class HotCache:
+    """
+    자주 조회되는 종목의 최근 가격 봉(열별 NumPy 배열)과 뉴스/재무(압축 JSON 바이트)를
+    프로세스 메모리에 보관하는 LRU 캐시. 전체 크기가 max_bytes를 넘으면 가장 오래 안 쓴 항목부터 버립니다.
+    조회할 때마다 DB 파일 스탬프를 확인해 수집/교체가 일어났으면 전체를 비웁니다.
+    """
+
+    def __init__(self, db_path: str, max_bytes: int = 64 * 1024 ** 2, window_bars: int = None, news_limit: int = None):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.window_bars = window_bars
+        self.news_limit = news_limit
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._stamp = db_stamp(db_path)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, cfg, db_path: str):
+        """hot_cache.enabled=false면 None"""
+        hc = cfg.get("hot_cache") or {}
+        if not hc.get("enabled", True):
+            return None
+        return cls(db_path, int(hc.get("max_mb", 64) * 1024 ** 2), hc.get("window_bars"), hc.get("news_limit"))
+
+    def _check_stamp(self):
+        stamp = db_stamp(self.db_path)
+        if stamp != self._stamp:
+            self._entries.clear()
+            self._bytes = 0
+            self._stamp = stamp
+            self.invalidations += 1
+
+    def _get(self, key):
+        with self._lock:
+            self._check_stamp()
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def _put(self, key, payload, nbytes: int, stamp):
+        with self._lock:
+            # 로딩 중에 DB가 바뀌었으면 오래된 데이터이므로 저장하지 않음
+            if stamp != self._stamp or nbytes > self.max_bytes:
+                return
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[0]
+            self._entries[key] = (nbytes, payload)
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes:
+                _, (size, _) = self._entries.popitem(last=False)
+                self._bytes -= size
+
+    def _store_prices(self, symbol: str, df: pd.DataFrame, stamp) -> pd.DataFrame:
+        """최근 window_bars봉만 열별 배열로 저장하고, 저장한 배열로 만든 DataFrame을 돌려줍니다."""
+        if self.window_bars:
+            df = df.tail(self.window_bars).reset_index(drop=True)
+        columns = _frame_to_columns(df)
+        self._put(("prices", symbol), columns, _columns_nbytes(columns), stamp)
+        return pd.DataFrame(columns)
+
+    def _store_blob(self, kind: str, symbol: str, data, stamp, limit=None):
+        if limit and isinstance(data, list):
+            data = data[:limit]
+        blob = zlib.compress(json.dumps(data, ensure_ascii=False, default=str).encode("utf-8"))
+        self._put((kind, symbol), blob, len(blob), stamp)
+        # 적중 때와 같은 값(JSON 왕복, 날짜 등은 문자열)을 돌려주도록 미스 때도 압축본에서 복원
+        return json.loads(zlib.decompress(blob))
+
+    def prices(self, symbol: str, loader) -> pd.DataFrame:
+        """캐시에 있으면 배열로 DataFrame을 다시 만들고, 없으면 loader(symbol)로 읽어 최근 window_bars봉만 저장"""
+        columns = self._get(("prices", symbol))
+        if columns is not None:
+            return pd.DataFrame(columns)
+
+        stamp = self._stamp
+        df = loader(symbol)
+        if df is None or df.empty:
+            return df
+        return self._store_prices(symbol, df, stamp)
+
+    def _blob(self, kind: str, symbol: str, loader, limit=None):
+        blob = self._get((kind, symbol))
+        if blob is not None:
+            return json.loads(zlib.decompress(blob))
+
+        stamp = self._stamp
+        return self._store_blob(kind, symbol, loader(symbol), stamp, limit)
+
+    def news(self, symbol: str, loader) -> list:
+        return self._blob("news", symbol, loader, self.news_limit)
+
+    def financials(self, symbol: str, loader) -> dict:
+        return self._blob("financials", symbol, loader)
+
+    def bundle(self, symbol: str, loader) -> tuple:
+        """
+        (가격, 뉴스, 재무)를 한 번에. 셋 다 캐시에 있으면 DB를 건너뛰고,
+        하나라도 없으면 loader(symbol)(MarketReader.get_bundle)로 쿼리 한 번에 읽어 셋 모두 채웁니다.
+        """
+        columns = self._get(("prices", symbol))
+        news = self._get(("news", symbol))
+        fin = self._get(("financials", symbol))
+        if columns is not None and news is not None and fin is not None:
+            return pd.DataFrame(columns), json.loads(zlib.decompress(news)), json.loads(zlib.decompress(fin))
+
+        stamp = self._stamp
+        price_df, news_list, fin_data = loader(symbol)
+        if price_df is None or price_df.empty:
+            return price_df, news_list, fin_data
+        return (
+            self._store_prices(symbol, price_df, stamp),
+            self._store_blob("news", symbol, news_list, stamp, self.news_limit),
+            self._store_blob("financials", symbol, fin_data, stamp),
+        )
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "mb": self._bytes / 1024 ** 2,
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+            }
@@ -0,0 +1,251 @@
+import time
+from datetime import date
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pandas as pd
+
+from src.data.connection import get_connection
+from src.data.fundamentals import FundamentalsStore
+from src.data.reader import MarketReader, ensure_indexes
+from src.data.snapshot import materialize_snapshots
+from src.data.sync import SyncState, new_price_rows, new_news_items, new_financial_statements, stored_rows
+from src.analysis.incremental import IncrementalTechnicals
+from src.analysis.sentiment import SentimentAnalyzer
+from src.agent.llm_client import LLMClient
+from src.utils.rate_limiter import RateLimiter, call_with_retry
+from src.utils.logger import get_logger
+from src.utils.tracing import instrument
+
+logger = get_logger(__name__)
+
+
+class FetchTask:
+    def __init__(self, provider, symbol, dataset, fetch, since=None):
+        self.provider = provider
+        self.symbol = symbol
+        self.dataset = dataset
+        self.fetch = fetch
+        self.since = since
+
+
+class IngestionScheduler:
+    """
+    종목 × 제공자(Polygon/FMP) 수집 작업을 스레드 풀에서 동시에 실행합니다.
+    제공자마다 별도의 슬라이딩 윈도 제한기를 두어 API 쿼터 안에서만 호출하고,
+    일시적으로 실패한 호출(429, 5xx, 타임아웃)은 지수 백오프로 재시도합니다.
+    DuckDB 쓰기는 호출 스레드 하나에서 write_batch_size개씩 모아 처리합니다 (단일 writer).
+    write는 저장에 실패한 작업을 {task: 예외}로 돌려주며, 그 작업만 실패 목록에 들어갑니다.
+    """
+
+    def __init__(self, limiters: dict, max_workers=8, max_retries=3, backoff_base=1.0,
+                 backoff_max=30.0, write_batch_size=20):
+        self.limiters = limiters
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.write_batch_size = write_batch_size
+
+    def _fetch(self, task):
+        return call_with_retry(
+            task.fetch,
+            max_retries=self.max_retries,
+            backoff_base=self.backoff_base,
+            backoff_max=self.backoff_max,
+            limiter=self.limiters.get(task.provider),
+        )
+
+    def run(self, tasks: list, write) -> dict:
+        """
+        tasks를 동시에 수집하고, 결과를 (task, data) 리스트 단위로 write에 넘깁니다.
+        데이터셋별 성공 건수와 실패 목록을 담은 리포트를 반환합니다.
+        """
+        report = {"ok": {}, "failed": [], "elapsed": 0.0}
+        start = time.perf_counter()
+        buffer = []
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {pool.submit(self._fetch, task): task for task in tasks}
+            for fut in as_completed(futures):
+                task = futures[fut]
+                try:
+                    buffer.append((task, fut.result()))
+                except Exception as e:
+                    logger.error(f"{task.symbol} {task.dataset} 수집 실패: {e}")
+                    report["failed"].append((task.symbol, task.dataset, str(e)))
+                    continue
+
+                if len(buffer) >= self.write_batch_size:
+                    self._flush(buffer, write, report)
+
+        self._flush(buffer, write, report)
+        report["elapsed"] = time.perf_counter() - start
+        return report
+
+    def _flush(self, buffer, write, report):
+        if not buffer:
+            return
+        failures = write(list(buffer)) or {}
+        for task, _ in buffer:
+            if task in failures:
+                report["failed"].append((task.symbol, task.dataset, str(failures[task])))
+            else:
+                report["ok"][task.dataset] = report["ok"].get(task.dataset, 0) + 1
+        buffer.clear()
+
+
+def build_scheduler(cfg) -> IngestionScheduler:
+    """config의 제공자별 limit_per_minute와 ingestion.* 설정으로 스케줄러를 만듭니다."""
+    ingest_cfg = cfg.ingestion
+    limiters = {
+        "polygon": RateLimiter(cfg.api.polygon.news.limit_per_minute),
+        "fmp": RateLimiter(cfg.api.fmp.limit_per_minute),
+    }
+    return IngestionScheduler(
+        limiters,
+        max_workers=ingest_cfg.max_workers,
+        max_retries=ingest_cfg.max_retries,
+        backoff_base=ingest_cfg.backoff_base,
+        backoff_max=ingest_cfg.backoff_max,
+        write_batch_size=ingest_cfg.write_batch_size,
+    )
+
+
+class _Transaction:
+    """with 블록을 BEGIN/COMMIT으로 감싸고, 예외가 나면 ROLLBACK합니다."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute("BEGIN TRANSACTION")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        return False
+
+
+def run_ingestion(cfg, db_path: str, poly=None, fmp=None, db=None) -> dict:
+    """
+    cfg.symbols 전체의 주가/뉴스/재무 데이터를 수집해 DuckDB에 저장합니다.
+    ingestion.mode=incremental이면 종목·데이터셋별 high-water mark 이후 데이터만 요청하고 저장하며,
+    리포트의 changes에 (종목, 데이터셋, 신규 건수, 새 mark)를 담습니다.
+    저장/정규화/점수 계산이 실패한 작업은 report["failed"]에 기록하고 나머지는 계속 진행합니다.
+    poly/fmp/db를 넘기면 해당 fetcher와 저장소를 대신 사용합니다 (벤치마크의 합성 데이터, 테스트 등).
+    """
+    if db is None:
+        from src.data.manager import DataManager
+        db = DataManager(db_path)
+    if poly is None:
+        from src.data.fetcher import PolygonFetcher
+        poly = PolygonFetcher(cfg)
+    if fmp is None:
+        from src.data.fmp_fetcher import FMPFetcher
+        fmp = FMPFetcher(cfg)
+    db = instrument(db, ["save_prices", "save_news", "save_financials"], "db")
+    poly = instrument(poly, ["fetch_prices", "fetch_news"], "polygon")
+    fmp = instrument(fmp, ["fetch_all"], "fmp")
+    conn = get_connection(db_path)
+    technicals = IncrementalTechnicals(conn)
+    # 기사별 LLM 점수 계산(batched 모드)은 별도 worker 스레드에서 자기 cursor로 실행해 수집/저장을 막지 않습니다.
+    sentiment, scorer = None, None
+    if cfg.sentiment.mode == "batched":
+        sentiment = SentimentAnalyzer.from_config(cfg, LLMClient.from_config(cfg), conn.cursor())
+        scorer = ThreadPoolExecutor(max_workers=1)
+    sync = SyncState(conn)
+    fundamentals = FundamentalsStore(conn)
+    incremental = cfg.ingestion.mode == "incremental"
+    end = date.today().isoformat() if incremental else cfg.date_range.end
+
+    tasks = []
+    for symbol in cfg.symbols:
+        marks = {ds: sync.get(symbol, ds) if incremental else None for ds in ("prices", "news", "financials")}
+
+        start = cfg.date_range.start
+        if marks["prices"] is not None:
+            # 마지막으로 받은 봉도 다시 받아, 제공자가 값을 고쳤으면 저장값과 지표 상태를 함께 바로잡음
+            start = marks["prices"].strftime("%Y-%m-%d")
+        if start <= end:
+            tasks.append(FetchTask(
+                "polygon", symbol, "prices",
+                lambda s=symbol, a=start: poly.fetch_prices(s, a, end), marks["prices"]
+            ))
+        tasks.append(FetchTask("polygon", symbol, "news", lambda s=symbol: poly.fetch_news(s), marks["news"]))
+        tasks.append(FetchTask("fmp", symbol, "financials", lambda s=symbol: fmp.fetch_all(s), marks["financials"]))
+
+    changes, scoring = [], []
+
+    def save(task, data):
+        """원본 데이터를 저장하고 (신규 데이터, 새 mark, 건수)를 반환합니다."""
+        if task.dataset == "prices":
+            fresh, mark = new_price_rows(data, task.since)
+            count = 0 if fresh is None else len(fresh)
+            # 건수/mark는 새 봉 기준, 저장과 지표 갱신에는 다시 받은 마지막 봉까지 포함
+            if data is not None and task.since is not None:
+                data = data[pd.to_datetime(data["date"]) >= task.since]
+            if data is not None and len(data):
+                db.save_prices(data, task.symbol)
+        elif task.dataset == "news":
+            data, mark = new_news_items(data, task.since)
+            count = len(data)
+            if count:
+                db.save_news(data, task.symbol)
+        else:
+            data, mark, count = new_financial_statements(data, task.since)
+            if count:
+                db.save_financials(task.symbol, data)
+        return data, mark, count
+
+    def write(batch):
+        failures, saved = {}, []
+        for task, data in batch:
+            try:
+                saved.append((task, *save(task, data)))
+            except Exception as e:
+                logger.error(f"{task.symbol} {task.dataset} 저장 실패: {e}")
+                failures[task] = e
+
+        # 지표 상태 · 재무 정규화 · sync mark는 배치 전체를 트랜잭션 한 번으로 커밋
+        try:
+            with _Transaction(conn):
+                for task, data, mark, count in saved:
+                    if task.dataset == "prices" and data is not None and len(data):
+                        # 새 봉이 없어도 다시 받은 마지막 봉이 수정됐으면 지표를 다시 계산
+                        technicals.update(task.symbol, data)
+                    if not count:
+                        continue
+                    if task.dataset == "financials":
+                        fundamentals.save(task.symbol, data)
+                    total = None
+                    if not incremental:
+                        # 전체 재수집은 같은 데이터를 다시 받으므로 누적하지 않고 저장된 건수로 맞춤
+                        total = stored_rows(conn, task.symbol, task.dataset, cfg.reader.price_table, cfg.reader.news_table)
+                        total = count if total is None else total
+                    sync.advance(task.symbol, task.dataset, mark, count, total)
+        except Exception as e:
+            logger.error(f"{len(saved)}건 상태 저장 실패: {e}")
+            failures.update((task, e) for task, *_ in saved)
+            saved = []
+
+        for task, data, mark, count in saved:
+            changes.append((task.symbol, task.dataset, count, mark))
+            if task.dataset == "news" and count and scorer is not None:
+                scoring.append((task.symbol, scorer.submit(sentiment.score_new_articles, data, task.symbol)))
+        print(f"  💾 {len(batch)}건 처리: " + ", ".join(f"{t.symbol}/{t.dataset}" for t, _ in batch))
+        return failures
+
+    report = build_scheduler(cfg).run(tasks, write)
+    for symbol, fut in scoring:
+        try:
+            fut.result()
+        except Exception as e:
+            logger.error(f"{symbol} 뉴스 점수 계산 실패: {e}")
+            report["failed"].append((symbol, "news_scores", str(e)))
+    if scorer is not None:
+        scorer.shutdown()
+    report["changes"] = changes
+    ensure_indexes(conn, cfg.reader.price_table, cfg.reader.news_table)
+    if cfg.snapshot.enabled:
+        report["snapshots"] = materialize_snapshots(cfg, MarketReader.from_config(cfg, conn), conn, list(cfg.symbols))
+    return report
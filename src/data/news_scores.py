@@ -0,0 +1,96 @@
+import threading
+from datetime import datetime
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class NewsScoreStore:
+    """
+    (기사 id, 종목)별 감성 점수(-1.0 ~ 1.0)를 저장하는 테이블.
+    여러 종목에 태그된 기사는 종목마다 따로 채점합니다 (한 종목엔 호재, 다른 종목엔 악재일 수 있음).
+    한 번 채점된 기사는 다시 LLM에 보내지 않도록 news 테이블과 같은 DB 파일에 보관합니다.
+    """
+
+    def __init__(self, conn, read_only: bool = False):
+        self.conn = conn
+        self.read_only = read_only
+        self._lock = threading.Lock()
+        if read_only:
+            # 읽기 전용 연결에서는 저장된 점수만 집계하고, 채점은 수집 스크립트가 맡습니다.
+            return
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS news_sentiment (
+                article_id VARCHAR,
+                symbol VARCHAR,
+                score DOUBLE,
+                model VARCHAR,
+                scored_at TIMESTAMP,
+                PRIMARY KEY (article_id, symbol)
+            )
+        """)
+        self._migrate()
+
+    def _migrate(self):
+        """article_id 단독 PK였던 이전 테이블을 (article_id, symbol) PK로 옮깁니다 (기존 점수는 저장된 종목 기준으로 유지)."""
+        row = self.conn.execute("""
+            SELECT constraint_column_names FROM duckdb_constraints()
+            WHERE table_name = 'news_sentiment' AND constraint_type = 'PRIMARY KEY'
+        """).fetchone()
+        if row is None or list(row[0]) != ["article_id"]:
+            return
+        logger.info("news_sentiment 테이블을 (article_id, symbol) 키로 변환합니다.")
+        self.conn.execute("BEGIN TRANSACTION")
+        try:
+            self.conn.execute("""
+                CREATE TABLE news_sentiment_v2 (
+                    article_id VARCHAR,
+                    symbol VARCHAR,
+                    score DOUBLE,
+                    model VARCHAR,
+                    scored_at TIMESTAMP,
+                    PRIMARY KEY (article_id, symbol)
+                )
+            """)
+            self.conn.execute("""
+                INSERT INTO news_sentiment_v2
+                SELECT article_id, coalesce(symbol, ''), score, model, scored_at FROM news_sentiment
+            """)
+            self.conn.execute("DROP TABLE news_sentiment")
+            self.conn.execute("ALTER TABLE news_sentiment_v2 RENAME TO news_sentiment")
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+
+    def get_scores(self, symbol: str, article_ids: list) -> dict:
+        if not article_ids:
+            return {}
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT article_id, score FROM news_sentiment WHERE symbol = ? AND article_id IN (SELECT unnest(?))",
+                [symbol or "", list(article_ids)]
+            ).fetchall()
+        return dict(rows)
+
+    def save_scores(self, symbol: str, model: str, scores: dict):
+        if not scores or self.read_only:
+            return
+        now = datetime.now()
+        with self._lock:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO news_sentiment VALUES (?, ?, ?, ?, ?)",
+                [[article_id, symbol or "", score, model, now] for article_id, score in scores.items()]
+            )
+
+    def aggregate(self, symbol: str, article_ids: list):
+        """주어진 기사들의 symbol 기준 저장된 점수 평균과 건수"""
+        if not article_ids:
+            return None, 0
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT avg(score), count(*) FROM news_sentiment WHERE symbol = ? AND article_id IN (SELECT unnest(?))",
+                [symbol or "", list(article_ids)]
+            ).fetchone()
+        return row[0], row[1]
@@ -0,0 +1,194 @@
+import json
+
+import duckdb
+import pandas as pd
+
+from src.data.fundamentals import FundamentalsStore
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def ensure_indexes(conn, price_table: str = "prices", news_table: str = "news"):
+    """
+    가격/뉴스 테이블에 (symbol, date) · (symbol, published_utc) 인덱스를 만듭니다.
+    테이블은 DataManager가 만들므로 수집이 끝난 뒤 쓰기 연결에서 호출합니다 (없는 테이블은 건너뜀).
+    """
+    for table, column in ((price_table, "date"), (news_table, "published_utc")):
+        try:
+            conn.execute(f'CREATE INDEX IF NOT EXISTS "idx_{table}_symbol_{column}" ON "{table}" (symbol, "{column}")')
+        except duckdb.CatalogException:
+            continue
+    backfill_fundamentals(conn)
+
+
+def backfill_fundamentals(conn) -> int:
+    """
+    fundamentals 테이블이 생기기 전에 만든 DB용: 원본 financials 테이블(symbol, statement, period_end, data JSON)에만
+    있는 종목을 정규화해 fundamentals에 채웁니다. 채운 종목 수를 반환합니다.
+    """
+    store = FundamentalsStore(conn)
+    try:
+        rows = conn.execute("""
+            SELECT symbol, statement, data FROM financials
+            WHERE symbol NOT IN (SELECT DISTINCT symbol FROM fundamentals)
+        """).fetchall()
+    except (duckdb.CatalogException, duckdb.BinderException):
+        return 0
+    by_symbol = {}
+    for symbol, statement, data in rows:
+        by_symbol.setdefault(symbol, {}).setdefault(statement, []).append(json.loads(data))
+    for symbol, fin_data in by_symbol.items():
+        store.save(symbol, fin_data)
+    if by_symbol:
+        logger.info(f"fundamentals backfill: 원본 financials 테이블에서 {len(by_symbol)}개 종목 정규화")
+    return len(by_symbol)
+
+
+class MarketReader:
+    """
+    DataManager와 같은 get_price_data/get_news/get_financials 인터페이스의 읽기 계층.
+    기간·컬럼·건수 조건을 SQL로 내려 보내 분석에 필요한 만큼만 읽고,
+    get_bundle은 세 데이터셋을 쿼리 한 번으로 가져옵니다.
+    연결(또는 세션 cursor)을 주입받으므로 읽기 전용 풀 위에서도 그대로 쓸 수 있습니다.
+    재무 데이터는 수집 때 정규화해 둔 fundamentals 테이블에서 FMP 원본과 같은 모양으로 다시 만듭니다.
+    """
+
+    def __init__(self, conn, price_table: str = "prices", news_table: str = "news",
+                 price_bars: int = None, news_limit: int = None, quarters: int = None):
+        self.conn = conn
+        self.price_table = price_table
+        self.news_table = news_table
+        self.price_bars = price_bars
+        self.news_limit = news_limit
+        self.quarters = quarters
+
+    @classmethod
+    def from_config(cls, cfg, conn):
+        r = cfg.reader
+        return cls(conn, r.price_table, r.news_table, r.price_bars, r.news_limit, r.quarters)
+
+    def _price_sql(self, symbol, start=None, end=None, columns=None, limit=None):
+        cols = ", ".join(f'"{c}"' for c in ["date", *[c for c in columns if c != "date"]]) if columns else "* EXCLUDE (symbol)"
+        where, params = ["symbol = ?"], [symbol]
+        if start is not None:
+            where.append("date >= ?")
+            params.append(pd.Timestamp(start).date())
+        if end is not None:
+            where.append("date <= ?")
+            params.append(pd.Timestamp(end).date())
+        sql = f'SELECT {cols} FROM "{self.price_table}" WHERE {" AND ".join(where)}'
+        if limit:
+            # 최근 limit개 봉만 읽고 다시 오래된 순으로
+            sql = f"SELECT * FROM ({sql} ORDER BY date DESC LIMIT {int(limit)})"
+        return sql, params
+
+    def _news_sql(self, symbol, since=None, columns=None, limit=None):
+        cols = ", ".join(f'"{c}"' for c in columns) if columns else "* EXCLUDE (symbol)"
+        where, params = ["symbol = ?"], [symbol]
+        if since is not None:
+            where.append("CAST(published_utc AS TIMESTAMP) > ?")
+            params.append(pd.Timestamp(since).to_pydatetime())
+        sql = f'SELECT {cols}, published_utc AS _published FROM "{self.news_table}" WHERE {" AND ".join(where)}'
+        if limit:
+            sql += f" ORDER BY published_utc DESC LIMIT {int(limit)}"
+        return sql, params
+
+    def _financials_sql(self, symbol, limit=None):
+        sql = """
+            SELECT statement, period_end, period, metric, value
+            FROM fundamentals
+            WHERE symbol = ?
+        """
+        if limit:
+            sql += f" QUALIFY dense_rank() OVER (PARTITION BY statement ORDER BY period_end DESC) <= {int(limit)}"
+        return sql, [symbol]
+
+    @staticmethod
+    def _news_rows(rows: list) -> list:
+        """최신순 기사 dict 목록 (정렬용 _published 컬럼 제거)"""
+        rows = sorted(rows or [], key=lambda r: str(r["_published"] or ""), reverse=True)
+        for row in rows:
+            row.pop("_published", None)
+        return rows
+
+    @staticmethod
+    def _financial_rows(symbol: str, rows) -> dict:
+        """(statement, period_end, period, metric, value) 행을 {statement: [기간별 dict, 최신순]}으로"""
+        periods = {}
+        for statement, period_end, period, metric, value in rows:
+            key = (statement, period_end)
+            if key not in periods:
+                periods[key] = {"date": period_end.isoformat(), "period": period, "symbol": symbol}
+            periods[key][metric] = value
+        fin_data = {}
+        for (statement, _), item in sorted(periods.items(), key=lambda kv: kv[0][1], reverse=True):
+            fin_data.setdefault(statement, []).append(item)
+        return fin_data
+
+    def get_price_data(self, symbol: str, start=None, end=None, columns=None, limit=None) -> pd.DataFrame:
+        """날짜 오름차순 봉 데이터. limit(기본 reader.price_bars)이면 최근 limit개 봉만 읽습니다."""
+        sql, params = self._price_sql(symbol, start, end, columns, limit or self.price_bars)
+        try:
+            return self.conn.execute(sql + " ORDER BY date", params).df()
+        except duckdb.CatalogException:
+            return pd.DataFrame()
+
+    def get_news(self, symbol: str, since=None, columns=None, limit=None) -> list:
+        """최신순 기사 목록. limit(기본 reader.news_limit)이면 최근 limit건만 읽습니다."""
+        sql, params = self._news_sql(symbol, since, columns, limit or self.news_limit)
+        try:
+            cur = self.conn.execute(sql, params)
+        except duckdb.CatalogException:
+            return []
+        names = [d[0] for d in cur.description]
+        return self._news_rows([dict(zip(names, row)) for row in cur.fetchall()])
+
+    def get_financials(self, symbol: str, limit=None) -> dict:
+        """재무제표별 최근 limit(기본 reader.quarters)개 기간"""
+        sql, params = self._financials_sql(symbol, limit or self.quarters)
+        try:
+            rows = self.conn.execute(sql, params).fetchall()
+        except duckdb.CatalogException:
+            return self._legacy_financials(symbol, limit or self.quarters)
+        return self._financial_rows(symbol, rows)
+
+    def _legacy_financials(self, symbol: str, limit=None) -> dict:
+        """fundamentals 테이블이 없는 예전 DB: 원본 financials 테이블(JSON)에서 같은 모양으로 읽습니다."""
+        logger.warning(f"fundamentals 테이블이 없어 원본 financials 테이블에서 {symbol} 재무 데이터를 읽습니다 "
+                       "(수집을 한 번 돌리면 backfill됩니다).")
+        sql = "SELECT statement, data FROM financials WHERE symbol = ?"
+        if limit:
+            sql += f" QUALIFY dense_rank() OVER (PARTITION BY statement ORDER BY period_end DESC) <= {int(limit)}"
+        try:
+            rows = self.conn.execute(sql + " ORDER BY statement, period_end DESC", [symbol]).fetchall()
+        except (duckdb.CatalogException, duckdb.BinderException) as e:
+            logger.warning(f"{symbol} 재무 데이터 없음: {e}")
+            return {}
+        fin_data = {}
+        for statement, data in rows:
+            fin_data.setdefault(statement, []).append(json.loads(data))
+        return fin_data
+
+    def get_bundle(self, symbol: str, start=None, end=None):
+        """(가격 DataFrame, 뉴스 목록, 재무 dict)를 쿼리 한 번으로 가져옵니다."""
+        price_sql, price_params = self._price_sql(symbol, start, end, limit=self.price_bars)
+        news_sql, news_params = self._news_sql(symbol, limit=self.news_limit)
+        fin_sql, fin_params = self._financials_sql(symbol, self.quarters)
+        try:
+            prices, news, fin = self.conn.execute(f"""
+                SELECT
+                    (SELECT list(p ORDER BY p.date) FROM ({price_sql}) p),
+                    (SELECT list(n) FROM ({news_sql}) n),
+                    (SELECT list(f) FROM ({fin_sql}) f)
+            """, price_params + news_params + fin_params).fetchone()
+        except duckdb.CatalogException as e:
+            # 뉴스/재무 테이블이 아직 없는 DB 등 → 데이터셋별 조회로 (없는 쪽은 빈 값)
+            logger.warning(f"{symbol} 일괄 조회 실패, 개별 조회로 전환: {e}")
+            return self.get_price_data(symbol, start, end), self.get_news(symbol), self.get_financials(symbol)
+
+        price_df = pd.DataFrame(prices or [])
+        if "date" in price_df:
+            price_df["date"] = pd.to_datetime(price_df["date"])
+        fin_rows = [(f["statement"], f["period_end"], f["period"], f["metric"], f["value"]) for f in fin or []]
+        return price_df, self._news_rows(news), self._financial_rows(symbol, fin_rows)
@@ -0,0 +1,155 @@
+import copy
+import json
+import multiprocessing
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, time as dtime
+from zoneinfo import ZoneInfo
+
+import duckdb
+from omegaconf import open_dict
+
+from src.data.connection import close_connection, get_connection
+from src.data.ingest import run_ingestion
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+MARKET_TZ = "America/New_York"
+
+
+def is_market_hours(now: datetime = None, tz: str = MARKET_TZ, open_at: str = "09:30", close_at: str = "16:00",
+                    holidays=()) -> bool:
+    """
+    미국 정규장 시간(평일 09:30~16:00 ET)인지. holidays("YYYY-MM-DD" 목록)에 든 날은 휴장으로 봅니다.
+    조기 폐장(13:00)은 구분하지 않으므로 그날 오후는 장중 간격으로 수집합니다.
+    """
+    now = (now or datetime.now(ZoneInfo(tz))).astimezone(ZoneInfo(tz))
+    if now.weekday() >= 5 or now.date().isoformat() in set(holidays or ()):
+        return False
+    return dtime.fromisoformat(open_at) <= now.time() < dtime.fromisoformat(close_at)
+
+
+def refresh_interval(cfg, now: datetime = None) -> float:
+    """장중이면 refresh.market_minutes, 장외/주말/휴장일이면 refresh.off_hours_minutes 간격(초)"""
+    r = cfg.refresh
+    market = is_market_hours(now, r.timezone, r.market_open, r.market_close, r.get("holidays") or ())
+    return 60 * (r.market_minutes if market else r.off_hours_minutes)
+
+
+def trigger_path(db_path: str) -> str:
+    return db_path + ".refresh"
+
+
+def status_path(db_path: str) -> str:
+    return db_path + ".refresh.json"
+
+
+def request_refresh(db_path: str):
+    """실행 중인 데몬에 즉시 새로고침을 요청합니다 (트리거 파일 생성)."""
+    with open(trigger_path(db_path), "w", encoding="utf-8") as f:
+        f.write(datetime.now().isoformat())
+
+
+def read_status(db_path: str) -> dict:
+    try:
+        with open(status_path(db_path), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _remove(*paths):
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def _ingest_staging(cfg, staging: str) -> dict:
+    report = run_ingestion(cfg, staging)
+    get_connection(staging).execute("CHECKPOINT")
+    close_connection(staging)
+    return report
+
+
+def refresh_once(cfg, db_path: str) -> dict:
+    """
+    현재 DB를 staging 파일로 복사해 그 위에서 증분 수집을 돌리고, 끝나면 os.replace로 원자적으로 교체합니다.
+    읽는 쪽(앱)은 수집 중에도 예전 파일을 그대로 읽고, 교체 후 새 연결부터 새 데이터를 봅니다.
+    모든 수집 작업이 실패하면 교체하지 않습니다.
+    """
+    staging = db_path + ".staging"
+    _remove(staging, staging + ".wal")
+    if os.path.exists(db_path):
+        shutil.copy2(db_path, staging)
+        if os.path.exists(db_path + ".wal"):
+            shutil.copy2(db_path + ".wal", staging + ".wal")
+
+    run_cfg = copy.deepcopy(cfg)
+    with open_dict(run_cfg):
+        run_cfg.ingestion.mode = "incremental"
+
+    start = time.perf_counter()
+    # 수집은 별도 프로세스에서: 끝나면 DataManager를 포함한 staging 파일의 모든 핸들이 확실히 닫힌 뒤 교체됩니다.
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        report = pool.submit(_ingest_staging, run_cfg, staging).result()
+
+    swapped = bool(report["ok"]) or not report["failed"]
+    if swapped:
+        os.replace(staging, db_path)
+        # 예전 파일의 WAL이 새 파일에 재생되지 않도록 제거
+        _remove(db_path + ".wal", staging + ".wal")
+    else:
+        logger.error("모든 수집 작업이 실패해 DB를 교체하지 않습니다.")
+        _remove(staging, staging + ".wal")
+
+    status = {
+        "last_run": datetime.now().isoformat(timespec="seconds"),
+        "elapsed": time.perf_counter() - start,
+        "swapped": swapped,
+        "changed": sum(1 for _, _, count, _ in report.get("changes", []) if count),
+        "failed": len(report["failed"]),
+    }
+    with open(status_path(db_path), "w", encoding="utf-8") as f:
+        json.dump(status, f, ensure_ascii=False)
+    report["status"] = status
+    return report
+
+
+def freshness(conn):
+    """sync_state 기준 종목 × 데이터셋별 마지막 데이터 시점과 수집 시각 (테이블이 없으면 빈 목록)"""
+    try:
+        return conn.execute("""
+            SELECT symbol, dataset, high_water, updated_at
+            FROM sync_state
+            ORDER BY symbol, dataset
+        """).fetchall()
+    except duckdb.CatalogException:
+        return []
+
+
+def run_daemon(cfg, db_path: str, once: bool = False):
+    """
+    일정 간격(장중/장외 다르게)으로 refresh_once를 반복합니다.
+    대기 중에는 poll_seconds마다 트리거 파일을 확인해, 앱에서 요청하면 바로 새로고침합니다.
+    """
+    while True:
+        try:
+            report = refresh_once(cfg, db_path)
+            s = report["status"]
+            logger.info(f"새로고침 완료: 변경 {s['changed']}건, 실패 {s['failed']}건 ({s['elapsed']:.1f}s)")
+        except Exception as e:
+            logger.error(f"새로고침 실패: {e}")
+        if once:
+            return
+
+        deadline = time.monotonic() + refresh_interval(cfg)
+        logger.info(f"다음 새로고침까지 {(deadline - time.monotonic()) / 60:.0f}분 대기")
+        while time.monotonic() < deadline:
+            if os.path.exists(trigger_path(db_path)):
+                _remove(trigger_path(db_path))
+                logger.info("새로고침 요청 감지")
+                break
+            time.sleep(cfg.refresh.poll_seconds)
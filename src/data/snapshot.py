@@ -0,0 +1,105 @@
+import json
+import threading
+from datetime import datetime
+
+import duckdb
+
+from src.analysis.incremental import IncrementalTechnicals
+from src.analysis.fundamental import FundamentalAnalyzer
+from src.analysis.sentiment import SentimentAnalyzer
+from src.agent.llm_client import LLMClient
+from src.data.fundamentals import FundamentalsEngine
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class SnapshotStore:
+    """
+    종목별 기술적/재무/(선택) 감성 분석 결과를 미리 계산해 두는 analysis_snapshot 테이블.
+    data_version은 sync_state의 high-water mark로 만든 해시라서, 수집 후 원천 데이터가 바뀌면
+    예전 스냅샷은 자동으로 무시됩니다.
+    """
+
+    def __init__(self, conn, read_only: bool = False):
+        self.conn = conn
+        self._lock = threading.Lock()
+        if read_only:
+            return
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS analysis_snapshot (
+                symbol VARCHAR PRIMARY KEY,
+                data_version VARCHAR,
+                computed_at TIMESTAMP,
+                tech VARCHAR,
+                fund VARCHAR,
+                senti VARCHAR
+            )
+        """)
+
+    def data_version(self, symbol: str) -> str:
+        try:
+            row = self.conn.execute("""
+                SELECT md5(coalesce(string_agg(
+                    dataset || ':' || coalesce(CAST(high_water AS VARCHAR), '') || ':' || rows_total,
+                    '|' ORDER BY dataset
+                ), ''))
+                FROM sync_state WHERE symbol = ?
+            """, [symbol]).fetchone()
+        except duckdb.CatalogException:
+            return ""
+        return row[0]
+
+    def get(self, symbol: str):
+        """현재 데이터 버전과 일치하는 스냅샷 (없거나 오래됐으면 None)"""
+        with self._lock:
+            try:
+                row = self.conn.execute(
+                    "SELECT data_version, computed_at, tech, fund, senti FROM analysis_snapshot WHERE symbol = ?",
+                    [symbol]
+                ).fetchone()
+            except duckdb.CatalogException:
+                return None
+            if row is None or row[0] != self.data_version(symbol):
+                return None
+        return {
+            "version": row[0],
+            "computed_at": row[1],
+            "tech": json.loads(row[2]),
+            "fund": row[3],
+            "senti": row[4],
+        }
+
+    def save(self, symbol: str, tech: dict, fund: str, senti: str = None):
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO analysis_snapshot VALUES (?, ?, ?, ?, ?, ?)",
+                [symbol, self.data_version(symbol), datetime.now(), json.dumps(tech, ensure_ascii=False), fund, senti]
+            )
+
+
+def materialize_snapshots(cfg, db, conn, symbols: list) -> int:
+    """
+    수집 직후 호출됩니다. 기술적 지표는 증분 상태에서, 재무 지표는 전 종목 한 번의 SQL로 계산하고,
+    snapshot.include_sentiment이면 감성 분석까지 스냅샷에 저장합니다.
+    """
+    store = SnapshotStore(conn)
+    technicals = IncrementalTechnicals(conn)
+    analyzer = FundamentalAnalyzer()
+    screened = {row["symbol"]: row for row in FundamentalsEngine(conn).screen(symbols).to_dict("records")}
+    sentiment = SentimentAnalyzer.from_config(cfg, LLMClient.from_config(cfg), conn) if cfg.snapshot.include_sentiment else None
+
+    count = 0
+    for symbol in symbols:
+        try:
+            tech = technicals.get(symbol)
+            if symbol in screened:
+                fund = analyzer.analyze_row(screened[symbol])
+            else:
+                fund = analyzer.analyze(db.get_financials(symbol))
+            senti = sentiment.analyze(db.get_news(symbol), symbol) if sentiment else None
+            store.save(symbol, tech, fund, senti)
+            count += 1
+        except Exception as e:
+            logger.error(f"{symbol} 스냅샷 생성 실패: {e}")
+    return count
@@ -0,0 +1,109 @@
+from datetime import datetime
+
+import duckdb
+import pandas as pd
+
+
+def _to_timestamp(value):
+    """문자열/날짜/타임존 포함 값을 타임존 없는 UTC Timestamp로 통일"""
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is not None:
+        ts = ts.tz_convert("UTC").tz_localize(None)
+    return ts
+
+
+class SyncState:
+    """
+    종목 × 데이터셋(prices/news/financials)별 마지막 수집 시점(high-water mark)을 저장합니다.
+    증분 동기화는 이 시점 이후의 데이터만 요청하고 저장합니다.
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS sync_state (
+                symbol VARCHAR,
+                dataset VARCHAR,
+                high_water TIMESTAMP,
+                rows_total BIGINT,
+                updated_at TIMESTAMP,
+                PRIMARY KEY (symbol, dataset)
+            )
+        """)
+
+    def get(self, symbol: str, dataset: str):
+        row = self.conn.execute(
+            "SELECT high_water FROM sync_state WHERE symbol = ? AND dataset = ?", [symbol, dataset]
+        ).fetchone()
+        return pd.Timestamp(row[0]) if row and row[0] is not None else None
+
+    def advance(self, symbol: str, dataset: str, high_water, added_rows: int, rows_total: int = None):
+        """
+        high-water mark를 올리고 누적 건수에 added_rows를 더합니다.
+        rows_total을 주면(전체 재수집) 더하지 않고 저장된 건수로 덮어씁니다.
+        """
+        total = "sync_state.rows_total + excluded.rows_total" if rows_total is None else "excluded.rows_total"
+        self.conn.execute(f"""
+            INSERT INTO sync_state VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (symbol, dataset) DO UPDATE SET
+                high_water = greatest(sync_state.high_water, excluded.high_water),
+                rows_total = {total},
+                updated_at = excluded.updated_at
+        """, [symbol, dataset, high_water, added_rows if rows_total is None else rows_total, datetime.now()])
+
+
+def stored_rows(conn, symbol: str, dataset: str, price_table: str = "prices", news_table: str = "news"):
+    """데이터셋별로 DB에 저장된 종목 건수 (재무는 재무제표 × 기간 수). 테이블이 없으면 None"""
+    sql = {
+        "prices": f'SELECT count(*) FROM "{price_table}" WHERE symbol = ?',
+        "news": f'SELECT count(*) FROM "{news_table}" WHERE symbol = ?',
+        "financials": "SELECT count(DISTINCT (statement, period_end)) FROM fundamentals WHERE symbol = ?",
+    }[dataset]
+    try:
+        return conn.execute(sql, [symbol]).fetchone()[0]
+    except duckdb.CatalogException:
+        return None
+
+
+def new_price_rows(df: pd.DataFrame, since):
+    """since 이후 봉만 남기고 (남은 봉, 새 high-water mark)를 반환"""
+    if df is None or df.empty:
+        return df, None
+    dates = pd.to_datetime(df["date"])
+    if since is not None:
+        df, dates = df[dates > since], dates[dates > since]
+    return df, (dates.max() if len(df) else None)
+
+
+def new_news_items(news: list, since):
+    """since 이후 발행된 기사만 남기고 (기사 목록, 새 high-water mark)를 반환"""
+    fresh, mark = [], None
+    for item in news or []:
+        published = item.get("published_utc")
+        if not published:
+            continue
+        ts = _to_timestamp(published)
+        if since is None or ts > since:
+            fresh.append(item)
+            mark = ts if mark is None or ts > mark else mark
+    return fresh, mark
+
+
+def new_financial_statements(fin_data: dict, since):
+    """카테고리별 재무제표 목록에서 since 이후 기간만 남기고 (dict, 새 high-water mark, 건수)를 반환"""
+    fresh, mark, count = {}, None, 0
+    for category, statements in (fin_data or {}).items():
+        if not isinstance(statements, list):
+            fresh[category] = statements
+            continue
+        kept = []
+        for stmt in statements:
+            period = stmt.get("date") if isinstance(stmt, dict) else None
+            ts = _to_timestamp(period) if period else None
+            if since is None or (ts is not None and ts > since):
+                kept.append(stmt)
+                if ts is not None and (mark is None or ts > mark):
+                    mark = ts
+        fresh[category] = kept
+        count += len(kept)
+    return fresh, mark, count
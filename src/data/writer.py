@@ -0,0 +1,68 @@
+import json
+import threading
+
+import pandas as pd
+
+
+class TableWriter:
+    """
+    DataManager와 같은 save_prices/save_news/save_financials 인터페이스로
+    prices · news · financials(원본 JSON) 테이블에 종목 단위로 upsert하는 최소 writer.
+    DataManager 없이 수집 경로 전체를 돌려야 하는 벤치마크/테스트에서 run_ingestion(db=...)으로 넘깁니다.
+    """
+
+    def __init__(self, conn, price_table: str = "prices", news_table: str = "news"):
+        self.conn = conn
+        self.price_table = price_table
+        self.news_table = news_table
+        self._lock = threading.Lock()
+        self.conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS "{price_table}" (
+                symbol VARCHAR, date DATE, open DOUBLE, high DOUBLE, low DOUBLE, close DOUBLE, volume BIGINT,
+                PRIMARY KEY (symbol, date)
+            )
+        """)
+        self.conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS "{news_table}" (
+                symbol VARCHAR, id VARCHAR, title VARCHAR, published_utc VARCHAR,
+                description VARCHAR, article_url VARCHAR,
+                PRIMARY KEY (symbol, id)
+            )
+        """)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS financials (
+                symbol VARCHAR, statement VARCHAR, period_end DATE, data JSON,
+                PRIMARY KEY (symbol, statement, period_end)
+            )
+        """)
+
+    def save_prices(self, df: pd.DataFrame, symbol: str):
+        if df is None or df.empty:
+            return
+        frame = df.assign(symbol=symbol, date=pd.to_datetime(df["date"]).dt.date)
+        with self._lock:
+            self.conn.register("_new_prices", frame)
+            try:
+                self.conn.execute(f'INSERT OR REPLACE INTO "{self.price_table}" BY NAME SELECT * FROM _new_prices')
+            finally:
+                self.conn.unregister("_new_prices")
+
+    def save_news(self, news: list, symbol: str):
+        rows = [
+            [symbol, str(n.get("id") or n.get("article_url") or n.get("title")), n.get("title"),
+             n.get("published_utc"), n.get("description"), n.get("article_url")]
+            for n in news or []
+        ]
+        if rows:
+            with self._lock:
+                self.conn.executemany(f'INSERT OR REPLACE INTO "{self.news_table}" VALUES (?, ?, ?, ?, ?, ?)', rows)
+
+    def save_financials(self, symbol: str, fin_data: dict):
+        rows = [
+            [symbol, statement, str(item["date"])[:10], json.dumps(item, default=str)]
+            for statement, items in (fin_data or {}).items() if isinstance(items, list)
+            for item in items if isinstance(item, dict) and item.get("date")
+        ]
+        if rows:
+            with self._lock:
+                self.conn.executemany("INSERT OR REPLACE INTO financials VALUES (?, ?, ?, ?)", rows)
@@ -0,0 +1,175 @@
+import os
+import json
+import queue
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from src.analysis.technical import TechnicalAnalyzer
+from src.analysis.sentiment import SentimentAnalyzer
+from src.analysis.fundamental import FundamentalAnalyzer
+from src.agent.quant_agent import QuantAgent
+from src.agent.llm_cache import LLMCache
+from src.agent.llm_client import LLMClient
+from src.data.connection import get_connection
+from src.data.reader import MarketReader
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_STOP = object()
+
+# 프로세스 풀 워커마다 하나씩 여는 읽기 전용 reader (_init_worker에서 설정)
+_worker_reader = None
+
+
+def load_symbols(cfg, base_dir: str) -> list:
+    """
+    배치 대상 종목 목록을 반환합니다.
+    batch.symbols_file이 지정되면 파일(한 줄에 한 종목, '#' 주석 허용)을, 아니면 cfg.symbols를 사용합니다.
+    """
+    path = cfg.batch.get("symbols_file")
+    if not path:
+        return [s.upper() for s in cfg.symbols]
+
+    if not os.path.isabs(path):
+        path = os.path.join(base_dir, path)
+
+    symbols = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.split("#", 1)[0].strip()
+            if line:
+                symbols.append(line.upper())
+    return list(dict.fromkeys(symbols))
+
+
+def _init_worker(db_path, reader_cfg):
+    """워커 프로세스 시작 시 자기 읽기 전용 연결과 reader를 만듭니다."""
+    global _worker_reader
+    _worker_reader = MarketReader(get_connection(db_path, read_only=True), **reader_cfg)
+
+
+def _run_cpu_stages(symbol):
+    """
+    DB 읽기 + CPU 바운드 단계 (기술적 + 재무 분석). 프로세스 풀 워커에서 실행되므로
+    종목별 읽기도 워커 수만큼 동시에 진행됩니다. 데이터가 없으면 None을 반환합니다.
+    """
+    price_df, news_list, fin_data = _worker_reader.get_bundle(symbol)
+    if price_df.empty:
+        return None
+    tech_res = TechnicalAnalyzer().analyze(price_df)
+    fund_res = FundamentalAnalyzer().analyze(fin_data)
+    return news_list, tech_res, fund_res
+
+
+def _llm_worker(jobs, sentiment, agent, report_dir, results, lock):
+    """LLM 바운드 단계 (감성 분석 + 리포트 생성) 소비자 스레드"""
+    while True:
+        job = jobs.get()
+        if job is _STOP:
+            jobs.task_done()
+            return
+
+        symbol, news_list, tech_res, fund_res = job
+        try:
+            senti_res = sentiment.analyze(news_list, symbol)
+            report = agent.generate_report(
+                symbol,
+                tech_res,
+                senti_res,
+                fund_res
+            )
+            report_path = os.path.join(report_dir, f"{symbol}.md")
+            with open(report_path, "w", encoding="utf-8") as f:
+                f.write(f"# 📈 {symbol} 투자 분석 리포트\n\n{report}\n")
+            status = {"status": "ok", "report": report_path}
+        except Exception as e:
+            logger.error(f"{symbol} 리포트 생성 실패: {e}")
+            status = {"status": "error", "error": str(e)}
+
+        with lock:
+            results[symbol] = status
+        jobs.task_done()
+
+
+def run_batch(cfg, db_path: str, output_dir: str, base_dir: str) -> dict:
+    """
+    여러 종목을 한 번의 실행으로 분석합니다.
+    DB 읽기와 CPU 단계는 spawn 프로세스 풀에서 워커별 읽기 전용 연결로 처리하고,
+    LLM 단계는 크기가 제한된 큐를 통해 llm_concurrency개의 스레드로 처리합니다.
+    여러 프로세스가 같은 DB 파일을 열 수 있도록 메인 프로세스도 읽기 전용으로 엽니다
+    (batched 감성 모드는 수집 때 저장된 기사 점수만 사용).
+    """
+    symbols = load_symbols(cfg, base_dir)
+    report_dir = os.path.join(output_dir, "reports")
+    os.makedirs(report_dir, exist_ok=True)
+
+    print(f"🚀 배치 분석 시작: {len(symbols)}개 종목 → {report_dir}")
+
+    r = cfg.reader
+    reader_cfg = {
+        "price_table": r.price_table, "news_table": r.news_table,
+        "price_bars": r.price_bars, "news_limit": r.news_limit, "quarters": r.quarters,
+    }
+    # 스레드를 띄우기 전에, fork가 아닌 spawn으로 풀을 만들어 락을 쥔 채 복제되는 일을 막습니다.
+    pool = ProcessPoolExecutor(
+        max_workers=cfg.batch.cpu_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(db_path, reader_cfg),
+    )
+
+    llm = LLMClient.from_config(cfg, LLMCache.from_config(cfg, base_dir))
+    sentiment = SentimentAnalyzer.from_config(cfg, llm, get_connection(db_path, read_only=True), read_only=True)
+    agent = QuantAgent.from_config(cfg, llm)
+
+    results = {}
+    lock = threading.Lock()
+    llm_concurrency = max(1, cfg.batch.llm_concurrency)
+    jobs = queue.Queue(maxsize=llm_concurrency * 2)
+
+    workers = [
+        threading.Thread(
+            target=_llm_worker,
+            args=(jobs, sentiment, agent, report_dir, results, lock),
+            daemon=True
+        )
+        for _ in range(llm_concurrency)
+    ]
+    for w in workers:
+        w.start()
+
+    with pool:
+        futures = {pool.submit(_run_cpu_stages, symbol): symbol for symbol in symbols}
+        for fut in as_completed(futures):
+            symbol = futures[fut]
+            try:
+                staged = fut.result()
+            except Exception as e:
+                logger.error(f"{symbol} 분석 실패: {e}")
+                with lock:
+                    results[symbol] = {"status": "error", "error": str(e)}
+                continue
+            if staged is None:
+                print(f"  ⚠️ {symbol}: 데이터 없음, 건너뜁니다.")
+                with lock:
+                    results[symbol] = {"status": "no_data"}
+                continue
+            # 큐가 가득 차면 여기서 대기 → LLM 단계가 밀릴 때 자연스럽게 배압이 걸립니다.
+            jobs.put((symbol, *staged))
+
+    for _ in workers:
+        jobs.put(_STOP)
+    for w in workers:
+        w.join()
+
+    summary_path = os.path.join(output_dir, "batch_summary.json")
+    with open(summary_path, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+
+    if llm.cache is not None:
+        print(f"💾 LLM 캐시: {llm.cache.stats()}")
+    ok = sum(1 for r in results.values() if r["status"] == "ok")
+    print(f"✅ 배치 분석 완료: {ok}/{len(symbols)} 종목 성공 (요약: {summary_path})")
+    return results
@@ -0,0 +1,164 @@
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
+from src.analysis.technical import TechnicalAnalyzer
+from src.analysis.fundamental import FundamentalAnalyzer
+from src.utils.logger import get_logger
+from src.utils.tracing import span
+
+logger = get_logger(__name__)
+
+
+class StageResult:
+    def __init__(self, name, value, status, elapsed, error=None):
+        self.name = name
+        self.value = value
+        self.status = status
+        self.elapsed = elapsed
+        self.error = error
+
+    def __repr__(self):
+        return f"StageResult({self.name}, {self.status}, {self.elapsed:.2f}s)"
+
+
+class _Stage:
+    def __init__(self, name, fn, args, timeout, fallback):
+        self.name = name
+        self.fn = fn
+        self.args = args
+        self.timeout = timeout
+        self.fallback = fallback
+        self.started = None
+        self.finished = None
+
+    def __call__(self):
+        self.started = time.perf_counter()
+        try:
+            with span(f"analyze.{self.name}"):
+                return self.fn(*self.args)
+        finally:
+            self.finished = time.perf_counter()
+
+
+class AnalysisPipeline:
+    """
+    서로 의존성이 없는 분석 단계들을 스레드 풀에서 동시에 실행합니다.
+    단계별 타임아웃(단계가 워커에서 시작된 시점부터)이 지나거나 예외가 나면 fallback 값으로 대체하고,
+    각 단계의 상태와 소요 시간을 StageResult로 돌려줍니다.
+    """
+
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers
+        self.stages = []
+        self._cancelled = threading.Event()
+
+    def add_stage(self, name, fn, *args, timeout=None, fallback=None):
+        self.stages.append(_Stage(name, fn, args, timeout, fallback))
+        return self
+
+    def cancel(self):
+        """아직 시작하지 않은 단계를 취소하고 대기 중인 run()을 즉시 끝냅니다."""
+        self._cancelled.set()
+
+    def run(self) -> dict:
+        results = {}
+        pool = ThreadPoolExecutor(max_workers=self.max_workers or len(self.stages) or 1)
+        submitted = time.perf_counter()
+        futures = [(stage, pool.submit(stage)) for stage in self.stages]
+
+        try:
+            for stage, fut in futures:
+                status, value, error = "ok", None, None
+                while True:
+                    if self._cancelled.is_set():
+                        fut.cancel()
+                        status, error = "cancelled", "pipeline cancelled"
+                        break
+                    # 타임아웃은 워커가 단계를 실제로 시작한 시점부터 잽니다 (큐 대기 시간은 제외).
+                    started = stage.started
+                    deadline = started + stage.timeout if stage.timeout and started is not None else None
+                    wait = 0.1 if deadline is None else min(0.1, max(0.0, deadline - time.perf_counter()))
+                    try:
+                        value = fut.result(timeout=wait)
+                        break
+                    except TimeoutError:
+                        if deadline is not None and time.perf_counter() >= deadline:
+                            fut.cancel()
+                            status, error = "timeout", f"{stage.timeout}s 초과"
+                            break
+                    except Exception as e:
+                        status, error = "error", str(e)
+                        break
+
+                if status != "ok":
+                    logger.warning(f"[{stage.name}] {status}: {error}")
+                    value = stage.fallback
+
+                if stage.started is not None:
+                    elapsed = (stage.finished or time.perf_counter()) - stage.started
+                else:
+                    elapsed = time.perf_counter() - submitted
+                results[stage.name] = StageResult(stage.name, value, status, elapsed, error)
+        finally:
+            # 시간 초과된 단계의 스레드는 끝날 때까지 기다리지 않습니다.
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        return results
+
+    @staticmethod
+    def format_timings(results: dict) -> str:
+        return ", ".join(f"{r.name} {r.elapsed:.2f}s ({r.status})" for r in results.values())
+
+
+def run_analyzers(cfg, sentiment, symbol, price_df, news_list, fin_data, llm=True):
+    """
+    기술적/감성/재무 분석을 동시에 실행하고 (tech_res, senti_res, fund_res, 단계 결과)를 반환합니다.
+    llm=False면 감성 단계는 LLM 대신 저장된 점수/헤드라인(SentimentAnalyzer.stored_summary)을 씁니다.
+    """
+    timeouts = cfg.pipeline.timeouts
+    pipeline = AnalysisPipeline(cfg.pipeline.max_workers)
+    pipeline.add_stage(
+        "technical", TechnicalAnalyzer().analyze, price_df,
+        timeout=timeouts.technical, fallback={"summary": "기술적 분석 실패"}
+    )
+    pipeline.add_stage(
+        "sentiment", sentiment.analyze if llm else sentiment.stored_summary, news_list, symbol,
+        timeout=timeouts.sentiment, fallback="감성 분석 실패 (시간 초과 또는 에러)"
+    )
+    pipeline.add_stage(
+        "fundamental", FundamentalAnalyzer().analyze, fin_data,
+        timeout=timeouts.fundamental, fallback="재무 분석 실패"
+    )
+    results = pipeline.run()
+    return (
+        results["technical"].value,
+        results["sentiment"].value,
+        results["fundamental"].value,
+        results,
+    )
+
+
+def collect_summaries(cfg, db, sentiment, snapshots, symbols):
+    """
+    비교 리포트용 종목별 요약({symbol: {"tech", "senti", "fund"}})과 데이터가 없는 종목 목록을 반환합니다.
+    snapshots(SnapshotStore)에 최신 스냅샷이 있으면 분석을 다시 돌리지 않습니다.
+    감성은 종목마다 LLM을 부르지 않고 저장된 기사 점수나 헤드라인으로 채워, 비교 리포트 한 번만 LLM을 호출합니다.
+    """
+    summaries, missing = {}, []
+    for symbol in symbols:
+        snapshot = snapshots.get(symbol) if snapshots is not None else None
+        if snapshot is not None:
+            senti = snapshot["senti"]
+            if not senti:
+                senti = sentiment.stored_summary(db.get_news(symbol), symbol)
+            summaries[symbol] = {"tech": snapshot["tech"], "senti": senti, "fund": snapshot["fund"]}
+            continue
+
+        price_df, news_list, fin_data = db.get_bundle(symbol)
+        if price_df.empty:
+            missing.append(symbol)
+            continue
+        tech, senti, fund, _ = run_analyzers(cfg, sentiment, symbol, price_df, news_list, fin_data, llm=False)
+        summaries[symbol] = {"tech": tech, "senti": senti, "fund": fund}
+    return summaries, missing
@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+
+
+def lttb(x, y, threshold: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets 다운샘플링. 선 그래프 모양(고점/저점)을 유지하면서
+    threshold개 점만 남기고, 남길 점의 인덱스 배열을 반환합니다.
+    """
+    x = np.asarray(x, dtype="float64")
+    y = np.asarray(y, dtype="float64")
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    selected = np.empty(threshold, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # 다음 버킷의 평균점 (마지막 버킷은 끝점)
+        nlo, nhi = hi, edges[i + 2] if i + 2 < len(edges) else n
+        avg_x, avg_y = x[nlo:nhi].mean(), y[nlo:nhi].mean()
+
+        area = np.abs(
+            (x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def downsample_series(series: pd.Series, max_points: int = 500) -> pd.Series:
+    """시계열(날짜 인덱스)을 화면 해상도 수준의 점 개수로 줄입니다. NaN은 제외합니다."""
+    series = series.dropna()
+    if len(series) <= max_points:
+        return series
+    index = pd.to_datetime(series.index)
+    x = index.asi8 if isinstance(index, pd.DatetimeIndex) else np.arange(len(series))
+    return series.iloc[lttb(x, series.to_numpy(), max_points)]
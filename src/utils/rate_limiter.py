@@ -1,25 +1,102 @@
 import time
+import random
+import socket
 from collections import deque
+from email.utils import parsedate_to_datetime
 from threading import Lock
 
+try:
+    import requests
+    _TRANSIENT_ERRORS = (TimeoutError, ConnectionError, socket.timeout,
+                         requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+except ImportError:
+    _TRANSIENT_ERRORS = (TimeoutError, ConnectionError, socket.timeout)
+
+
 class RateLimiter:
-    def __init__(self, max_calls: int, period: int = 60):
+    """
+    슬라이딩 윈도 방식의 호출 제한기. 어떤 period초 구간에서도 max_calls회를 넘지 않습니다.
+    대기(sleep)는 락 밖에서 하므로 여러 스레드가 같은 제한기를 공유해도 서로 막지 않습니다.
+    (제한은 프로세스 단위이므로, 같은 API 키로 여러 프로세스를 띄우면 각각 따로 계산됩니다.)
+    """
+
+    def __init__(self, max_calls: int, period: float = 60):
         self.max_calls = max_calls
         self.period = period
         self.timestamps = deque()
         self.lock = Lock()
 
     def wait(self):
-        with self.lock:
-            while True:
-                now = time.time()
-                while self.timestamps and now - self.timestamps[0] > self.period:
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                while self.timestamps and now - self.timestamps[0] >= self.period:
                     self.timestamps.popleft()
 
                 if len(self.timestamps) < self.max_calls:
                     self.timestamps.append(now)
                     return
-                
                 sleep_time = self.timestamps[0] + self.period - now
-                if sleep_time > 0:
-                    time.sleep(sleep_time + 0.1)
\ No newline at end of file
+
+            time.sleep(sleep_time)
+
+
+def _http_status(exc):
+    """requests.HTTPError(response.status_code) / urllib HTTPError(code)의 상태 코드, 없으면 None"""
+    response = getattr(exc, "response", None)
+    status = getattr(response, "status_code", None)
+    if status is None:
+        status = getattr(exc, "code", None)
+    return status if isinstance(status, int) else None
+
+
+def _retry_after(exc):
+    """429 응답의 Retry-After(초 또는 HTTP 날짜)를 초 단위로, 없으면 None"""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None) or getattr(exc, "headers", None)
+    value = headers.get("Retry-After") if headers is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def is_transient(exc) -> bool:
+    """다시 시도하면 성공할 수 있는 에러인지 (429, 5xx, 타임아웃, 연결 에러)"""
+    status = _http_status(exc)
+    if status is not None:
+        return status == 429 or status >= 500
+    if isinstance(exc, _TRANSIENT_ERRORS):
+        return True
+    # urllib.error.URLError는 원인 예외를 reason에 담습니다.
+    return isinstance(getattr(exc, "reason", None), _TRANSIENT_ERRORS)
+
+
+def call_with_retry(fn, max_retries: int = 3, backoff_base: float = 1.0, backoff_max: float = 30.0, limiter: RateLimiter = None):
+    """
+    fn을 호출하고 일시적인 에러(is_transient)면 지수 백오프(+지터)로 최대 max_retries번 재시도합니다.
+    인증/404/파싱 에러처럼 다시 해도 같은 결과인 에러는 바로 올립니다.
+    429 응답에 Retry-After가 있으면 그만큼 기다립니다. limiter가 주어지면 매 시도 전에 호출 권한을 받습니다.
+    """
+    attempt = 0
+    while True:
+        if limiter is not None:
+            limiter.wait()
+        try:
+            return fn()
+        except Exception as e:
+            if attempt >= max_retries or not is_transient(e):
+                raise
+            delay = min(backoff_max, backoff_base * (2 ** attempt)) * random.uniform(0.5, 1.0)
+            if _http_status(e) == 429:
+                retry_after = _retry_after(e)
+                if retry_after is not None:
+                    delay = retry_after
+            time.sleep(delay)
+            attempt += 1
@@ -0,0 +1,130 @@
+import json
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.utils.tokens import estimate_tokens
+
+_NUMBERED = re.compile(r"^\s*(\d+)\.\s", re.MULTILINE)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "StubOllama/1.0"
+
+    def log_message(self, *args):
+        pass
+
+    def _send_json(self, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.rstrip("/") == "/api/tags":
+            self._send_json({"models": [{"name": m, "model": m} for m in self.server.models]})
+        else:
+            self.send_error(404)
+
+    def do_POST(self):
+        if self.path.rstrip("/") != "/api/chat":
+            self.send_error(404)
+            return
+        request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        prompt = "\n".join(m.get("content", "") for m in request.get("messages", []))
+        stub = self.server.stub
+        with stub.lock:
+            stub.requests += 1
+
+        prompt_tokens = estimate_tokens(prompt)
+        prefill_start = time.perf_counter()
+        time.sleep(stub.latency_ms / 1000)
+        prefill_ns = int((time.perf_counter() - prefill_start) * 1e9)
+
+        pieces = stub.response_pieces(prompt, request.get("format"))
+        base = {"model": request.get("model", ""), "created_at": datetime.now(timezone.utc).isoformat()}
+        final = {
+            **base,
+            "message": {"role": "assistant", "content": ""},
+            "done": True,
+            "done_reason": "stop",
+            "prompt_eval_count": prompt_tokens,
+            "prompt_eval_duration": prefill_ns,
+            "eval_count": len(pieces),
+        }
+
+        if not request.get("stream", True):
+            gen_start = time.perf_counter()
+            time.sleep(stub.token_delay_ms * len(pieces) / 1000)
+            final["message"]["content"] = "".join(pieces)
+            final["eval_duration"] = int((time.perf_counter() - gen_start) * 1e9)
+            self._send_json(final)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.end_headers()
+        gen_start = time.perf_counter()
+        for piece in pieces:
+            time.sleep(stub.token_delay_ms / 1000)
+            chunk = {**base, "message": {"role": "assistant", "content": piece}, "done": False}
+            self.wfile.write((json.dumps(chunk) + "\n").encode("utf-8"))
+            self.wfile.flush()
+        final["eval_duration"] = int((time.perf_counter() - gen_start) * 1e9)
+        self.wfile.write((json.dumps(final) + "\n").encode("utf-8"))
+        self.wfile.flush()
+
+
+class StubOllamaServer:
+    """
+    ollama /api/chat, /api/tags를 흉내 내는 로컬 HTTP 서버 (벤치마크용).
+    응답은 결정론적이며, latency_ms(prefill 대기)와 token_delay_ms(토큰당 생성 지연)로 모델 속도를 흉내 냅니다.
+    format='json' 요청에는 프롬프트의 번호 목록 개수만큼 {"scores": [...]}를 돌려줍니다.
+
+        with StubOllamaServer(latency_ms=50) as stub:
+            client = ollama.Client(host=stub.url)
+    """
+
+    def __init__(self, latency_ms: float = 50, token_delay_ms: float = 2, response_tokens: int = 200,
+                 models=("gemma2:2b",), host: str = "127.0.0.1", port: int = 0):
+        self.latency_ms = latency_ms
+        self.token_delay_ms = token_delay_ms
+        self.response_tokens = response_tokens
+        self.requests = 0
+        self.lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self._server.stub = self
+        self._server.models = list(models)
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def response_pieces(self, prompt: str, fmt=None) -> list:
+        if fmt == "json":
+            count = len(_NUMBERED.findall(prompt))
+            scores = [{"i": i, "score": round(((i * 37) % 21 - 10) / 10, 1)} for i in range(1, count + 1)]
+            return [json.dumps({"scores": scores})]
+        return [f"토큰{i % 10} " for i in range(self.response_tokens)]
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
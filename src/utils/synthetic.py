@@ -0,0 +1,88 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+_WORDS = [
+    "earnings", "beat", "miss", "guidance", "raises", "cuts", "launch", "product", "lawsuit", "analyst",
+    "upgrade", "downgrade", "record", "revenue", "growth", "slows", "shares", "jump", "fall", "deal",
+]
+
+
+def synthetic_symbols(n: int) -> list:
+    return [f"SYN{i:03d}" for i in range(n)]
+
+
+class SyntheticPolygonFetcher:
+    """
+    PolygonFetcher와 같은 인터페이스로 결정론적인 가짜 주가(기하 브라운 운동)와 뉴스를 돌려줍니다.
+    벤치마크에서 API 키와 네트워크 없이 수집 경로 전체를 돌리기 위한 것입니다.
+    """
+
+    def __init__(self, seed: int = 0, news_per_symbol: int = 100):
+        self.seed = seed
+        self.news_per_symbol = news_per_symbol
+
+    def _rng(self, symbol: str, salt: int):
+        return np.random.default_rng([self.seed, salt, *symbol.encode()])
+
+    def fetch_prices(self, symbol: str, start: str, end: str) -> pd.DataFrame:
+        dates = pd.bdate_range(start, end)
+        rng = self._rng(symbol, 1)
+        returns = rng.normal(0.0004, 0.02, len(dates))
+        close = 100 * np.exp(np.cumsum(returns))
+        spread = np.abs(rng.normal(0, 0.01, len(dates))) * close
+        return pd.DataFrame({
+            "date": dates.date,
+            "open": np.round(close * (1 + rng.normal(0, 0.003, len(dates))), 4),
+            "high": np.round(close + spread, 4),
+            "low": np.round(close - spread, 4),
+            "close": np.round(close, 4),
+            "volume": rng.integers(1_000_000, 50_000_000, len(dates)),
+        })
+
+    def fetch_news(self, symbol: str) -> list:
+        rng = self._rng(symbol, 2)
+        now = pd.Timestamp(date.today(), tz="UTC")
+        news = []
+        for i in range(self.news_per_symbol):
+            words = rng.choice(_WORDS, size=6)
+            published = now - pd.Timedelta(minutes=int(rng.integers(0, 60 * 24 * 30)))
+            news.append({
+                "id": f"{symbol}-{i}",
+                "title": f"{symbol} " + " ".join(words),
+                "published_utc": published.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "tickers": [symbol],
+                "description": " ".join(rng.choice(_WORDS, size=20)),
+                "article_url": f"https://example.com/{symbol}/{i}",
+            })
+        return news
+
+
+class SyntheticFMPFetcher:
+    """FMPFetcher.fetch_all과 같은 모양(카테고리별 분기 재무제표 목록)의 가짜 재무 데이터"""
+
+    def __init__(self, seed: int = 0, quarters: int = 8):
+        self.seed = seed
+        self.quarters = quarters
+
+    def fetch_all(self, symbol: str) -> dict:
+        rng = np.random.default_rng([self.seed, 3, *symbol.encode()])
+        # 분기 시작일 하루 전 = 직전 분기 말
+        periods = (pd.date_range(end=pd.Timestamp(date.today()), periods=self.quarters, freq="QS") - pd.Timedelta(days=1))[::-1]
+        revenue = 1e10 * np.cumprod(1 + rng.normal(0.02, 0.05, self.quarters))
+        margin = rng.uniform(0.05, 0.3, self.quarters)
+
+        income, balance, ratios = [], [], []
+        for p, rev, m in zip(periods, revenue, margin):
+            day = p.strftime("%Y-%m-%d")
+            period = f"Q{p.quarter}"
+            income.append({"date": day, "period": period, "symbol": symbol,
+                           "revenue": float(rev), "netIncome": float(rev * m)})
+            balance.append({"date": day, "period": period, "symbol": symbol,
+                            "totalAssets": float(rev * 4), "totalLiabilities": float(rev * 2)})
+            ratios.append({"date": day, "period": period, "symbol": symbol,
+                           "priceEarningsRatio": float(rng.uniform(8, 60)),
+                           "returnOnEquity": float(rng.uniform(0.02, 0.4)),
+                           "debtRatio": float(rng.uniform(0.1, 0.8))})
+        return {"income_statement": income, "balance_sheet": balance, "cash_flow": [], "ratios": ratios}
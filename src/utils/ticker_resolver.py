@@ -0,0 +1,259 @@
+import csv
+import os
+import re
+from collections import deque
+from functools import lru_cache
+
+_TICKER_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "config", "tickers"
+)
+DEFAULT_ALIAS_PATH = os.path.join(_TICKER_DIR, "aliases.csv")
+DEFAULT_STOPWORD_PATH = os.path.join(_TICKER_DIR, "stopwords.txt")
+
+_TOKEN_RE = re.compile(r"[0-9a-z가-힣.&'-]+")
+
+# 한글 별칭 뒤에 붙어도 되는 조사/말 ('애플은', '테슬라랑', '엔비디아주가는')
+_SUFFIXES = (
+    "은", "는", "이", "가", "을", "를", "의", "에", "에서", "에게", "한테", "와", "과", "랑", "이랑",
+    "하고", "도", "만", "로", "으로", "보다", "처럼", "부터", "까지", "나", "이나", "요", "야", "이야",
+    "주가", "주식", "실적", "전망", "분석", "뉴스",
+)
+
+
+def _is_hangul(ch: str) -> bool:
+    return "가" <= ch <= "힣"
+
+
+def _to_jamo(text: str) -> str:
+    """한글 음절을 초성/중성/종성으로 분해합니다 ('에플'과 '애플'의 거리가 1이 되도록)."""
+    out = []
+    for ch in text:
+        if _is_hangul(ch):
+            code = ord(ch) - 0xAC00
+            out.append(chr(0x1100 + code // 588))
+            out.append(chr(0x1161 + (code % 588) // 28))
+            if code % 28:
+                out.append(chr(0x11A7 + code % 28))
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def _is_suffix(rest: str) -> bool:
+    """rest가 비었거나 조사/접미어의 연속인지"""
+    if not rest:
+        return True
+    return any(rest.startswith(sfx) and _is_suffix(rest[len(sfx):]) for sfx in _SUFFIXES)
+
+
+def _hangul_token_end(text: str, i: int) -> int:
+    """text[i:]에서 이어지는 한글 음절이 끝나는 위치"""
+    while i < len(text) and _is_hangul(text[i]):
+        i += 1
+    return i
+
+
+def _deletes(word: str, depth: int) -> set:
+    """word에서 최대 depth개 문자를 지운 모든 문자열 (SymSpell 방식 후보 인덱스 키)"""
+    result = {word}
+    frontier = {word}
+    for _ in range(depth):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        result |= frontier
+    return result
+
+
+def _edit_distance(a: str, b: str) -> int:
+    """인접 전치를 포함한 편집 거리 (Optimal String Alignment)"""
+    prev2, prev = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+        prev2, prev = prev, cur
+    return prev[-1]
+
+
+class TickerResolver:
+    """
+    별칭 → 티커 인덱스. 정확 일치는 Aho–Corasick 오토마톤으로 입력을 한 번만 훑어 찾고,
+    일치가 없을 때만 삭제 이웃(deletion neighborhood) 인덱스로 오타('테슬러', 'nvidai')를 보정합니다.
+    영문 별칭/티커는 단어 경계에서만, 한글 별칭은 어절 첫머리에서 조사가 붙을 때만('애플은') 일치합니다
+    ('파인애플', '인텔리전스'는 일치하지 않음).
+    오타 보정은 stopwords(일반 단어)를 건너뛰고, 여러 단어로 된 입력에서는 긴 단어(한글 3음절, 영문 6자 이상)만 보정합니다.
+    """
+
+    def __init__(self, aliases: dict, max_edit_distance: int = 1, stopwords=()):
+        self.max_edit_distance = max_edit_distance
+        self.stopwords = frozenset(stopwords)
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+        self._fuzzy = {}
+        self._fuzzy_target = {}
+
+        for alias, ticker in aliases.items():
+            self._add(alias, ticker)
+            key = _to_jamo(alias)
+            if self._fuzzy_eligible(alias):
+                self._fuzzy_target[key] = ticker
+                for d in _deletes(key, max_edit_distance):
+                    self._fuzzy.setdefault(d, set()).add(key)
+        self._build()
+
+    @classmethod
+    def from_file(cls, path: str = DEFAULT_ALIAS_PATH, max_edit_distance: int = 1,
+                  stopword_path: str = DEFAULT_STOPWORD_PATH):
+        """
+        ticker,alias 형식의 CSV (한 줄에 별칭 하나). 티커 자체도 별칭으로 등록됩니다.
+        stopword_path는 한 줄에 단어 하나 (# 주석, 파일이 없으면 무시).
+        """
+        aliases = {}
+        with open(path, encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                ticker = row["ticker"].strip().upper()
+                alias = row["alias"].strip().lower()
+                if ticker:
+                    aliases.setdefault(ticker.lower(), ticker)
+                if ticker and alias:
+                    aliases.setdefault(alias, ticker)
+        stopwords = []
+        if stopword_path and os.path.exists(stopword_path):
+            with open(stopword_path, encoding="utf-8") as f:
+                stopwords = [w.strip().lower() for w in f if w.strip() and not w.startswith("#")]
+        return cls(aliases, max_edit_distance, stopwords)
+
+    @staticmethod
+    def _fuzzy_eligible(word: str, strict: bool = False) -> bool:
+        # 짧은 영문(티커 'KO', 'V' 등)은 오타 보정 대상에서 제외.
+        # strict(여러 단어 입력)면 'like'→nike, '일본'→일론 같은 일반 단어 오보정을 막기 위해 더 길어야 함
+        if any(_is_hangul(ch) for ch in word):
+            return len(word) >= (3 if strict else 2)
+        return len(word) >= (6 if strict else 4)
+
+    def _add(self, alias: str, ticker: str):
+        node = 0
+        for ch in alias:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append((alias, ticker))
+
+    def _build(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                f = self._fail[node]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[nxt] = self._goto[f][ch] if node and ch in self._goto[f] else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def _exact_matches(self, text: str) -> list:
+        """
+        (시작 위치, 별칭, 티커) 목록. 영문 별칭은 앞뒤가 영숫자가 아닐 때만,
+        한글 별칭은 어절 첫머리에서 시작하고 뒤에 조사/접미어만 붙을 때만 인정합니다.
+        """
+        matches = []
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(ch, 0)
+            for alias, ticker in self._out[node]:
+                start = i - len(alias) + 1
+                before = text[start - 1] if start > 0 else " "
+                after = text[i + 1] if i + 1 < len(text) else " "
+                if _is_hangul(alias[0]):
+                    if _is_hangul(before) or before.isascii() and before.isalnum():
+                        continue
+                    if _is_hangul(alias[-1]) and not _is_suffix(text[i + 1:_hangul_token_end(text, i + 1)]):
+                        continue
+                elif before.isascii() and before.isalnum() or after.isascii() and after.isalnum():
+                    continue
+                matches.append((start, alias, ticker))
+        return matches
+
+    def _fuzzy_lookup(self, token: str):
+        """편집 거리 max_edit_distance 이내의 가장 가까운 별칭의 티커 (없으면 None)"""
+        key = _to_jamo(token)
+        best = None
+        for d in _deletes(key, self.max_edit_distance):
+            for candidate in self._fuzzy.get(d, ()):
+                dist = _edit_distance(key, candidate)
+                if dist <= self.max_edit_distance and (best is None or (dist, -len(candidate)) < best[:2]):
+                    best = (dist, -len(candidate), self._fuzzy_target[candidate])
+        return best[2] if best else None
+
+    def _fuzzy_matches(self, text: str) -> list:
+        found = []
+        tokens = list(_TOKEN_RE.finditer(text))
+        strict = len(tokens) > 1
+        for m in tokens:
+            token = m.group()
+            candidates = [token]
+            if _is_hangul(token[-1]):
+                # '테슬러는', '테슬러주가'처럼 조사/접미어가 붙은 경우
+                candidates += [token[:k] for k in range(len(token) - 1, 1, -1) if _is_suffix(token[k:])]
+            for cand in candidates:
+                if cand in self.stopwords:
+                    break
+                if not self._fuzzy_eligible(cand, strict):
+                    continue
+                ticker = self._fuzzy_lookup(cand)
+                if ticker:
+                    found.append((m.start(), cand, ticker))
+                    break
+        return found
+
+    def _matches(self, text: str) -> list:
+        matches = self._exact_matches(text) or self._fuzzy_matches(text)
+        # 같은 위치에서는 긴 별칭 우선, 겹치는 짧은 일치는 버림
+        matches.sort(key=lambda m: (m[0], -len(m[1])))
+        result, end = [], -1
+        for start, alias, ticker in matches:
+            if start >= end:
+                result.append(ticker)
+                end = start + len(alias)
+        return result
+
+    def resolve(self, user_input: str) -> str:
+        """
+        사용자 입력(자연어)에서 티커를 추론합니다. 찾지 못하면 입력을 대문자로 그대로 반환합니다.
+        """
+        text = user_input.lower().strip()
+        matches = self._matches(text)
+        return matches[0] if matches else text.upper()
+
+    def resolve_all(self, user_input: str) -> list:
+        """입력에 언급된 모든 티커 (등장 순서, 중복 제거)"""
+        return list(dict.fromkeys(self._matches(user_input.lower().strip())))
+
+
+@lru_cache(maxsize=None)
+def get_resolver(path: str = DEFAULT_ALIAS_PATH, max_edit_distance: int = 1,
+                 stopword_path: str = DEFAULT_STOPWORD_PATH) -> TickerResolver:
+    return TickerResolver.from_file(path, max_edit_distance, stopword_path)
+
+
+def resolver_from_config(cfg, base_dir: str) -> TickerResolver:
+    """
+    resolver.alias_path / resolver.stopword_path(상대 경로는 base_dir 기준)와
+    resolver.max_edit_distance로 공용 인덱스를 가져옵니다.
+    """
+    conf = cfg.get("resolver") or {}
+    paths = []
+    for key, default in (("alias_path", DEFAULT_ALIAS_PATH), ("stopword_path", DEFAULT_STOPWORD_PATH)):
+        path = conf.get(key) or default
+        paths.append(path if os.path.isabs(path) else os.path.join(base_dir, path))
+    return get_resolver(paths[0], int(conf.get("max_edit_distance", 1)), paths[1])
@@ -0,0 +1,27 @@
+import math
+
+
+def estimate_tokens(text) -> int:
+    """
+    토크나이저 없이 쓰는 프롬프트 토큰 수 근사치.
+    한글은 음절당 1토큰, 그 외 문자는 4자당 1토큰으로 셉니다 (공백 제외).
+    """
+    text = str(text or "")
+    hangul = sum(1 for ch in text if "가" <= ch <= "힣")
+    other = sum(1 for ch in text if not ch.isspace()) - hangul
+    return hangul + math.ceil(other / 4)
+
+
+def truncate_to_tokens(text, max_tokens: int) -> str:
+    """추정 토큰 수가 max_tokens 이하가 되도록 뒤쪽을 잘라냅니다."""
+    text = str(text or "")
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if estimate_tokens(text[:mid]) + 1 <= max_tokens:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[:lo].rstrip() + "…"
@@ -0,0 +1,161 @@
+import functools
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+TRACE_FILE = "trace.jsonl"
+
+
+class Tracer:
+    """
+    구간(span)별 소요 시간과 속성을 JSON Lines로 기록합니다.
+    path가 None이면 기록하지 않으므로, 설정 전에 호출돼도 비용이 거의 없습니다.
+    """
+
+    def __init__(self, path: str = None):
+        self.path = path
+        self.run_id = uuid.uuid4().hex[:12]
+        self._lock = threading.Lock()
+        self._file = None
+        if path:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            self._file = open(path, "a", encoding="utf-8", buffering=1)
+
+    @property
+    def enabled(self) -> bool:
+        return self._file is not None
+
+    @contextmanager
+    def span(self, name: str, **attrs):
+        """with span("db.get_news", symbol=s) as sp: ... sp["rows"] = n 처럼 속성을 덧붙일 수 있습니다."""
+        if not self.enabled:
+            yield attrs
+            return
+        started = time.time()
+        start = time.perf_counter()
+        error = None
+        try:
+            yield attrs
+        except BaseException as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            record = {
+                "run": self.run_id,
+                "name": name,
+                "start": started,
+                "elapsed_ms": (time.perf_counter() - start) * 1000,
+                "thread": threading.current_thread().name,
+                "pid": os.getpid(),
+                **attrs,
+            }
+            if error:
+                record["error"] = error
+            self._write(record)
+
+    def _write(self, record: dict):
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+_tracer = Tracer()
+
+
+def configure(output_dir: str, enabled: bool = True, filename: str = TRACE_FILE) -> Tracer:
+    """실행 디렉터리(Hydra outputs/<날짜>/<시간>/)에 trace.jsonl을 열고 전역 tracer로 설정합니다."""
+    global _tracer
+    _tracer.close()
+    _tracer = Tracer(os.path.join(output_dir, filename) if enabled else None)
+    return _tracer
+
+
+def configure_from_config(cfg, output_dir: str) -> Tracer:
+    trace_cfg = cfg.get("tracing") or {}
+    return configure(output_dir, trace_cfg.get("enabled", True), trace_cfg.get("file", TRACE_FILE))
+
+
+def span(name: str, **attrs):
+    return _tracer.span(name, **attrs)
+
+
+def instrument(obj, methods, prefix: str):
+    """
+    객체의 메서드를 span으로 감쌉니다 (DataManager 읽기, Polygon/FMP fetcher 등 코드를 고치지 않고 계측).
+    첫 번째 인자가 문자열이면 symbol 속성으로 기록합니다.
+    """
+    for method in methods:
+        fn = getattr(obj, method, None)
+        if fn is None:
+            continue
+
+        def wrapper(*args, _fn=fn, _name=f"{prefix}.{method}", **kwargs):
+            attrs = {"symbol": args[0]} if args and isinstance(args[0], str) else {}
+            with _tracer.span(_name, **attrs) as sp:
+                result = _fn(*args, **kwargs)
+                try:
+                    sp["rows"] = len(result)
+                except TypeError:
+                    pass
+                return result
+
+        setattr(obj, method, functools.wraps(fn)(wrapper))
+    return obj
+
+
+@contextmanager
+def profile(output_dir: str, mode: str = None):
+    """
+    opt-in 프로파일러. mode='cprofile'이면 profile.prof(pstats), 'pyinstrument'면 profile.html을
+    실행 디렉터리에 저장합니다. pyinstrument가 없으면 경고만 남기고 그냥 실행합니다.
+    """
+    if not mode:
+        yield
+        return
+
+    if mode == "cprofile":
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            path = os.path.join(output_dir, "profile.prof")
+            profiler.dump_stats(path)
+            logger.info(f"cProfile 결과 저장: {path} (python -m pstats {path})")
+        return
+
+    if mode == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            logger.warning("pyinstrument가 설치되어 있지 않아 프로파일링 없이 실행합니다. (pip install pyinstrument)")
+            yield
+            return
+        profiler = Profiler()
+        profiler.start()
+        try:
+            yield
+        finally:
+            profiler.stop()
+            path = os.path.join(output_dir, "profile.html")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(profiler.output_html())
+            logger.info(f"pyinstrument 결과 저장: {path}")
+        return
+
+    raise ValueError(f"알 수 없는 프로파일러: {mode} (cprofile | pyinstrument)")
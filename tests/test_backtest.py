@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+
+from src.analysis.backtest import parameter_grid, summarize, sweep
+
+GRID = dict(sma_lengths=[10, 20], rsi_lengths=[7, 14], rsi_lows=[25, 30], rsi_highs=[70, 80])
+
+
+def _close():
+    rng = np.random.default_rng(7)
+    values = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, (250, 3)), axis=0))
+    return pd.DataFrame(values, index=pd.date_range("2023-01-01", periods=250), columns=["AAA", "BBB", "CCC"])
+
+
+def test_grid_only_expands_axes_each_rule_uses():
+    combos = [(s, r, *c) for (s, r), cs in parameter_grid(**GRID).items() for c in cs]
+    by_rule = {rule: [c for c in combos if c[2] == rule] for rule in ("trend", "rsi", "both")}
+
+    assert sorted(by_rule["trend"]) == [(10, None, "trend", None, None), (20, None, "trend", None, None)]
+    assert all(s is None for s, *_ in by_rule["rsi"])
+    assert len(by_rule["rsi"]) == 2 * 4
+    assert len(by_rule["both"]) == 2 * 2 * 4
+    assert len(combos) == len(set(combos))
+
+
+def test_sweep_has_no_duplicate_combinations():
+    results = sweep(_close(), workers=1, **GRID)
+    summary = summarize(results)
+    keys = ["rule", "sma_length", "rsi_length", "rsi_low", "rsi_high"]
+
+    assert len(summary) == 2 + 8 + 16
+    assert not summary.duplicated(keys).any()
+    assert len(results) == len(summary) * 3
+    assert summary.loc[summary["rule"] == "trend", ["rsi_length", "rsi_low", "rsi_high"]].isna().all().all()
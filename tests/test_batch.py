@@ -0,0 +1,28 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import duckdb
+
+from src.pipeline.batch import _init_worker, _run_cpu_stages
+
+READER = {"price_table": "prices", "news_table": "news", "price_bars": None, "news_limit": 5, "quarters": 1}
+
+
+def test_workers_read_through_their_own_read_only_connections(tmp_path):
+    db_path = str(tmp_path / "batch.duckdb")
+    conn = duckdb.connect(db_path)
+    conn.execute("""
+        CREATE TABLE prices AS
+        SELECT 'AAA' AS symbol, DATE '2024-01-01' + CAST(i AS INTEGER) AS date, 100.0 + i AS close FROM range(10) r(i)
+    """)
+    conn.execute("CREATE TABLE news AS SELECT 'AAA' AS symbol, 'AAA up' AS title, '2024-01-05T00:00:00Z' AS published_utc")
+    conn.close()
+
+    with ProcessPoolExecutor(2, mp_context=multiprocessing.get_context("spawn"),
+                             initializer=_init_worker, initargs=(db_path, READER)) as pool:
+        staged = dict(zip(["AAA", "ZZZ"], pool.map(_run_cpu_stages, ["AAA", "ZZZ"])))
+
+    news, tech, fund = staged["AAA"]
+    assert [n["title"] for n in news] == ["AAA up"]
+    assert tech == {"summary": "데이터 부족으로 분석 불가"}
+    assert staged["ZZZ"] is None
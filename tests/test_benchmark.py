@@ -0,0 +1,61 @@
+import os
+
+import pytest
+from hydra import compose, initialize_config_dir
+
+from scripts.benchmark import _prepare_config, run_benchmarks
+from src.data.connection import close_connection, get_connection
+from src.data.ingest import run_ingestion
+from src.data.reader import MarketReader
+from src.data.writer import TableWriter
+from src.utils.stub_ollama import StubOllamaServer
+from src.utils.synthetic import SyntheticFMPFetcher, SyntheticPolygonFetcher, synthetic_symbols
+
+CONFIG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config")
+OVERRIDES = [
+    "benchmark.symbols=2", "benchmark.years=1", "benchmark.news_per_symbol=5", "benchmark.quarters=4",
+    "benchmark.report_symbols=1", "benchmark.repeat=1", "benchmark.llm.latency_ms=0",
+    "benchmark.llm.token_delay_ms=0", "benchmark.llm.response_tokens=5",
+]
+
+
+def _config(stub_url):
+    with initialize_config_dir(config_dir=CONFIG_DIR, version_base=None):
+        cfg = compose(config_name="config", overrides=OVERRIDES)
+    _prepare_config(cfg, synthetic_symbols(cfg.benchmark.symbols), stub_url)
+    return cfg
+
+
+def test_synthetic_ingestion_fills_tables(tmp_path):
+    cfg = _config("http://127.0.0.1:9")
+    db_path = str(tmp_path / "bench.duckdb")
+    try:
+        conn = get_connection(db_path)
+        writer = TableWriter(conn, cfg.reader.price_table, cfg.reader.news_table)
+        bench = cfg.benchmark
+        report = run_ingestion(cfg, db_path, SyntheticPolygonFetcher(bench.seed, bench.news_per_symbol),
+                               SyntheticFMPFetcher(bench.seed, bench.quarters), writer)
+
+        assert not report["failed"]
+        prices, news, fin = MarketReader.from_config(cfg, conn).get_bundle("SYN000")
+        assert len(prices) > 200
+        assert len(news) == 5
+        assert fin["income_statement"][0]["revenue"] > 0
+    finally:
+        close_connection(db_path)
+
+
+def test_run_benchmarks_smoke(tmp_path):
+    pytest.importorskip("ollama")
+    pytest.importorskip("pandas_ta")
+    with StubOllamaServer(0, 0, 5) as stub:
+        cfg = _config(stub.url)
+        db_path = str(tmp_path / "bench.duckdb")
+        try:
+            results = run_benchmarks(cfg, db_path)
+        finally:
+            close_connection(db_path)
+        assert stub.requests > 0
+
+    assert {"ingestion", "db_bundle", "report.end_to_end"} <= set(results)
+    assert all(r["runs"] >= 1 for r in results.values())
@@ -0,0 +1,84 @@
+import duckdb
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analysis.incremental import IncrementalTechnicals
+from src.data.chunked import stream_indicators
+
+
+def _prices(symbols=("AAA", "BBB", "CCC"), bars=5000, seed=0):
+    rng = np.random.default_rng(seed)
+    frames = []
+    for symbol in symbols:
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, bars)))
+        frames.append(pd.DataFrame({
+            "symbol": symbol,
+            "date": pd.bdate_range("2000-01-03", periods=bars),
+            "close": np.round(close, 4),
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+def _expected(prices):
+    conn = duckdb.connect()
+    technicals = IncrementalTechnicals(conn)
+    return {
+        symbol: (technicals.update(symbol, bars[["date", "close"]]), technicals.load(symbol).last_date)
+        for symbol, bars in prices.groupby("symbol")
+    }
+
+
+@pytest.fixture
+def conn():
+    conn = duckdb.connect()
+    yield conn
+    conn.close()
+
+
+def test_stream_matches_full_frame_across_batches(conn):
+    prices = _prices()
+    conn.register("prices_df", prices)
+    conn.execute("CREATE TABLE prices AS SELECT * FROM prices_df")
+    technicals = IncrementalTechnicals(conn)
+
+    results = stream_indicators(conn, technicals, batch_rows=2048)
+
+    expected = _expected(prices)
+    assert set(results) == set(expected)
+    for symbol, (result, last_date) in expected.items():
+        assert results[symbol] == result
+        assert technicals.load(symbol).last_date == last_date
+
+
+def test_stream_resumes_from_saved_state(conn):
+    prices = _prices()
+    cutoff = pd.Timestamp("2010-01-01")
+    conn.register("prices_df", prices)
+    conn.execute("CREATE TABLE prices AS SELECT * FROM prices_df WHERE date < ?", [cutoff])
+    technicals = IncrementalTechnicals(conn)
+    stream_indicators(conn, technicals, batch_rows=2048)
+
+    conn.execute("INSERT INTO prices SELECT * FROM prices_df WHERE date >= ?", [cutoff])
+    results = stream_indicators(conn, technicals, batch_rows=2048)
+
+    for symbol, (result, _) in _expected(prices).items():
+        assert results[symbol] == result
+
+
+def test_stream_recomputes_revised_last_bar(conn):
+    prices = _prices(symbols=("AAA", "BBB"), bars=500)
+    conn.register("prices_df", prices)
+    conn.execute("CREATE TABLE prices AS SELECT * FROM prices_df")
+    technicals = IncrementalTechnicals(conn)
+    stream_indicators(conn, technicals, batch_rows=128)
+
+    last = prices["date"].max()
+    conn.execute("UPDATE prices SET close = close * 1.05 WHERE symbol = 'AAA' AND date = ?", [last])
+    results = stream_indicators(conn, technicals, batch_rows=128)
+
+    revised = conn.execute("SELECT * FROM prices ORDER BY symbol, date").df()
+    expected = _expected(revised)
+    assert set(results) == {"AAA"}
+    assert results["AAA"] == expected["AAA"][0]
+    assert technicals.load("BBB").last_close == expected["BBB"][0]["close"]
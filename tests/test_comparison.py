@@ -0,0 +1,88 @@
+import duckdb
+import pandas as pd
+from omegaconf import OmegaConf
+
+from src.agent.quant_agent import QuantAgent
+from src.analysis.sentiment import SentimentAnalyzer
+from src.data.news_scores import NewsScoreStore
+from src.pipeline.executor import collect_summaries
+from src.utils.tokens import estimate_tokens
+
+
+class _NoLLM:
+    """비교 요약 단계에서는 호출되면 안 되는 LLM"""
+
+    calls = 0
+
+    def chat(self, prompt, **kwargs):
+        _NoLLM.calls += 1
+        raise AssertionError("종목별 감성 요약에서 LLM이 호출됨")
+
+
+class _Snapshots:
+    def get(self, symbol):
+        if symbol == "AAA":
+            return {"tech": {"summary": "상승"}, "senti": None, "fund": "양호"}
+        return None
+
+
+class _Reader:
+    news = {
+        "AAA": [{"id": "a1", "title": "AAA beats earnings", "published_utc": "2024-01-02T00:00:00Z"}],
+        "BBB": [{"id": "b1", "title": "BBB recalls product", "published_utc": "2024-01-02T00:00:00Z"}],
+    }
+
+    def get_news(self, symbol):
+        return self.news.get(symbol, [])
+
+    def get_bundle(self, symbol):
+        if symbol not in self.news:
+            return pd.DataFrame(), [], {}
+        dates = pd.date_range("2024-01-01", periods=60, freq="D")
+        prices = pd.DataFrame({"date": dates, "close": [100.0 + i for i in range(60)]})
+        return prices, self.news[symbol], {}
+
+
+def _cfg():
+    return OmegaConf.create({
+        "pipeline": {"max_workers": 3, "timeouts": {"technical": 30, "sentiment": 30, "fundamental": 30}},
+    })
+
+
+def test_comparison_summaries_make_no_llm_calls():
+    _NoLLM.calls = 0
+    conn = duckdb.connect()
+    store = NewsScoreStore(conn)
+    store.save_scores("AAA", "test", {"a1": 0.6})
+    sentiment = SentimentAnalyzer("test", _NoLLM(), store, mode="batched")
+
+    summaries, missing = collect_summaries(_cfg(), _Reader(), sentiment, _Snapshots(), ["AAA", "BBB", "CCC"])
+
+    assert _NoLLM.calls == 0
+    assert missing == ["CCC"]
+    assert summaries["AAA"]["senti"] == "기사 1건 평균 감성 점수 +0.60 → 긍정"
+    # 저장된 점수가 없으면 헤드라인을 비교 프롬프트로 넘김
+    assert "BBB recalls product" in summaries["BBB"]["senti"]
+
+
+def test_summary_mode_folds_headlines_without_store():
+    sentiment = SentimentAnalyzer("test", _NoLLM(), None)
+    assert sentiment.stored_summary(_Reader.news["AAA"], "AAA") == "헤드라인: AAA beats earnings"
+    assert sentiment.stored_summary([], "AAA") == "최근 뉴스 없음"
+
+
+def test_comparison_prompt_stays_within_token_budget():
+    agent = QuantAgent("test", llm=_NoLLM())
+    summary = {"tech": {"summary": "상승 추세 " * 50}, "senti": "긍정적인 뉴스 " * 200, "fund": "매출 성장 " * 200}
+    summaries = {f"S{i}": summary for i in range(12)}
+
+    for budget in (1500, 600, 400):
+        prompt, dropped = agent._build_comparison_prompt(summaries, "2024-01-02", budget)
+        assert estimate_tokens(prompt) <= budget
+        kept = [s for s in summaries if s not in dropped]
+        assert kept and dropped == list(summaries)[len(kept):]
+        assert all(f"[{s}]" in prompt for s in kept)
+        assert not any(f"[{s}]" in prompt for s in dropped)
+
+    prompt, dropped = agent._build_comparison_prompt(dict(list(summaries.items())[:2]), "2024-01-02", 1500)
+    assert dropped == []
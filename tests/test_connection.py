@@ -0,0 +1,80 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import duckdb
+import pytest
+
+from src.data.connection import ConnectionPool, close_connection
+from src.data.reader import MarketReader
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "test.duckdb")
+    conn = duckdb.connect(path)
+    conn.execute("""
+        CREATE TABLE prices AS
+        SELECT s.symbol, DATE '2024-01-01' + CAST(i AS INTEGER) AS date, 100.0 + i AS close
+        FROM (VALUES ('AAA'), ('BBB')) s(symbol), range(50) r(i)
+    """)
+    conn.close()
+    yield path
+    close_connection(path)
+
+
+def test_sessions_read_concurrently_through_their_cursors(db_path):
+    pool = ConnectionPool(db_path, read_only=True)
+
+    def read(session_id):
+        reader = MarketReader(pool.cursor(session_id))
+        return [len(reader.get_price_data(s, limit=10)) for s in ("AAA", "BBB") for _ in range(20)]
+
+    with ThreadPoolExecutor(4) as ex:
+        results = list(ex.map(read, [f"s{i}" for i in range(4)]))
+    assert all(counts == [10] * 40 for counts in results)
+    assert pool.health()["sessions"] == 4
+
+
+def test_idle_and_released_sessions_are_closed(db_path):
+    pool = ConnectionPool(db_path, read_only=True, idle_seconds=0.05)
+    old = pool.cursor("old")
+    pool.cursor("gone")
+    pool.release("gone")
+    time.sleep(0.1)
+    pool.cursor("new")
+
+    assert pool.health()["sessions"] == 1
+    with pytest.raises(duckdb.ConnectionException):
+        old.execute("SELECT 1")
+
+
+def _write_db(path, close):
+    conn = duckdb.connect(path)
+    conn.execute("CREATE TABLE prices AS SELECT 'AAA' AS symbol, DATE '2024-01-01' AS date, ? AS close", [close])
+    conn.close()
+
+
+def test_pool_reopens_after_atomic_replace(tmp_path, db_path):
+    pool = ConnectionPool(db_path, read_only=True, stale_grace=0.1)
+    cur = pool.cursor("s1")
+    other = pool.cursor("s2")
+    assert cur.execute("SELECT count(*) FROM prices").fetchone()[0] == 100
+
+    staging = str(tmp_path / "staging.duckdb")
+    _write_db(staging, 42.0)
+    os.replace(staging, db_path)
+
+    health = pool.health()
+    assert health["ok"] and health["stale"] == 2
+    reader = MarketReader(pool.cursor("s1"))
+    assert reader.get_price_data("AAA")["close"].tolist() == [42.0]
+    # 교체 전에 받은 다른 세션의 cursor는 진행 중인 조회를 끝낼 수 있도록 예전 파일로 계속 동작
+    assert other.execute("SELECT count(*) FROM prices").fetchone()[0] == 100
+
+    time.sleep(0.15)
+    assert MarketReader(pool.cursor("s2")).get_price_data("BBB").empty
+    pool.cursor("s1")
+    assert pool.health()["stale"] == 0
+    with pytest.raises(duckdb.ConnectionException):
+        other.execute("SELECT 1")
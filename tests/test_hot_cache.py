@@ -0,0 +1,38 @@
+from datetime import datetime
+
+import pandas as pd
+
+from src.data.hot_cache import HotCache
+
+
+def test_blob_hit_and_miss_return_the_same_value(tmp_path):
+    cache = HotCache(str(tmp_path / "missing.duckdb"))
+    news = [{"title": "AAA", "published_utc": datetime(2024, 1, 2, 9, 30)}]
+    fin = {"income": [{"date": pd.Timestamp("2023-12-31").date(), "revenue": 10.0}]}
+
+    miss = cache.news("AAA", lambda s: news), cache.financials("AAA", lambda s: fin)
+    hit = cache.news("AAA", lambda s: None), cache.financials("AAA", lambda s: None)
+
+    assert miss == hit
+    assert miss[0] == [{"title": "AAA", "published_utc": "2024-01-02 09:30:00"}]
+    assert miss[1] == {"income": [{"date": "2023-12-31", "revenue": 10.0}]}
+    assert cache.stats()["hits"] == 2
+
+
+def test_bundle_miss_reads_once_and_fills_every_part(tmp_path):
+    cache = HotCache(str(tmp_path / "missing.duckdb"), window_bars=5)
+    prices = pd.DataFrame({"date": pd.date_range("2024-01-01", periods=10), "close": range(10)})
+    calls = []
+
+    def get_bundle(symbol):
+        calls.append(symbol)
+        return prices, [{"title": "AAA"}], {"income": []}
+
+    miss = cache.bundle("AAA", get_bundle)
+    hit = cache.bundle("AAA", get_bundle)
+
+    assert calls == ["AAA"]
+    assert len(miss[0]) == 5 and miss[0]["close"].tolist() == list(range(5, 10))
+    pd.testing.assert_frame_equal(miss[0], hit[0])
+    assert miss[1:] == hit[1:] == ([{"title": "AAA"}], {"income": []})
+    assert cache.news("AAA", lambda s: None) == [{"title": "AAA"}]
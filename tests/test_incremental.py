@@ -0,0 +1,106 @@
+import duckdb
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analysis.incremental import IncrementalTechnicals, IndicatorState
+from src.analysis.technical import RSI_LENGTH, SMA_LENGTH, TechnicalAnalyzer
+
+SPLITS = [0, 35, 120, 121, 260, 400]
+
+
+def _bars(n=400, seed=3):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, n)))
+    # 보합 구간(같은 종가 연속)도 섞어 rolling/ewm의 특수 경로까지 확인
+    close[200:215] = close[199]
+    return pd.DataFrame({"date": pd.date_range("2023-01-02", periods=n, freq="D"), "close": close.round(2)})
+
+
+def _reference(close: pd.Series) -> dict:
+    """pandas rolling/ewm(Wilder RMA)으로 계산한 마지막 봉의 SMA(20), RSI(14)"""
+    diff = close.diff()
+    alpha = 1.0 / RSI_LENGTH
+    positive = diff.clip(lower=0).ewm(alpha=alpha, min_periods=RSI_LENGTH).mean()
+    negative = diff.clip(upper=0).ewm(alpha=alpha, min_periods=RSI_LENGTH).mean()
+    rsi = 100 * positive / (positive + negative.abs())
+    return {"sma": close.rolling(SMA_LENGTH).mean().iloc[-1], "rsi": rsi.iloc[-1]}
+
+
+def _split_run(bars):
+    """SPLITS 구간마다 상태를 DB에 저장했다가 새 엔진으로 다시 읽어 이어서 갱신 (구간은 한 봉씩 겹치게)"""
+    conn = duckdb.connect()
+    results = []
+    for lo, hi in zip(SPLITS, SPLITS[1:]):
+        technicals = IncrementalTechnicals(conn)
+        technicals.update("AAA", bars.iloc[max(lo - 1, 0):hi])
+        results.append((hi, technicals.load("AAA")))
+    return results
+
+
+def test_split_updates_match_pandas_reference():
+    bars = _bars()
+    for hi, state in _split_run(bars):
+        ref = _reference(bars["close"].iloc[:hi])
+        assert state.bars == hi
+        assert state.sma.value == pytest.approx(ref["sma"], rel=1e-12, nan_ok=True)
+        assert state.rsi == pytest.approx(ref["rsi"], rel=1e-12, nan_ok=True)
+
+
+def test_split_updates_match_single_pass():
+    bars = _bars()
+    full = IndicatorState()
+    for date, close in zip(bars["date"], bars["close"]):
+        full.push(date, close)
+    _, state = _split_run(bars)[-1]
+    assert state.to_json() == full.to_json()
+
+
+def test_incremental_matches_analyze_panel():
+    panel = pd.concat([_bars(seed=s).assign(symbol=f"S{s}") for s in range(3)], ignore_index=True)
+    expected = TechnicalAnalyzer().analyze_panel(panel)
+    technicals = IncrementalTechnicals(duckdb.connect())
+    for symbol, bars in panel.groupby("symbol"):
+        half = len(bars) // 2
+        technicals.update(symbol, bars.iloc[:half])
+        res = technicals.update(symbol, bars.iloc[half:])
+        row = expected.loc[symbol]
+        assert res["close"] == row["close"]
+        assert res["rsi"] == pytest.approx(row["rsi"], rel=1e-9)
+        assert technicals.load(symbol).sma.value == pytest.approx(row["sma_20"], rel=1e-9)
+        assert (res["trend"], res["status"]) == (row["trend"], row["status"])
+
+
+def test_incremental_matches_batch_analyze():
+    pytest.importorskip("pandas_ta")
+    bars = _bars()
+    technicals = IncrementalTechnicals(duckdb.connect())
+    technicals.update("AAA", bars.iloc[:150])
+    res = technicals.update("AAA", bars.iloc[150:])
+    batch = TechnicalAnalyzer().analyze(bars)
+    assert res["close"] == batch["close"]
+    assert res["rsi"] == pytest.approx(batch["rsi"], rel=1e-9)
+    assert (res["trend"], res["status"]) == (batch["trend"], batch["status"])
+
+
+def test_revised_last_bar_rebuilds_from_checkpoint():
+    bars = _bars()
+    revised = bars.copy()
+    revised.loc[199, "close"] += 3.0
+    technicals = IncrementalTechnicals(duckdb.connect())
+    technicals.update("AAA", bars.iloc[:200])
+
+    # 새 봉 없이 마지막 봉만 수정돼 다시 들어와도 반영
+    technicals.update("AAA", revised.iloc[199:200])
+    state = technicals.load("AAA")
+    assert state.bars == 200
+    assert state.last_close == revised["close"].iloc[199]
+    assert state.rsi == pytest.approx(_reference(revised["close"].iloc[:200])["rsi"], rel=1e-12)
+
+    # 수정된 봉을 다시 받아도(값 동일) 두 번 반영하지 않음
+    technicals.update("AAA", revised.iloc[199:260])
+    state = technicals.load("AAA")
+    ref = _reference(revised["close"].iloc[:260])
+    assert state.bars == 260
+    assert state.sma.value == pytest.approx(ref["sma"], rel=1e-12)
+    assert state.rsi == pytest.approx(ref["rsi"], rel=1e-12)
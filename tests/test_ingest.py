@@ -0,0 +1,257 @@
+import json
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+import pytest
+from omegaconf import OmegaConf
+
+from src.analysis.incremental import IncrementalTechnicals
+from src.data.connection import close_connection, get_connection
+from src.data.ingest import FetchTask, IngestionScheduler, run_ingestion
+from src.data.sync import SyncState
+from src.data.writer import TableWriter
+from src.utils.rate_limiter import RateLimiter
+
+
+class _StubAPI(BaseHTTPRequestHandler):
+    """
+    /ok/<symbol>는 바로 200, /flaky/<symbol>은 처음 두 번 500/429 후 200, /down/<symbol>은 항상 503,
+    /missing/<symbol>은 항상 404, /limited/<symbol>은 처음 한 번 429 + Retry-After: 1 후 200
+    """
+
+    calls = {}
+    lock = threading.Lock()
+
+    def do_GET(self):
+        with self.lock:
+            self.calls[self.path] = self.calls.get(self.path, 0) + 1
+            attempt = self.calls[self.path]
+        kind, symbol = self.path.strip("/").split("/")
+        if kind == "limited" and attempt == 1:
+            self.send_response(429)
+            self.send_header("Retry-After", "1")
+            self.end_headers()
+            return
+        if kind in ("down", "missing") or (kind == "flaky" and attempt <= 2):
+            status = {"down": 503, "missing": 404}.get(kind) or (500, 429)[attempt - 1]
+            self.send_response(status)
+            self.end_headers()
+            return
+        body = json.dumps({"symbol": symbol, "results": [{"close": 1.0}]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_url():
+    _StubAPI.calls = {}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubAPI)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _get(url):
+    with urllib.request.urlopen(url, timeout=5) as resp:
+        return json.load(resp)
+
+
+def _task(base, kind, symbol, provider="polygon"):
+    return FetchTask(provider, symbol, kind, lambda: _get(f"{base}/{kind}/{symbol}"))
+
+
+def test_scheduler_retries_and_records_failures(stub_url):
+    scheduler = IngestionScheduler({}, max_workers=4, max_retries=2, backoff_base=0.0, write_batch_size=2)
+    tasks = [_task(stub_url, "ok", s) for s in ("AAA", "BBB", "CCC")]
+    tasks += [_task(stub_url, "flaky", "DDD"), _task(stub_url, "down", "EEE")]
+    written = []
+
+    report = scheduler.run(tasks, lambda batch: written.extend(data["symbol"] for _, data in batch))
+
+    assert sorted(written) == ["AAA", "BBB", "CCC", "DDD"]
+    assert report["ok"] == {"ok": 3, "flaky": 1}
+    assert [(s, d) for s, d, _ in report["failed"]] == [("EEE", "down")]
+    assert _StubAPI.calls["/flaky/DDD"] == 3
+    assert _StubAPI.calls["/down/EEE"] == 3
+
+
+def test_non_transient_errors_are_not_retried(stub_url):
+    scheduler = IngestionScheduler({}, max_retries=3, backoff_base=0.0)
+    report = scheduler.run([_task(stub_url, "missing", "AAA")], lambda batch: None)
+
+    assert [(s, d) for s, d, _ in report["failed"]] == [("AAA", "missing")]
+    assert _StubAPI.calls["/missing/AAA"] == 1
+
+
+def test_retry_waits_for_retry_after(stub_url):
+    scheduler = IngestionScheduler({}, max_retries=2, backoff_base=0.0)
+    start = time.perf_counter()
+    report = scheduler.run([_task(stub_url, "limited", "AAA")], lambda batch: None)
+
+    assert report["ok"] == {"limited": 1}
+    assert _StubAPI.calls["/limited/AAA"] == 2
+    assert time.perf_counter() - start >= 0.95
+
+
+def test_rate_limiter_never_exceeds_max_calls_per_period():
+    limiter = RateLimiter(3, period=0.3)
+    calls, lock = [], threading.Lock()
+
+    def call():
+        limiter.wait()
+        with lock:
+            calls.append(time.monotonic())
+
+    threads = [threading.Thread(target=call) for _ in range(10)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    calls.sort()
+    assert len(calls) == 10
+    # 어떤 period 구간에도 max_calls회 이하 → i번째와 i+max_calls번째 호출은 period 이상 떨어져 있음
+    assert all(calls[i + 3] - calls[i] >= 0.3 - 1e-3 for i in range(len(calls) - 3))
+
+
+def test_scheduler_respects_provider_rate_limit(stub_url):
+    # 0.2초에 4회 → 10회 호출이면 4 + 4 + 2로 최소 0.4초
+    limiter = RateLimiter(4, period=0.2)
+    scheduler = IngestionScheduler({"polygon": limiter}, max_workers=8, backoff_base=0.0)
+    tasks = [_task(stub_url, "ok", f"S{i}") for i in range(10)]
+
+    start = time.perf_counter()
+    report = scheduler.run(tasks, lambda batch: None)
+
+    assert report["ok"] == {"ok": 10}
+    assert time.perf_counter() - start >= 0.35
+
+
+class _Polygon:
+    def fetch_prices(self, symbol, start, end):
+        dates = pd.date_range("2024-01-01", periods=30, freq="D")
+        return pd.DataFrame({"date": dates, "close": [100.0 + i for i in range(30)]})
+
+    def fetch_news(self, symbol):
+        return [{"id": f"{symbol}-1", "title": f"{symbol} news", "published_utc": "2024-01-30T00:00:00Z"}]
+
+
+class _FMP:
+    def fetch_all(self, symbol):
+        return {"income": [{"date": "2023-12-31", "period": "Q4", "revenue": 10.0}]}
+
+
+class _Store:
+    """DataManager 대신 쓰는 저장소. BBB 뉴스 저장만 실패합니다."""
+
+    def __init__(self):
+        self.saved = []
+
+    def save_prices(self, df, symbol):
+        self.saved.append((symbol, "prices"))
+
+    def save_news(self, news, symbol):
+        if symbol == "BBB":
+            raise IOError("disk full")
+        self.saved.append((symbol, "news"))
+
+    def save_financials(self, symbol, data):
+        self.saved.append((symbol, "financials"))
+
+
+def _ingest_cfg():
+    return OmegaConf.create({
+        "symbols": ["AAA", "BBB"],
+        "date_range": {"start": "2024-01-01", "end": "2024-01-30"},
+        "ingestion": {"mode": "full", "max_workers": 4, "max_retries": 0, "backoff_base": 0.0,
+                      "backoff_max": 0.0, "write_batch_size": 6},
+        "api": {"polygon": {"news": {"limit_per_minute": 10 ** 6}}, "fmp": {"limit_per_minute": 10 ** 6}},
+        "sentiment": {"mode": "summary"},
+        "reader": {"price_table": "prices", "news_table": "news"},
+        "snapshot": {"enabled": False},
+    })
+
+
+def test_write_failure_is_isolated_per_task(tmp_path):
+    db_path = str(tmp_path / "ingest.duckdb")
+    cfg = _ingest_cfg()
+    store = _Store()
+    try:
+        report = run_ingestion(cfg, db_path, _Polygon(), _FMP(), store)
+
+        assert [(s, d) for s, d, _ in report["failed"]] == [("BBB", "news")]
+        assert "disk full" in report["failed"][0][2]
+        assert report["ok"] == {"prices": 2, "news": 1, "financials": 2}
+        assert sorted(store.saved) == sorted([
+            ("AAA", "prices"), ("BBB", "prices"), ("AAA", "news"), ("AAA", "financials"), ("BBB", "financials"),
+        ])
+
+        sync = SyncState(get_connection(db_path))
+        assert sync.get("AAA", "news") is not None
+        assert sync.get("BBB", "news") is None
+        assert sync.get("BBB", "prices") is not None
+        conn = get_connection(db_path)
+        assert conn.execute("SELECT count(DISTINCT symbol) FROM fundamentals").fetchone()[0] == 2
+        assert conn.execute("SELECT count(*) FROM indicator_state").fetchone()[0] == 2
+    finally:
+        close_connection(db_path)
+
+
+def test_full_reingest_keeps_sync_totals(tmp_path):
+    db_path = str(tmp_path / "full.duckdb")
+    cfg = _ingest_cfg()
+    try:
+        conn = get_connection(db_path)
+        writer = TableWriter(conn)
+        states = []
+        for _ in range(2):
+            run_ingestion(cfg, db_path, _Polygon(), _FMP(), writer)
+            states.append(conn.execute(
+                "SELECT symbol, dataset, high_water, rows_total FROM sync_state ORDER BY ALL"
+            ).fetchall())
+
+        assert states[0] == states[1]
+        totals = {(s, d): n for s, d, _, n in states[1]}
+        assert totals[("AAA", "prices")] == 30
+        assert totals[("AAA", "news")] == 1
+        assert totals[("AAA", "financials")] == 1
+    finally:
+        close_connection(db_path)
+
+
+def test_incremental_ingest_applies_revised_last_bar(tmp_path):
+    db_path = str(tmp_path / "revised.duckdb")
+    cfg = _ingest_cfg()
+    cfg.ingestion.mode = "incremental"
+    cfg.symbols = ["AAA"]
+
+    class _Revised(_Polygon):
+        def fetch_prices(self, symbol, start, end):
+            df = super().fetch_prices(symbol, start, end)
+            df = df[df["date"] >= start].copy()
+            df.loc[df.index[-1], "close"] += 5.0
+            return df
+
+    try:
+        conn = get_connection(db_path)
+        writer = TableWriter(conn)
+        run_ingestion(cfg, db_path, _Polygon(), _FMP(), writer)
+        report = run_ingestion(cfg, db_path, _Revised(), _FMP(), writer)
+
+        assert ("AAA", "prices", 0, None) in report["changes"]
+        assert conn.execute("SELECT close FROM prices WHERE date = '2024-01-30'").fetchone()[0] == 134.0
+        assert conn.execute("SELECT rows_total FROM sync_state WHERE dataset = 'prices'").fetchone()[0] == 30
+        state = IncrementalTechnicals(conn).load("AAA")
+        assert (state.bars, state.last_close) == (30, 134.0)
+    finally:
+        close_connection(db_path)
@@ -0,0 +1,29 @@
+from src.agent.llm_cache import LLMCache
+
+
+def _rows(cache):
+    return cache.conn.execute("SELECT count(*) FROM llm_cache").fetchone()[0]
+
+
+def test_eviction_runs_every_n_puts(tmp_path):
+    cache = LLMCache(str(tmp_path / "cache.duckdb"), max_entries=10, evict_every=5)
+    for i in range(14):
+        cache.put(f"k{i}", "test", f"r{i}")
+    # 5번째/10번째 put에서만 정리 → 그 사이에는 max_entries + evict_every까지 쌓임
+    assert _rows(cache) == 14
+
+    cache.put("k14", "test", "r14")
+    assert _rows(cache) == 10
+    assert cache.get("k14") == "r14"
+    cache._memory.clear()
+    assert cache.get("k0") is None
+
+
+def test_expired_entries_are_dropped_on_open(tmp_path):
+    path = str(tmp_path / "cache.duckdb")
+    cache = LLMCache(path, ttl_seconds=60)
+    cache.put("old", "test", "r")
+    cache.conn.execute("UPDATE llm_cache SET created_at = created_at - 120")
+    cache.conn.close()
+
+    assert _rows(LLMCache(path, ttl_seconds=60)) == 0
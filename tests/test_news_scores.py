@@ -0,0 +1,56 @@
+import json
+
+import duckdb
+
+from src.analysis.sentiment import SentimentAnalyzer
+from src.data.news_scores import NewsScoreStore
+
+SHARED = {"id": "n1", "title": "AAA wins contract from BBB", "published_utc": "2024-01-02T00:00:00Z"}
+
+
+class _LLM:
+    """프롬프트에 적힌 종목에 따라 다른 점수를 주는 LLM"""
+
+    def __init__(self):
+        self.prompts = []
+
+    def chat(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        score = 0.8 if "AAA 종목" in prompt else -0.6
+        return json.dumps({"scores": [{"i": 1, "score": score}]})
+
+
+def test_shared_article_is_scored_per_symbol():
+    llm = _LLM()
+    sentiment = SentimentAnalyzer("test", llm, NewsScoreStore(duckdb.connect()), mode="batched")
+
+    assert sentiment.score_new_articles([SHARED], "AAA") == 1
+    assert sentiment.score_new_articles([SHARED], "BBB") == 1
+    # 이미 채점된 (기사, 종목)은 다시 보내지 않음
+    assert sentiment.score_new_articles([SHARED], "AAA") == 0
+
+    assert len(llm.prompts) == 2
+    assert "AAA 종목" in llm.prompts[0] and "BBB 종목" in llm.prompts[1]
+    assert sentiment.store.aggregate("AAA", ["n1"]) == (0.8, 1)
+    assert sentiment.store.aggregate("BBB", ["n1"]) == (-0.6, 1)
+
+
+def test_legacy_article_keyed_table_is_migrated():
+    conn = duckdb.connect()
+    conn.execute("""
+        CREATE TABLE news_sentiment (
+            article_id VARCHAR PRIMARY KEY, symbol VARCHAR, score DOUBLE, model VARCHAR, scored_at TIMESTAMP
+        )
+    """)
+    conn.execute("INSERT INTO news_sentiment VALUES ('n1', 'AAA', 0.5, 'old', now())")
+
+    store = NewsScoreStore(conn)
+    store.save_scores("BBB", "test", {"n1": -0.5})
+
+    assert store.get_scores("AAA", ["n1"]) == {"n1": 0.5}
+    assert store.get_scores("BBB", ["n1"]) == {"n1": -0.5}
+    pk = conn.execute("""
+        SELECT constraint_column_names FROM duckdb_constraints()
+        WHERE table_name = 'news_sentiment' AND constraint_type = 'PRIMARY KEY'
+    """).fetchone()[0]
+    assert list(pk) == ["article_id", "symbol"]
@@ -0,0 +1,68 @@
+import duckdb
+import pandas as pd
+import pytest
+
+from scripts.x import export_tables, import_tables
+from src.analysis.incremental import IncrementalTechnicals
+from src.data.fundamentals import FundamentalsStore
+from src.data.sync import SyncState
+from src.utils.synthetic import SyntheticFMPFetcher, SyntheticPolygonFetcher
+
+POLY = SyntheticPolygonFetcher(0, 5)
+FMP = SyntheticFMPFetcher(0, 4)
+
+
+def _ingest(conn, symbol, start, end):
+    """수집 스크립트가 쓰는 테이블들을 DataManager 없이 채웁니다 (prices + 상태 테이블)."""
+    prices = POLY.fetch_prices(symbol, start, end).assign(symbol=symbol)
+    prices["date"] = pd.to_datetime(prices["date"])
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS prices (
+            symbol VARCHAR, date DATE, open DOUBLE, high DOUBLE, low DOUBLE, close DOUBLE, volume BIGINT,
+            PRIMARY KEY (symbol, date)
+        )
+    """)
+    conn.register("df", prices)
+    conn.execute("INSERT OR REPLACE INTO prices BY NAME SELECT * FROM df")
+    conn.unregister("df")
+    SyncState(conn).advance(symbol, "prices", prices["date"].max(), len(prices))
+    IncrementalTechnicals(conn).update(symbol, prices)
+    FundamentalsStore(conn).save(symbol, FMP.fetch_all(symbol))
+
+
+def _dump(conn):
+    tables = [row[0] for row in conn.execute("SHOW TABLES").fetchall()]
+    return {t: conn.execute(f'SELECT * EXCLUDE (updated_at) FROM "{t}" ORDER BY ALL' if t in ("sync_state", "indicator_state")
+                            else f'SELECT * FROM "{t}" ORDER BY ALL').fetchall() for t in tables}
+
+
+@pytest.fixture
+def source():
+    conn = duckdb.connect()
+    _ingest(conn, "AAA", "2024-01-01", "2024-03-31")
+    yield conn
+    conn.close()
+
+
+def test_incremental_export_roundtrip(source, tmp_path):
+    out = str(tmp_path / "parquet")
+    export_tables(source, out, "zstd", incremental=True)
+
+    # 기존 종목의 새 봉만 → 덧붙이기
+    _ingest(source, "AAA", "2024-04-01", "2024-05-31")
+    export_tables(source, out, "zstd", incremental=True)
+    # mark보다 오래된 백필, 새 종목, 상태 테이블 갱신 → 해당 종목 다시 쓰기
+    _ingest(source, "AAA", "2023-10-02", "2023-12-29")
+    _ingest(source, "BBB", "2024-01-01", "2024-05-31")
+    export_tables(source, out, "zstd", incremental=True)
+    export_tables(source, out, "zstd", incremental=True)
+
+    target = duckdb.connect()
+    import_tables(target, out, replace=False)
+    assert _dump(target) == _dump(source)
+
+    # 가져온 테이블에도 기본 키가 있어 이후 수집(ON CONFLICT / INSERT OR REPLACE)이 동작
+    _ingest(target, "BBB", "2024-06-01", "2024-06-28")
+    _ingest(source, "BBB", "2024-06-01", "2024-06-28")
+    assert _dump(target)["prices"] == _dump(source)["prices"]
+    assert target.execute("SELECT count(*) FROM sync_state").fetchone()[0] == 2
@@ -0,0 +1,65 @@
+import threading
+import time
+
+from src.pipeline.executor import AnalysisPipeline
+
+
+def _sleep(seconds, value="done"):
+    time.sleep(seconds)
+    return value
+
+
+def _fail():
+    raise RuntimeError("boom")
+
+
+def test_timed_out_stage_falls_back_without_waiting():
+    pipeline = AnalysisPipeline()
+    pipeline.add_stage("slow", _sleep, 1.0, timeout=0.2, fallback="fallback")
+    pipeline.add_stage("fast", _sleep, 0.0)
+
+    start = time.perf_counter()
+    results = pipeline.run()
+
+    assert time.perf_counter() - start < 0.8
+    assert (results["slow"].status, results["slow"].value) == ("timeout", "fallback")
+    assert (results["fast"].status, results["fast"].value) == ("ok", "done")
+
+
+def test_queue_wait_does_not_count_against_timeout():
+    # 워커 1개: second는 first가 끝날 때까지 0.3초 대기하지만 실행 자체는 0.05초
+    pipeline = AnalysisPipeline(max_workers=1)
+    pipeline.add_stage("first", _sleep, 0.3, timeout=1.0)
+    pipeline.add_stage("second", _sleep, 0.05, timeout=0.2, fallback="fallback")
+
+    results = pipeline.run()
+
+    assert results["first"].status == "ok"
+    assert (results["second"].status, results["second"].value) == ("ok", "done")
+    assert results["second"].elapsed < 0.2
+
+
+def test_exception_in_one_stage_keeps_the_others():
+    pipeline = AnalysisPipeline()
+    pipeline.add_stage("broken", _fail, fallback="fallback")
+    pipeline.add_stage("fine", _sleep, 0.05)
+
+    results = pipeline.run()
+
+    assert (results["broken"].status, results["broken"].value) == ("error", "fallback")
+    assert results["broken"].error == "boom"
+    assert results["fine"].status == "ok"
+
+
+def test_cancel_ends_run_and_skips_pending_stages():
+    pipeline = AnalysisPipeline(max_workers=1)
+    pipeline.add_stage("running", _sleep, 1.0, fallback="a")
+    pipeline.add_stage("queued", _sleep, 1.0, fallback="b")
+    threading.Timer(0.1, pipeline.cancel).start()
+
+    start = time.perf_counter()
+    results = pipeline.run()
+
+    assert time.perf_counter() - start < 0.8
+    assert [r.status for r in results.values()] == ["cancelled", "cancelled"]
+    assert [r.value for r in results.values()] == ["a", "b"]
@@ -0,0 +1,79 @@
+import duckdb
+import pandas as pd
+import pytest
+
+from src.data.fundamentals import FundamentalsStore
+from src.data.reader import MarketReader, ensure_indexes
+from src.data.writer import TableWriter
+from src.utils.synthetic import SyntheticFMPFetcher, SyntheticPolygonFetcher
+
+
+@pytest.fixture
+def conn():
+    conn = duckdb.connect()
+    poly, fmp = SyntheticPolygonFetcher(0, 20), SyntheticFMPFetcher(0, 4)
+    for symbol in ("AAA", "BBB"):
+        prices = poly.fetch_prices(symbol, "2024-01-01", "2024-12-31").assign(symbol=symbol)
+        news = pd.DataFrame(poly.fetch_news(symbol)).drop(columns=["tickers"]).assign(symbol=symbol)
+        for table, df in (("prices", prices), ("news", news)):
+            conn.register("df", df)
+            exists = conn.execute(
+                "SELECT count(*) FROM information_schema.tables WHERE table_name = ?", [table]
+            ).fetchone()[0]
+            conn.execute(f"INSERT INTO {table} BY NAME SELECT * FROM df" if exists else f"CREATE TABLE {table} AS SELECT * FROM df")
+            conn.unregister("df")
+        FundamentalsStore(conn).save(symbol, fmp.fetch_all(symbol))
+    ensure_indexes(conn)
+    yield conn
+    conn.close()
+
+
+def test_bundle_matches_separate_reads(conn):
+    reader = MarketReader(conn, price_bars=60, news_limit=5, quarters=2)
+    price_df, news, fin = reader.get_bundle("AAA")
+
+    pd.testing.assert_frame_equal(price_df, reader.get_price_data("AAA"), check_dtype=False)
+    assert news == reader.get_news("AAA")
+    assert fin == reader.get_financials("AAA")
+
+
+def test_limits_are_pushed_down(conn):
+    reader = MarketReader(conn)
+    prices = reader.get_price_data("AAA", start="2024-03-01", end="2024-03-31", columns=["close"], limit=5)
+    assert list(prices.columns) == ["date", "close"]
+    assert len(prices) == 5 and prices["date"].is_monotonic_increasing
+    assert prices["date"].iloc[-1] <= pd.Timestamp("2024-03-31")
+
+    news = reader.get_news("AAA", limit=3)
+    assert len(news) == 3
+    assert [n["published_utc"] for n in news] == sorted((n["published_utc"] for n in news), reverse=True)
+    assert all(n["id"].startswith("AAA-") for n in news)
+
+    fin = reader.get_financials("AAA", limit=1)
+    assert len(fin["income_statement"]) == 1
+    assert fin["income_statement"][0]["revenue"] > 0
+
+
+def test_missing_symbol_and_tables(conn):
+    reader = MarketReader(conn)
+    price_df, news, fin = reader.get_bundle("ZZZ")
+    assert price_df.empty and news == [] and fin == {}
+
+    conn.execute("DROP TABLE news")
+    price_df, news, _ = reader.get_bundle("AAA")
+    assert not price_df.empty and news == []
+
+
+def test_legacy_financials_fallback_and_backfill():
+    conn = duckdb.connect()
+    fin = SyntheticFMPFetcher(0, 4).fetch_all("AAA")
+    TableWriter(conn).save_financials("AAA", fin)
+    reader = MarketReader(conn, quarters=2)
+
+    legacy = reader.get_financials("AAA")
+    assert [item["date"] for item in legacy["income_statement"]] == [i["date"] for i in fin["income_statement"][:2]]
+
+    ensure_indexes(conn)
+    assert conn.execute("SELECT count(DISTINCT symbol) FROM fundamentals").fetchone()[0] == 1
+    assert reader.get_financials("AAA") == legacy
+    assert reader.get_bundle("AAA")[2] == legacy
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analysis.technical import MIN_BARS, RSI_LENGTH, SMA_LENGTH, TechnicalAnalyzer
+
+LENGTHS = {"AAA": 400, "BBB": 250, "CCC": MIN_BARS, "DDD": MIN_BARS - 1}
+
+
+def _panel(seed=7):
+    """종목마다 길이가 다르고(최소 봉 수 경계 포함) 행 순서가 섞인 long 포맷 패널"""
+    rng = np.random.default_rng(seed)
+    frames = []
+    for symbol, n in LENGTHS.items():
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+        frames.append(pd.DataFrame({
+            "symbol": symbol,
+            "date": pd.bdate_range("2022-01-03", periods=n),
+            "close": close.round(2),
+        }))
+    return pd.concat(frames, ignore_index=True).sample(frac=1, random_state=seed).reset_index(drop=True)
+
+
+def _single(close: pd.Series) -> dict:
+    """한 종목만 따로 pandas rolling/ewm(Wilder RMA)으로 계산한 마지막 봉의 SMA(20), RSI(14)"""
+    diff = close.diff()
+    alpha = 1.0 / RSI_LENGTH
+    positive = diff.clip(lower=0).ewm(alpha=alpha, min_periods=RSI_LENGTH).mean()
+    negative = diff.clip(upper=0).ewm(alpha=alpha, min_periods=RSI_LENGTH).mean()
+    rsi = 100 * positive / (positive + negative.abs())
+    return {"sma_20": close.rolling(SMA_LENGTH).mean().iloc[-1], "rsi": rsi.iloc[-1]}
+
+
+def test_panel_matches_per_symbol_computation():
+    panel = _panel()
+    result = TechnicalAnalyzer().analyze_panel(panel)
+
+    assert list(result.index) == sorted(LENGTHS)
+    for symbol, bars in panel.groupby("symbol"):
+        bars = bars.sort_values("date")
+        row = result.loc[symbol]
+        assert row["bars"] == LENGTHS[symbol]
+        assert row["close"] == bars["close"].iloc[-1]
+        if LENGTHS[symbol] < MIN_BARS:
+            assert pd.isna(row["rsi"]) and pd.isna(row["trend"])
+            assert row["summary_text"] == "데이터 부족으로 분석 불가"
+            continue
+        ref = _single(bars["close"].reset_index(drop=True))
+        assert row["sma_20"] == pytest.approx(ref["sma_20"], rel=1e-12)
+        assert row["rsi"] == pytest.approx(ref["rsi"], rel=1e-12)
+
+
+def test_panel_matches_analyze_per_symbol():
+    pytest.importorskip("pandas_ta")
+    panel = _panel()
+    analyzer = TechnicalAnalyzer()
+    result = analyzer.analyze_panel(panel)
+
+    for symbol, bars in panel.groupby("symbol"):
+        single = analyzer.analyze(bars.sort_values("date")[["date", "close"]].reset_index(drop=True))
+        row = result.loc[symbol]
+        assert row["summary_text"] == single.get("summary_text", single.get("summary"))
+        if "rsi" in single:
+            assert row["rsi"] == pytest.approx(single["rsi"], rel=1e-9)
+            assert (row["trend"], row["status"]) == (single["trend"], single["status"])
+
+
+def test_empty_panel():
+    result = TechnicalAnalyzer().analyze_panel(pd.DataFrame(columns=["symbol", "date", "close"]))
+    assert result.empty and result.index.name == "symbol"
@@ -0,0 +1,47 @@
+import pytest
+
+from src.utils.ticker_resolver import get_resolver
+
+
+@pytest.fixture(scope="module")
+def resolver():
+    return get_resolver()
+
+
+@pytest.mark.parametrize("query, ticker", [
+    ("애플 분석해줘", "AAPL"),
+    ("애플은 어때?", "AAPL"),
+    ("테슬라랑 비교", "TSLA"),
+    ("엔비디아주가는", "NVDA"),
+    ("AAPL", "AAPL"),
+    ("apple's earnings", "AAPL"),
+    ("인텔 전망", "INTC"),
+    ("마이크로소프트", "MSFT"),
+    # 오타 보정
+    ("에플", "AAPL"),
+    ("aple", "AAPL"),
+    ("테슬러 주가 어때", "TSLA"),
+    ("테슬러는", "TSLA"),
+    ("nvidai stock", "NVDA"),
+])
+def test_resolves(resolver, query, ticker):
+    assert resolver.resolve(query) == ticker
+
+
+@pytest.mark.parametrize("query", [
+    "일본 경제 어때",
+    "nice weather",
+    "what do you like",
+    "beta 값",
+    "마스크 쓰기",
+    "파인애플",
+    "인텔리전스",
+    "nice",
+    "마스크",
+])
+def test_ordinary_words_are_not_tickers(resolver, query):
+    assert resolver.resolve_all(query) == []
+
+
+def test_resolve_all_keeps_order(resolver):
+    assert resolver.resolve_all("애플이랑 테슬라, 그리고 nvidia 비교") == ["AAPL", "TSLA", "NVDA"]